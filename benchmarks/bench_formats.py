@@ -0,0 +1,82 @@
+"""Compare meeting file formats on a synthetic meeting: size, write and read speed.
+
+Every available format and compression is checked for an exact round trip
+(the file reads back equal to what was saved, and its ``meta`` header reads
+back on its own) before it is timed; the script exits with status 1 if any
+combination fails.
+
+Usage:
+    python benchmarks/bench_formats.py [--minutes 180] [--rounds 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from meeting_summarizer import (  # noqa: E402
+    MEETING_COMPRESSIONS, MEETING_FORMATS, compression_available, meeting_extension, read_meeting_file,
+    read_meeting_header, serialize_meeting, write_meeting_file
+)
+from synthetic import synthetic_meeting  # noqa: E402
+
+
+def timed(function, rounds):
+    """Median milliseconds of ``rounds`` calls"""
+    times = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=180, help="length of the synthetic meeting")
+    parser.add_argument("--rounds", type=int, default=5, help="repetitions per measurement")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the generated meeting")
+    args = parser.parse_args()
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as temp_dir:
+        meeting = synthetic_meeting(args.minutes, temp_dir, seed=args.seed)
+        meeting_data = serialize_meeting(meeting, end_time=meeting['start_time'] + timedelta(minutes=args.minutes))
+        print(f"{len(meeting_data['transcript'])} transcript entries, {args.minutes:g} minutes\n")
+        print(f"{'format':<9} {'compression':<12} {'size KB':>9} {'write ms':>9} {'read ms':>8} {'header ms':>10}")
+
+        baseline_size = None
+        for file_format, serializer in MEETING_FORMATS.items():
+            if not serializer.available():
+                print(f"{file_format:<9} (needs {serializer.module})")
+                continue
+            for compression in MEETING_COMPRESSIONS:
+                if not compression_available(compression):
+                    continue
+                filename = os.path.join(temp_dir, "meeting" + meeting_extension(file_format, compression))
+                write_meeting_file(filename, meeting_data, file_format, compression)
+                if read_meeting_file(filename) != meeting_data or read_meeting_header(filename) != meeting_data['meta']:
+                    print(f"{file_format:<9} {compression:<12} ROUND TRIP FAILED")
+                    failures += 1
+                    continue
+
+                size = os.path.getsize(filename)
+                baseline_size = baseline_size or size
+                write_ms = timed(lambda: write_meeting_file(filename, meeting_data, file_format, compression),
+                                 args.rounds)
+                read_ms = timed(lambda: read_meeting_file(filename), args.rounds)
+                header_ms = timed(lambda: read_meeting_header(filename), args.rounds)
+                print(
+                    f"{file_format:<9} {compression:<12} {size / 1024:9.1f} {write_ms:9.2f} {read_ms:8.2f} "
+                    f"{header_ms:10.3f}  ({size / baseline_size:.0%} of JSON)"
+                )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
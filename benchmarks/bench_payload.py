@@ -0,0 +1,73 @@
+"""Compare recognizer payload size and encoding cost at different sample rates.
+
+Generates a speech-like test signal, encodes it the way live transcription
+does (resample, quantize to 16-bit PCM) at each target rate and reports the
+raw PCM and FLAC payload sizes per chunk. With ``--recognize`` each payload is
+also sent to the Google recognizer to measure round-trip latency (needs a
+network connection).
+
+Usage:
+    python benchmarks/bench_payload.py [--seconds 5] [--chunks 10] [--recognize]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import speech_recognition as sr
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from meeting_summarizer import ChunkEncoder  # noqa: E402
+from synthetic import speech_like  # noqa: E402
+
+CAPTURE_RATE = 44100
+TARGET_RATES = [44100, 22050, 16000, 8000]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0, help="chunk length in seconds")
+    parser.add_argument("--chunks", type=int, default=10, help="chunks per setting")
+    parser.add_argument("--recognize", action="store_true", help="also time Google recognition")
+    args = parser.parse_args()
+
+    chunks = [speech_like(args.seconds, CAPTURE_RATE, seed) for seed in range(args.chunks)]
+    recognizer = sr.Recognizer()
+
+    print(f"{'rate':>6} {'pcm KB':>8} {'flac KB':>8} {'encode ms':>10} {'recognize ms':>13}")
+    for rate in TARGET_RATES:
+        encoder = ChunkEncoder(CAPTURE_RATE, rate)
+        encoder.encode(chunks[0])  # warm up: the first resample imports scipy.signal
+        pcm_sizes, flac_sizes, encode_ms, recognize_ms = [], [], [], []
+        for chunk in chunks:
+            started = time.perf_counter()
+            audio = encoder.encode(chunk)
+            encode_ms.append((time.perf_counter() - started) * 1000)
+            pcm_sizes.append(len(audio.frame_data))
+            flac_sizes.append(len(audio.get_flac_data()))
+
+            if args.recognize:
+                started = time.perf_counter()
+                try:
+                    recognizer.recognize_google(audio)
+                except sr.UnknownValueError:
+                    pass
+                except sr.RequestError as e:
+                    print(f"Speech recognition error: {e}")
+                    return 1
+                recognize_ms.append((time.perf_counter() - started) * 1000)
+
+        recognize = f"{statistics.median(recognize_ms):13.0f}" if recognize_ms else f"{'-':>13}"
+        print(
+            f"{rate:>6} {statistics.mean(pcm_sizes) / 1024:8.1f} "
+            f"{statistics.mean(flac_sizes) / 1024:8.1f} "
+            f"{statistics.median(encode_ms):10.2f} {recognize}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
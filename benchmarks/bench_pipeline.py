@@ -0,0 +1,472 @@
+"""Benchmark the transcription and persistence hot paths, offline.
+
+Drives the app's own code with generated input: the audio callback and
+chunking on synthetic conversation audio, live transcription through the
+worker pool with a stub recognizer, summaries through the OpenAI client
+against a stub server on localhost, saving and loading synthetic meetings
+(and streaming the start of a legacy one), and screenshot preview decoding.
+Each benchmark runs in a fresh process and reports throughput, p50/p99
+latency and peak RSS.
+
+Results can be saved as a baseline and later runs compared against it; the
+comparison exits with status 1 when a metric got worse by more than the
+threshold, so it can gate CI.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--only capture,save_meeting] [--quick]
+    python benchmarks/bench_pipeline.py --save-baseline main
+    python benchmarks/bench_pipeline.py --compare main [--threshold 10]
+"""
+
+import argparse
+import base64
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from meeting_summarizer import (  # noqa: E402
+    MEETING_COMPRESSIONS, MEETING_FORMATS, SUMMARY_SYSTEM_PROMPT, AudioRingBuffer, ChunkDispatcher, ChunkEncoder,
+    AssetStore, Image, SummaryClient, TranscriptionWorkerPool, create_segmenter, format_transcript,
+    iter_meeting_file, load_preview, meeting_extension, openai, read_meeting_file, read_meeting_header,
+    serialize_meeting, signal, sr, write_meeting_file
+)
+from stubs import StubOpenAIServer, StubRecognizerBackend  # noqa: E402
+from synthetic import conversation, synthetic_meeting  # noqa: E402
+
+BASELINES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+CAPTURE_RATE = 44100
+CAPTURE_BLOCK = 1024  # frames per sounddevice callback
+
+# Which way is better for each compared metric
+HIGHER_IS_BETTER = {'throughput': True, 'p50_ms': False, 'p99_ms': False, 'peak_rss_mb': False}
+
+
+def elapsed_ms(started):
+    return (time.perf_counter() - started) * 1000
+
+
+def bench_capture(args):
+    """Audio callback: ring buffer write plus chunk dispatch, per capture block"""
+    audio = conversation(args.audio_seconds, CAPTURE_RATE, seed=args.seed).reshape(-1, 1)
+    buffer = AudioRingBuffer(CAPTURE_RATE * 60)
+    dispatcher = ChunkDispatcher(buffer, create_segmenter(CAPTURE_RATE))
+
+    def drain():
+        while dispatcher.get() is not None:
+            pass
+
+    drainer = threading.Thread(target=drain)
+    drainer.start()
+    latencies = []
+    started = time.perf_counter()
+    for offset in range(0, len(audio), CAPTURE_BLOCK):
+        indata = audio[offset:offset + CAPTURE_BLOCK]
+        block_started = time.perf_counter()
+        buffer.write(indata[:, 0])
+        dispatcher.notify()
+        latencies.append(elapsed_ms(block_started))
+    wall = time.perf_counter() - started
+    dispatcher.close()
+    drainer.join()
+    return {
+        'throughput': args.audio_seconds / wall,
+        'unit': "x realtime",
+        'latencies': latencies,
+        'chunks': dispatcher.dispatched,
+        'dropped': dispatcher.dropped,
+    }
+
+
+def bench_transcription(args):
+    """Live transcription: capture paced at ``--speed``, chunking, encoding, stub recognizer.
+
+    Latency is the transcript lag, from a chunk being cut to its text being
+    released in order.
+    """
+    audio = conversation(args.audio_seconds, CAPTURE_RATE, seed=args.seed)
+    backend = StubRecognizerBackend(latency=args.recognizer_ms / 1000)
+    encoder = ChunkEncoder(CAPTURE_RATE, backend.sample_rate)
+    buffer = AudioRingBuffer(CAPTURE_RATE * 60)
+    dispatcher = ChunkDispatcher(buffer, create_segmenter(CAPTURE_RATE))
+    backend.recognize(encoder.encode(np.zeros(CAPTURE_RATE, dtype=np.float32)))  # warm up the filter
+    lags = []
+
+    def on_result(chunk, result):
+        lags.append((time.monotonic() - chunk.enqueued_at) * 1000)
+
+    pool = TranscriptionWorkerPool(lambda samples: backend.recognize(encoder.encode(samples)), on_result)
+
+    def transcribe_loop():
+        pool.start()
+        while True:
+            chunk = dispatcher.get()
+            if chunk is None:
+                break
+            pool.submit(chunk, buffer.read(chunk.start, chunk.stop))
+        pool.shutdown()
+
+    transcriber = threading.Thread(target=transcribe_loop)
+    transcriber.start()
+    block_seconds = CAPTURE_BLOCK / CAPTURE_RATE / args.speed
+    started = time.perf_counter()
+    for n, offset in enumerate(range(0, len(audio), CAPTURE_BLOCK)):
+        buffer.write(audio[offset:offset + CAPTURE_BLOCK])
+        dispatcher.notify()
+        # Pace like a sound card running ``speed`` times faster than real time
+        delay = started + (n + 1) * block_seconds - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    dispatcher.close()
+    transcriber.join()
+    wall = time.perf_counter() - started
+    return {
+        'throughput': len(lags) / wall,
+        'unit': "chunks/s",
+        'latencies': lags,
+        'chunks': len(lags),
+        'dropped': dispatcher.dropped,
+        'failed': pool.stats()['failed'],
+    }
+
+
+def summary_requests(args):
+    """Prompts the size of the rolling summarizer's windows"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        transcript = synthetic_meeting(args.requests * 40 * 5 / 60, temp_dir, seed=args.seed)['transcript']
+    return [
+        [
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": f"Please summarize this meeting transcript:\n\n"
+                                        f"{format_transcript(transcript[start:start + 40])}"}
+        ]
+        for start in range(0, len(transcript), 40)
+    ]
+
+
+def bench_summary(args):
+    """Summary requests through the OpenAI client against the stub server"""
+    requests = summary_requests(args)
+    latencies = []
+    with StubOpenAIServer(delay=args.openai_delay_ms / 1000):
+        client = SummaryClient("sk-benchmark")
+        # The first request connects and builds the client
+        client.chat_completion(requests[0], max_tokens=300)
+        started = time.perf_counter()
+        for messages in requests:
+            request_started = time.perf_counter()
+            client.chat_completion(messages, max_tokens=300)
+            latencies.append(elapsed_ms(request_started))
+        wall = time.perf_counter() - started
+    return {'throughput': len(requests) / wall, 'unit': "requests/s", 'latencies': latencies}
+
+
+def bench_summary_stream(args):
+    """Streamed summaries, timed until the full reply has been handed over"""
+    requests = summary_requests(args)
+    latencies = []
+    with StubOpenAIServer(delay=args.openai_delay_ms / 1000):
+        client = SummaryClient("sk-benchmark")
+        # The first request connects and builds the client
+        client.stream_chat_completion(requests[0], max_tokens=300, on_text=lambda text: None)
+        started = time.perf_counter()
+        for messages in requests:
+            request_started = time.perf_counter()
+            client.stream_chat_completion(messages, max_tokens=300, on_text=lambda text: None)
+            latencies.append(elapsed_ms(request_started))
+        wall = time.perf_counter() - started
+    return {'throughput': len(requests) / wall, 'unit': "requests/s", 'latencies': latencies}
+
+
+def bench_save_meeting(args):
+    """Serializing and writing a synthetic meeting, as Save does"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        meeting = synthetic_meeting(args.meeting_minutes, temp_dir, screenshots=args.screenshots, seed=args.seed)
+        end_time = meeting['start_time'] + timedelta(minutes=args.meeting_minutes)
+        filename = os.path.join(temp_dir, "meeting" + meeting_extension(args.format, args.compression))
+        latencies = []
+        for _ in range(args.rounds):
+            started = time.perf_counter()
+            write_meeting_file(filename, serialize_meeting(meeting, end_time=end_time), args.format, args.compression)
+            latencies.append(elapsed_ms(started))
+        size = os.path.getsize(filename)
+    return {
+        'throughput': size / 1e6 / (sum(latencies) / 1000 / len(latencies)),
+        'unit': "MB/s",
+        'latencies': latencies,
+        'file_mb': round(size / 1e6, 2),
+    }
+
+
+def bench_load_meeting(args):
+    """Parsing a saved synthetic meeting, as Load does"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        meeting = synthetic_meeting(args.meeting_minutes, temp_dir, screenshots=args.screenshots, seed=args.seed)
+        end_time = meeting['start_time'] + timedelta(minutes=args.meeting_minutes)
+        filename = os.path.join(temp_dir, "meeting" + meeting_extension(args.format, args.compression))
+        write_meeting_file(filename, serialize_meeting(meeting, end_time=end_time), args.format, args.compression)
+        size = os.path.getsize(filename)
+        latencies = []
+        for _ in range(args.rounds):
+            started = time.perf_counter()
+            read_meeting_file(filename)
+            latencies.append(elapsed_ms(started))
+    return {
+        'throughput': size / 1e6 / (sum(latencies) / 1000 / len(latencies)),
+        'unit': "MB/s",
+        'latencies': latencies,
+        'file_mb': round(size / 1e6, 2),
+    }
+
+
+def bench_first_content(args):
+    """Time until the first transcript entries of a legacy meeting file (inline images) are read"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        meeting = synthetic_meeting(args.meeting_minutes, temp_dir, screenshots=args.screenshots, seed=args.seed)
+        end_time = meeting['start_time'] + timedelta(minutes=args.meeting_minutes)
+        meeting_data = serialize_meeting(meeting, end_time=end_time)
+        store = AssetStore(temp_dir)
+        for entry in meeting_data['screenshots']:
+            entry['image'] = base64.b64encode(store.read(entry.pop('ref'))).decode('ascii')
+        filename = os.path.join(temp_dir, "legacy.json")
+        write_meeting_file(filename, meeting_data, 'json', 'none')
+        latencies, full_load = [], []
+        for _ in range(args.rounds):
+            started = time.perf_counter()
+            first = None
+            for key, value in iter_meeting_file(filename):
+                if key == 'transcript' and first is None:
+                    first = elapsed_ms(started)
+            latencies.append(first)
+            full_load.append(elapsed_ms(started))
+        size = os.path.getsize(filename)
+    return {
+        'throughput': len(latencies) / (sum(latencies) / 1000),
+        'unit': "files/s",
+        'latencies': latencies,
+        'file_mb': round(size / 1e6, 2),
+        'full_load_ms': round(float(np.median(full_load)), 2),
+    }
+
+
+def bench_meeting_header(args):
+    """Reading only the ``meta`` header of a saved meeting, as the library does"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        meeting = synthetic_meeting(args.meeting_minutes, temp_dir, seed=args.seed)
+        end_time = meeting['start_time'] + timedelta(minutes=args.meeting_minutes)
+        filename = os.path.join(temp_dir, "meeting" + meeting_extension(args.format, args.compression))
+        write_meeting_file(filename, serialize_meeting(meeting, end_time=end_time), args.format, args.compression)
+        latencies = []
+        started = time.perf_counter()
+        for _ in range(args.rounds * 100):
+            header_started = time.perf_counter()
+            read_meeting_header(filename)
+            latencies.append(elapsed_ms(header_started))
+        wall = time.perf_counter() - started
+    return {'throughput': len(latencies) / wall, 'unit': "files/s", 'latencies': latencies}
+
+
+def preview_benchmark(args, thumbnails):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        screenshots = synthetic_meeting(
+            1, temp_dir, screenshots=args.screenshots, seed=args.seed, thumbnails=thumbnails
+        )['screenshots']
+        latencies = []
+        started = time.perf_counter()
+        for entry in screenshots:
+            preview_started = time.perf_counter()
+            load_preview(dict(entry), temp_dir)
+            latencies.append(elapsed_ms(preview_started))
+        wall = time.perf_counter() - started
+    return {'throughput': len(latencies) / wall, 'unit': "images/s", 'latencies': latencies}
+
+
+def bench_preview_cold(args):
+    """Screenshot viewer previews built from the full-size PNG"""
+    return preview_benchmark(args, thumbnails=False)
+
+
+def bench_preview_warm(args):
+    """Screenshot viewer previews decoded from stored thumbnails"""
+    return preview_benchmark(args, thumbnails=True)
+
+
+BENCHMARKS = {
+    'capture': bench_capture,
+    'transcription': bench_transcription,
+    'summary': bench_summary,
+    'summary_stream': bench_summary_stream,
+    'save_meeting': bench_save_meeting,
+    'load_meeting': bench_load_meeting,
+    'first_content': bench_first_content,
+    'meeting_header': bench_meeting_header,
+    'preview_cold': bench_preview_cold,
+    'preview_warm': bench_preview_warm,
+}
+
+# Arguments that change what is measured; a baseline is only comparable with the same ones
+SETTINGS = ('seed', 'audio_seconds', 'speed', 'recognizer_ms', 'openai_delay_ms',
+            'requests', 'meeting_minutes', 'screenshots', 'rounds', 'format', 'compression')
+
+
+def run_benchmark(name, args):
+    """Run one benchmark and summarize it (in its own process)"""
+    # The app loads these in the background after startup; never time their import
+    for module in (sr, openai, signal, Image):
+        module.load_module()
+    result = BENCHMARKS[name](args)
+    latencies = np.asarray(result.pop('latencies'), dtype=np.float64)
+    return {
+        'throughput': result.pop('throughput'),
+        'unit': result.pop('unit'),
+        'p50_ms': float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+        'p99_ms': float(np.percentile(latencies, 99)) if len(latencies) else 0.0,
+        # ru_maxrss is in kilobytes on Linux
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'samples': len(latencies),
+        **result,
+    }
+
+
+def run_all(names, args):
+    """Results of each benchmark, every one in a fresh interpreter so peak RSS is its own"""
+    results = {}
+    context = multiprocessing.get_context('spawn')
+    for name in names:
+        print(f"Running {name}...", file=sys.stderr)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results[name] = pool.submit(run_benchmark, name, args).result()
+    return results
+
+
+def print_results(results):
+    print(f"{'benchmark':<16} {'throughput':>12} {'unit':<11} {'p50 ms':>9} {'p99 ms':>9} {'peak RSS MB':>12}  notes")
+    for name, result in results.items():
+        notes = ", ".join(f"{key}={value}" for key, value in result.items()
+                          if key not in HIGHER_IS_BETTER and key != 'unit')
+        print(
+            f"{name:<16} {result['throughput']:12.2f} {result['unit']:<11} {result['p50_ms']:9.2f} "
+            f"{result['p99_ms']:9.2f} {result['peak_rss_mb']:12.1f}  {notes}"
+        )
+
+
+def baseline_path(name):
+    """Baselines given by name live in ``benchmarks/baselines/``"""
+    if os.sep in name or name.endswith(".json"):
+        return name
+    return os.path.join(BASELINES_DIR, f"{name}.json")
+
+
+def machine_info():
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def save_baseline(path, results, args):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    baseline = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'machine': machine_info(),
+        'settings': {key: getattr(args, key) for key in SETTINGS},
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2)
+    print(f"Baseline saved to {path}")
+
+
+def compare(path, results, args):
+    """Print the change of every metric against a baseline; returns the regressions"""
+    with open(path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    settings = {key: getattr(args, key) for key in SETTINGS}
+    if baseline.get('settings') != settings:
+        print("Warning: baseline was recorded with different settings, numbers are not comparable")
+    if baseline.get('machine') != machine_info():
+        print(f"Warning: baseline was recorded on {baseline.get('machine')}")
+
+    print(f"\nCompared with {path} ({baseline.get('created')}), threshold {args.threshold:g}%")
+    print(f"{'benchmark':<16} {'metric':<12} {'baseline':>10} {'current':>10} {'change':>9}")
+    regressions = []
+    for name, result in results.items():
+        before = baseline['results'].get(name)
+        if before is None:
+            print(f"{name:<16} (not in baseline)")
+            continue
+        for metric, higher_is_better in HIGHER_IS_BETTER.items():
+            old, new = before[metric], result[metric]
+            change = (new - old) / old * 100 if old else 0.0
+            worse = -change if higher_is_better else change
+            verdict = ""
+            if metric.endswith("_ms") and abs(new - old) < args.min_delta_ms:
+                pass  # timer noise on sub-millisecond paths
+            elif worse > args.threshold:
+                verdict = "REGRESSION"
+                regressions.append((name, metric))
+            elif worse < -args.threshold:
+                verdict = "improved"
+            print(f"{name:<16} {metric:<12} {old:10.2f} {new:10.2f} {change:+8.1f}%  {verdict}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", help="comma-separated benchmarks to run: " + ", ".join(BENCHMARKS))
+    parser.add_argument("--quick", action="store_true", help="smaller inputs for a fast smoke run")
+    parser.add_argument("--seed", type=int, default=0, help="seed for all generated input")
+    parser.add_argument("--audio-seconds", type=float, default=600, help="audio per capture/transcription run")
+    parser.add_argument("--speed", type=float, default=20, help="capture pace for transcription, x real time")
+    parser.add_argument("--recognizer-ms", type=float, default=50, help="stub recognizer latency per chunk")
+    parser.add_argument("--openai-delay-ms", type=float, default=20, help="stub OpenAI server latency")
+    parser.add_argument("--requests", type=int, default=50, help="summary requests per run")
+    parser.add_argument("--meeting-minutes", type=float, default=180, help="length of the synthetic meeting")
+    parser.add_argument("--screenshots", type=int, default=30, help="screenshots in the synthetic meeting")
+    parser.add_argument("--rounds", type=int, default=5, help="repetitions of save/load")
+    parser.add_argument("--format", choices=sorted(MEETING_FORMATS), default="json",
+                        help="meeting file format for save/load")
+    parser.add_argument("--compression", choices=sorted(MEETING_COMPRESSIONS), default="none",
+                        help="meeting file compression for save/load")
+    parser.add_argument("--save-baseline", metavar="NAME", help="save results as a baseline (name or path)")
+    parser.add_argument("--compare", metavar="NAME", help="compare results with a saved baseline")
+    parser.add_argument("--threshold", type=float, default=10, help="regression threshold in percent")
+    parser.add_argument("--min-delta-ms", type=float, default=0.1,
+                        help="ignore latency changes smaller than this")
+    args = parser.parse_args()
+
+    if args.quick:
+        args.audio_seconds, args.requests, args.meeting_minutes = 120, 10, 60
+        args.screenshots, args.rounds = 8, 3
+    names = args.only.split(",") if args.only else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark: {', '.join(unknown)}")
+
+    results = run_all(names, args)
+    print_results(results)
+    if args.save_baseline:
+        save_baseline(baseline_path(args.save_baseline), results, args)
+    if args.compare:
+        regressions = compare(baseline_path(args.compare), results, args)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:g}%")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Offline stand-ins for the network services the app talks to.
+
+``StubRecognizerBackend`` answers like a recognizer engine after a fixed
+delay, and ``StubOpenAIServer`` serves the chat completions endpoint on
+localhost (plain and streamed), so the real OpenAI client can be used
+without a network connection or an API key.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from meeting_summarizer import RecognizerBackend  # noqa: E402
+
+STUB_REPLY = (
+    "Key points: the release ships on Friday and the budget review stays open. "
+    "Action items: follow up with sales on pricing, schedule the export design review. "
+    "Decisions: hiring for the data team is approved."
+)
+
+
+class StubRecognizerBackend(RecognizerBackend):
+    """Recognizer that takes ``latency`` seconds and returns one word per second of audio"""
+
+    name = 'stub'
+    label = 'Stub recognizer (benchmarks)'
+    offline = True
+
+    def __init__(self, latency=0.05):
+        super().__init__()
+        self.latency = latency
+
+    def _recognize(self, audio_data):
+        time.sleep(self.latency)
+        seconds = len(audio_data.frame_data) / (audio_data.sample_rate * audio_data.sample_width)
+        return " ".join(["word"] * max(1, int(seconds))), 0.9
+
+
+class _ChatCompletionsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b"{}")
+        if not self.path.endswith("/chat/completions"):
+            self.send_error(404)
+            return
+        time.sleep(self.server.delay)
+        if request.get('stream'):
+            self.stream_reply(request)
+        else:
+            self.send_json(request)
+
+    def send_json(self, request):
+        body = json.dumps({
+            'id': "chatcmpl-stub",
+            'object': "chat.completion",
+            'created': int(time.time()),
+            'model': request.get('model', "stub"),
+            'choices': [{
+                'index': 0,
+                'message': {'role': "assistant", 'content': STUB_REPLY},
+                'finish_reason': "stop",
+            }],
+            'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0},
+        }).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', "application/json")
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def stream_reply(self, request):
+        self.send_response(200)
+        self.send_header('Content-Type', "text/event-stream")
+        self.send_header('Connection', "close")
+        self.end_headers()
+        for word in STUB_REPLY.split(" "):
+            chunk = {
+                'id': "chatcmpl-stub",
+                'object': "chat.completion.chunk",
+                'created': int(time.time()),
+                'model': request.get('model', "stub"),
+                'choices': [{'index': 0, 'delta': {'content': word + " "}, 'finish_reason': None}],
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode('utf-8'))
+            time.sleep(self.server.token_delay)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubOpenAIServer:
+    """Chat completions endpoint on localhost; use as a context manager.
+
+    ``delay`` is the time to first byte of every reply and ``token_delay`` the
+    gap between streamed words. While it runs, ``OPENAI_BASE_URL`` points the
+    OpenAI client at it.
+    """
+
+    def __init__(self, delay=0.02, token_delay=0.0):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatCompletionsHandler)
+        self.server.daemon_threads = True
+        self.server.delay = delay
+        self.server.token_delay = token_delay
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+
+    def __enter__(self):
+        self.thread.start()
+        self.saved_env = {name: os.environ.get(name) for name in ('OPENAI_BASE_URL', 'NO_PROXY')}
+        os.environ['OPENAI_BASE_URL'] = self.base_url
+        os.environ['NO_PROXY'] = "127.0.0.1,localhost"
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+        for name, value in self.saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
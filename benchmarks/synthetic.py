@@ -0,0 +1,142 @@
+"""Deterministic test data for the benchmarks: audio signals, meetings and screenshots.
+
+Everything is generated from a seed, so two runs on the same machine see
+exactly the same input.
+"""
+
+import io
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from meeting_summarizer import AssetStore, make_thumbnail  # noqa: E402
+
+WORDS = (
+    "we need to ship the release by friday and the budget review is still open "
+    "action item for the team follow up with sales about the new pricing model "
+    "the customer asked for an export feature so let us schedule a design review "
+    "next week risks include the migration timeline and hiring for the data team"
+).split()
+
+
+def sine(seconds, sample_rate, frequency=440.0, amplitude=0.3):
+    """Pure tone"""
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def noise(seconds, sample_rate, amplitude=0.05, seed=0):
+    """White noise"""
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(int(seconds * sample_rate)) * amplitude).astype(np.float32)
+
+
+def speech_like(seconds, sample_rate, seed=0):
+    """Voiced harmonics with a wandering pitch, syllable envelope and breath noise"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    pitch = 140 + 30 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 12))
+    envelope = np.clip(np.sin(2 * np.pi * 3.5 * t), 0, None) ** 0.5
+    noise = rng.standard_normal(len(t)) * 0.02
+    return (0.2 * voiced * envelope + noise).astype(np.float32)
+
+
+def conversation(seconds, sample_rate, seed=0):
+    """Speech-like utterances of 2-9 s separated by 0.5-2 s of quiet room noise"""
+    rng = np.random.default_rng(seed)
+    total = int(seconds * sample_rate)
+    parts, length = [], 0
+    while length < total:
+        utterance = speech_like(rng.uniform(2, 9), sample_rate, seed=int(rng.integers(1 << 31)))
+        pause = noise(rng.uniform(0.5, 2), sample_rate, amplitude=0.002, seed=int(rng.integers(1 << 31)))
+        parts += [utterance, pause]
+        length += len(utterance) + len(pause)
+    return np.concatenate(parts)[:total]
+
+
+def sentence(rng, words=(8, 30)):
+    """Random sentence made of meeting vocabulary"""
+    return " ".join(rng.choice(WORDS, size=int(rng.integers(*words)))).capitalize() + "."
+
+
+def slide_image(seed, size=(1920, 1080)):
+    """Presentation-like screenshot: a title bar, text lines and a chart"""
+    rng = np.random.default_rng(seed)
+    image = Image.new("RGB", size, tuple(int(c) for c in rng.integers(200, 256, 3)))
+    draw = ImageDraw.Draw(image)
+    width, height = size
+    draw.rectangle([0, 0, width, height // 8], fill=tuple(int(c) for c in rng.integers(0, 120, 3)))
+    for line in range(int(rng.integers(4, 10))):
+        top = height // 6 + line * 48
+        draw.rectangle([80, top, 80 + int(rng.integers(300, width // 2)), top + 20], fill=(60, 60, 60))
+    for bar in range(6):
+        bar_height = int(rng.integers(50, height // 3))
+        left = width // 2 + 100 + bar * 120
+        draw.rectangle([left, height - 100 - bar_height, left + 80, height - 100],
+                       fill=tuple(int(c) for c in rng.integers(0, 256, 3)))
+    return image
+
+
+def synthetic_meeting(minutes, base_dir, screenshots=0, seed=0, thumbnails=False):
+    """Meeting dict in the app's in-memory form, with screenshots stored in ``base_dir``.
+
+    One transcript entry about every 5 seconds, a note every 2 minutes and
+    partial summaries every 40 entries, like a real recorded meeting.
+    """
+    rng = np.random.default_rng(seed)
+    start_time = datetime(2024, 1, 1, 10, 0, 0)
+    entries = int(minutes * 60 / 5)
+
+    transcript = []
+    for n in range(entries):
+        transcript.append({
+            'timestamp': (start_time + timedelta(seconds=n * 5)).strftime("%H:%M:%S"),
+            'text': sentence(rng),
+            'confidence': round(float(rng.uniform(0.6, 1.0)), 3),
+            'audio_offset': n * 5 * 16000,
+            'audio_length': 4 * 16000,
+        })
+    notes = [
+        {'timestamp': (start_time + timedelta(minutes=n * 2)).strftime("%H:%M:%S"), 'text': sentence(rng)}
+        for n in range(max(1, int(minutes / 2)))
+    ]
+    partial_summaries = [
+        {'level': 0, 'start': start, 'end': min(start + 40, entries),
+         'summary': " ".join(sentence(rng) for _ in range(4))}
+        for start in range(0, entries, 40)
+    ]
+
+    store = AssetStore(base_dir)
+    shots = []
+    for n in range(screenshots):
+        buffer = io.BytesIO()
+        image = slide_image(seed * 1000 + n)
+        image.save(buffer, format='PNG')
+        ref, digest = store.put(buffer.getvalue(), 'png')
+        entry = {
+            'timestamp': (start_time + timedelta(minutes=n)).strftime("%H:%M:%S"),
+            'filename': f"screenshot_{n}.png",
+            'ref': ref,
+            'sha256': digest,
+        }
+        if thumbnails:
+            entry['thumbnail'], _ = store.put(make_thumbnail(image), 'jpg')
+        shots.append(entry)
+
+    return {
+        'title': f"Synthetic meeting {seed}",
+        'start_time': start_time,
+        'transcript': transcript,
+        'summary': "\n".join(sentence(rng) for _ in range(12)),
+        'partial_summaries': partial_summaries,
+        'notes': notes,
+        'screenshots': shots,
+        'recording': {'file': "recordings/recording_20240101_100000.wav", 'sample_rate': 16000},
+    }
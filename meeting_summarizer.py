@@ -1,40 +1,3035 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-import customtkinter as ctk
-import threading
 import time
-import json
-import os
-from datetime import datetime
-import speech_recognition as sr
-import openai
-from dotenv import load_dotenv
-import sounddevice as sd
-import numpy as np
-import scipy.io.wavfile as wav
-from PIL import Image, ImageTk, ImageGrab
-import io
-import base64
+_import_started = time.perf_counter()  # for --profile-startup, so the imports below are timed too
+import threading  # noqa: E402
+import queue  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import sys  # noqa: E402
+import argparse  # noqa: E402
+import importlib.util  # noqa: E402
+from collections import namedtuple, OrderedDict  # noqa: E402
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait as wait_futures  # noqa: E402
+from datetime import datetime, timedelta  # noqa: E402
+from dotenv import load_dotenv, set_key  # noqa: E402
+import numpy as np  # noqa: E402
+from math import gcd  # noqa: E402
+import io  # noqa: E402
+import base64  # noqa: E402
+import hashlib  # noqa: E402
+import sqlite3  # noqa: E402
+import shutil  # noqa: E402
+import wave  # noqa: E402
+import gzip  # noqa: E402
+import re  # noqa: E402
+import bisect  # noqa: E402
 
 # Load environment variables
 load_dotenv()
 
+class StartupProfile:
+    """Wall-clock cost of each startup phase, reported by ``--profile-startup``"""
+
+    def __init__(self, started):
+        self.started = started
+        self.last = started
+        self.lock = threading.Lock()
+        self.phases = []  # (phase, ms) in order
+        self.imports = []  # (module, ms, thread name) of deferred imports
+
+    def mark(self, phase):
+        """Record the time since the previous mark as ``phase``"""
+        now = time.perf_counter()
+        with self.lock:
+            self.phases.append((phase, (now - self.last) * 1000))
+            self.last = now
+
+    def record_import(self, name, ms):
+        with self.lock:
+            self.imports.append((name, ms, threading.current_thread().name))
+
+    def report(self):
+        with self.lock:
+            lines = ["Startup phases (ms):"]
+            lines += [f"  {phase:<28}{ms:9.1f}" for phase, ms in self.phases]
+            lines.append(f"  {'total':<28}{sum(ms for _, ms in self.phases):9.1f}")
+            lines.append("Deferred imports (ms):")
+            lines += [f"  {name:<28}{ms:9.1f}  ({thread})" for name, ms, thread in self.imports]
+        return "\n".join(lines)
+
+
+STARTUP_PROFILE = StartupProfile(_import_started)
+STARTUP_PROFILE.mark("eager imports")
+
+
+class LatencyHistogram:
+    """Latency counts in fixed buckets, cheap enough to record on every call"""
+
+    BOUNDS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS_MS) + 1)  # last one is +Inf
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms):
+        self.counts[bisect.bisect_left(self.BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the ``q`` quantile"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.BOUNDS_MS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+
+class Telemetry:
+    """Per-stage latency histograms and event counters for the whole pipeline.
+
+    Stages record with ``observe`` or the ``timer`` context manager from any
+    thread; one uncontended lock and a bisect per observation keep it cheap
+    enough to leave on. ``prometheus_text`` renders everything, plus the
+    gauges returned by ``gauges()``, in the Prometheus text format.
+    """
+
+    PREFIX = "meeting_summarizer"
+    BOUNDS = tuple(f"{bound / 1000:g}" for bound in LatencyHistogram.BOUNDS_MS)  # le labels, seconds
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histograms = {}
+        self.counters = {}
+        self.gauges = lambda: {}  # {component: {stat: number}}
+
+    def observe(self, stage, ms):
+        with self.lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = LatencyHistogram()
+            histogram.observe(ms)
+
+    def timer(self, stage):
+        return _StageTimer(self, stage)
+
+    def increment(self, event, amount=1):
+        with self.lock:
+            self.counters[event] = self.counters.get(event, 0) + amount
+
+    def summary(self):
+        """``{stage: {count, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}}`` and the counters"""
+        with self.lock:
+            stages = {
+                stage: {
+                    'count': histogram.count,
+                    'mean_ms': histogram.total_ms / histogram.count if histogram.count else 0.0,
+                    'p50_ms': histogram.quantile(0.5),
+                    'p95_ms': histogram.quantile(0.95),
+                    'p99_ms': histogram.quantile(0.99),
+                    'max_ms': histogram.max_ms,
+                }
+                for stage, histogram in sorted(self.histograms.items())
+            }
+            return stages, dict(sorted(self.counters.items()))
+
+    def prometheus_text(self):
+        name = f"{self.PREFIX}_stage_latency_seconds"
+        lines = [f"# HELP {name} Time spent per pipeline stage.", f"# TYPE {name} histogram"]
+        with self.lock:
+            for stage, histogram in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, count in zip(self.BOUNDS + ("+Inf",), histogram.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.total_ms / 1000:.6f}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+
+            name = f"{self.PREFIX}_events_total"
+            lines += [f"# HELP {name} Pipeline events.", f"# TYPE {name} counter"]
+            lines += [f'{name}{{event="{event}"}} {value}' for event, value in sorted(self.counters.items())]
+
+        name = f"{self.PREFIX}_component"
+        lines += [f"# HELP {name} Current counters of pipeline components.", f"# TYPE {name} gauge"]
+        for component, stats in sorted(self.gauges().items()):
+            for stat, value in sorted(stats.items()):
+                if isinstance(value, (int, float)):
+                    lines.append(f'{name}{{component="{component}",stat="{stat}"}} {float(value):g}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Write the metrics file atomically, for a Prometheus textfile collector"""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus_text())
+        os.replace(temp_path, path)
+
+
+class _StageTimer:
+    __slots__ = ('telemetry', 'stage', 'started')
+
+    def __init__(self, telemetry, stage):
+        self.telemetry = telemetry
+        self.stage = stage
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.telemetry.observe(self.stage, (time.perf_counter() - self.started) * 1000)
+        return False
+
+
+TELEMETRY = Telemetry()
+METRICS_FILENAME = "metrics.prom"
+
+
+class LazyModule:
+    """Stands in for a module and imports it on first attribute access"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def load_module(self):
+        if self._module is None:
+            started = time.perf_counter()
+            module = importlib.import_module(self._name)
+            STARTUP_PROFILE.record_import(self._name, (time.perf_counter() - started) * 1000)
+            self._module = module
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self.load_module(), attr)
+
+
+# Heavy modules are imported on first use, or by a background thread once
+# the window is up, so that the app starts quickly
+sr = LazyModule('speech_recognition')
+openai = LazyModule('openai')
+sd = LazyModule('sounddevice')
+wav = LazyModule('scipy.io.wavfile')
+signal = LazyModule('scipy.signal')
+Image = LazyModule('PIL.Image')
+ImageTk = LazyModule('PIL.ImageTk')
+ImageGrab = LazyModule('PIL.ImageGrab')
+DEFERRED_MODULES = (sr, openai, sd, wav, signal, Image, ImageTk, ImageGrab)
+
+# The GUI toolkit is imported only when the window is opened, so batch mode
+# and reindexing run on machines without a display or Tk
+tk = LazyModule('tkinter')
+ttk = LazyModule('tkinter.ttk')
+messagebox = LazyModule('tkinter.messagebox')
+filedialog = LazyModule('tkinter.filedialog')
+ctk = LazyModule('customtkinter')
+GUI_MODULES = (tk, ttk, messagebox, filedialog, ctk)
+
+# Optional, for the faster and smaller meeting file formats
+orjson = LazyModule('orjson')
+msgpack = LazyModule('msgpack')
+zstandard = LazyModule('zstandard')
+
+# Optional, for the offline Whisper engine
+whisper = LazyModule('whisper')
+
+
+class AudioRingBuffer:
+    """Fixed-capacity ring buffer for captured audio samples.
+
+    Written by a single producer (the sounddevice callback) and read by
+    consumers without locking. Positions are absolute sample counts since the
+    buffer was reset: the producer first announces the end of the write in
+    ``reserved_pos`` and only advances ``write_pos`` after the samples are in
+    place, and readers check afterwards that the range they used has not been
+    overwritten. Memory is bounded by ``capacity`` no matter how long the
+    meeting runs.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = int(capacity)
+        self.buffer = np.zeros(self.capacity, dtype=np.float32)
+        self.reset()
+
+    def reset(self):
+        """Forget all samples and zero the counters"""
+        self.write_pos = 0
+        self.reserved_pos = 0
+        self.overruns = 0
+        self.overrun_samples = 0
+        self.input_overflows = 0
+
+    def write(self, samples):
+        """Append a block of samples (producer side)"""
+        n = len(samples)
+        if n == 0:
+            return
+        pos = self.write_pos
+        if n > self.capacity:
+            # Only the newest window fits, the rest is lost straight away
+            pos += n - self.capacity
+            samples = samples[-self.capacity:]
+            n = self.capacity
+        # Readers treat everything this write overwrites as gone from now on
+        self.reserved_pos = pos + n
+
+        start = pos % self.capacity
+        first = min(n, self.capacity - start)
+        self.buffer[start:start + first] = samples[:first]
+        if first < n:
+            self.buffer[:n - first] = samples[first:]
+
+        # Publish only once the data is in place
+        self.write_pos = pos + n
+
+    def oldest_pos(self):
+        """Oldest position that is safe to read, leaving room for a write in progress"""
+        return max(0, self.reserved_pos - self.capacity)
+
+    def available(self, pos):
+        """Number of samples written after ``pos``"""
+        return self.write_pos - pos
+
+    def catch_up(self, pos):
+        """Move a lagging read position forward to the oldest readable sample"""
+        oldest = self.oldest_pos()
+        if pos < oldest:
+            self.overruns += 1
+            self.overrun_samples += oldest - pos
+            return oldest
+        return pos
+
+    def views(self, start, stop):
+        """Zero-copy views of samples ``[start, stop)`` (one, or two if wrapping)"""
+        if stop > self.write_pos or start < self.oldest_pos():
+            raise IndexError(f"samples {start}-{stop} are not in the buffer")
+        begin = start % self.capacity
+        end = begin + (stop - start)
+        if end <= self.capacity:
+            return (self.buffer[begin:end],)
+        return (self.buffer[begin:], self.buffer[:end - self.capacity])
+
+    def is_intact(self, start):
+        """Check, after reading, that data from ``start`` was not overwritten meanwhile"""
+        return start >= self.oldest_pos()
+
+    def read(self, start, stop):
+        """Copy samples ``[start, stop)`` out of the buffer, or None on overrun"""
+        try:
+            chunk = np.concatenate(self.views(start, stop))
+        except IndexError:
+            chunk = None
+        if chunk is None or not self.is_intact(start):
+            self.overruns += 1
+            self.overrun_samples += stop - start
+            return None
+        return chunk
+
+    def stats(self):
+        """Capture counters for monitoring"""
+        return {
+            'capacity': self.capacity,
+            'write_pos': self.write_pos,
+            'overruns': self.overruns,
+            'overrun_samples': self.overrun_samples,
+            'input_overflows': self.input_overflows,
+        }
+
+
+# A span of captured audio ready for transcription, in ring buffer positions
+ChunkDescriptor = namedtuple('ChunkDescriptor', ['seq', 'start', 'stop', 'enqueued_at'])
+
+
+class FixedSegmenter:
+    """Cuts the capture stream into fixed-length chunks"""
+
+    def __init__(self, chunk_samples, min_tail_samples=0):
+        self.chunk_samples = int(chunk_samples)
+        self.min_tail_samples = int(min_tail_samples)
+        self.reset()
+
+    def reset(self):
+        self.next_start = 0
+
+    def segments(self, buffer):
+        """Complete chunks written so far, as (start, stop) positions"""
+        found = []
+        while buffer.write_pos - self.next_start >= self.chunk_samples:
+            found.append((self.next_start, self.next_start + self.chunk_samples))
+            self.next_start += self.chunk_samples
+        return found
+
+    def flush(self, buffer):
+        """The remaining partial chunk, if it is long enough"""
+        found = []
+        if buffer.write_pos - self.next_start >= max(self.min_tail_samples, 1):
+            found.append((self.next_start, buffer.write_pos))
+        self.next_start = buffer.write_pos
+        return found
+
+    def stats(self):
+        return {}
+
+
+class VoiceActivitySegmenter:
+    """Cuts the capture stream at pauses in speech and drops silence.
+
+    Audio is analysed in short frames; a frame counts as speech when its
+    energy is well above the tracked noise floor, or when it is slightly
+    quieter but has the high zero-crossing rate of unvoiced consonants. A
+    segment ends once ``hangover`` seconds pass without speech, or is split
+    when it reaches ``max_segment`` seconds. Segments shorter than
+    ``min_segment`` seconds are discarded along with the silence.
+    """
+
+    def __init__(self, sample_rate, frame_ms=30, min_segment=0.5, max_segment=15.0,
+                 hangover=0.5, pre_roll=0.2, min_energy_db=-55.0, snr_db=10.0,
+                 zcr_threshold=0.3, floor_rise_db=0.5):
+        self.sample_rate = sample_rate
+        self.frame_samples = int(sample_rate * frame_ms / 1000)
+        self.min_segment = int(sample_rate * min_segment)
+        self.max_segment = int(sample_rate * max_segment)
+        self.hangover = int(sample_rate * hangover)
+        self.pre_roll = int(sample_rate * pre_roll)
+        self.min_energy_db = min_energy_db
+        self.snr_db = snr_db
+        self.zcr_threshold = zcr_threshold
+        self.floor_rise_db = floor_rise_db  # per second
+        self.reset()
+
+    def reset(self):
+        self.analyzed_pos = 0
+        self.segment_start = None
+        self.speech_start = 0
+        self.last_speech = 0
+        self.last_stop = 0
+        self.noise_floor_db = None
+        self.analyzed_samples = 0
+        self.speech_samples = 0
+
+    def classify(self, frames):
+        """Vectorised speech/silence decision for a (n_frames, frame_samples) array"""
+        energy_db = 10 * np.log10(np.mean(frames * frames, axis=1) + 1e-12)
+        signs = np.signbit(frames)
+        zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+
+        # Follow the noise floor down at once but only let it creep up slowly,
+        # so that long stretches of speech are not mistaken for background
+        quiet = float(energy_db.min())
+        if self.noise_floor_db is None or quiet < self.noise_floor_db:
+            self.noise_floor_db = quiet
+        else:
+            rise = self.floor_rise_db * len(frames) * self.frame_samples / self.sample_rate
+            self.noise_floor_db += min(quiet - self.noise_floor_db, rise)
+
+        threshold = max(self.min_energy_db, self.noise_floor_db + self.snr_db)
+        voiced = energy_db > threshold
+        unvoiced = (zcr > self.zcr_threshold) & (energy_db > threshold - self.snr_db / 2)
+        return voiced | unvoiced
+
+    def segments(self, buffer):
+        """Speech segments completed so far, as (start, stop) positions"""
+        self.analyzed_pos = max(self.analyzed_pos, buffer.oldest_pos())
+        n_frames = buffer.available(self.analyzed_pos) // self.frame_samples
+        if n_frames == 0:
+            return []
+        stop = self.analyzed_pos + n_frames * self.frame_samples
+        samples = np.concatenate(buffer.views(self.analyzed_pos, stop))
+        speech = self.classify(samples.reshape(n_frames, self.frame_samples))
+
+        found = []
+        frame_start = self.analyzed_pos
+        for is_speech in speech:
+            frame_stop = frame_start + self.frame_samples
+            if is_speech:
+                if self.segment_start is None:
+                    self.segment_start = max(frame_start - self.pre_roll, self.last_stop)
+                    self.speech_start = frame_start
+                self.last_speech = frame_stop
+            if self.segment_start is not None:
+                if not is_speech and frame_stop - self.last_speech >= self.hangover:
+                    self._close_segment(frame_stop, found)
+                elif frame_stop - self.segment_start >= self.max_segment:
+                    self._close_segment(frame_stop, found)
+                    self.segment_start = self.speech_start = frame_stop  # Speech carries on
+            frame_start = frame_stop
+
+        self.analyzed_samples += stop - self.analyzed_pos
+        self.analyzed_pos = stop
+        return found
+
+    def flush(self, buffer):
+        """The segment still open when the stream ends, if any"""
+        found = []
+        if self.segment_start is not None:
+            self._close_segment(self.analyzed_pos, found)
+        return found
+
+    def _close_segment(self, stop, found):
+        # Judge the length by the speech itself, not the padding around it
+        if self.last_speech - self.speech_start >= self.min_segment:
+            found.append((self.segment_start, stop))
+            self.speech_samples += stop - self.segment_start
+        self.last_stop = stop
+        self.segment_start = None
+
+    def stats(self):
+        skipped = 0.0
+        if self.analyzed_samples:
+            skipped = max(0.0, 1 - self.speech_samples / self.analyzed_samples)
+        return {
+            'analyzed_seconds': self.analyzed_samples / self.sample_rate,
+            'speech_seconds': self.speech_samples / self.sample_rate,
+            'skipped_fraction': skipped,
+        }
+
+
+class ChunkDispatcher:
+    """Cuts the capture stream into chunks and queues them for the transcriber.
+
+    The capture side calls ``notify`` after every write and the segmenter
+    decides where chunks end; each one is queued as soon as it is complete
+    while the transcriber blocks in ``get``. The queue is bounded, so when the
+    transcriber falls behind new chunks are dropped (and counted) instead of
+    piling up.
+    """
+
+    def __init__(self, buffer, segmenter, max_pending=8):
+        self.buffer = buffer
+        self.segmenter = segmenter
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.reset()
+
+    def reset(self):
+        """Drop pending chunks and start again at position 0.
+
+        Only call this while no transcriber is in ``get``: the end marker is
+        dropped too, which would leave one waiting for good.
+        """
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                break
+        self.segmenter.reset()
+        self.next_seq = 0
+        self.dispatched = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.last_wait = 0.0
+        self.max_wait = 0.0
+        self.total_wait = 0.0
+        self.received = 0
+
+    def notify(self):
+        """Queue every chunk completed so far (capture side)"""
+        for start, stop in self.segmenter.segments(self.buffer):
+            self._enqueue(start, stop)
+
+    def close(self):
+        """Queue the remaining partial chunk and the end-of-stream marker"""
+        for start, stop in self.segmenter.flush(self.buffer):
+            self._enqueue(start, stop)
+        try:
+            self.queue.put(None, timeout=5)
+        except queue.Full:
+            print("Chunk queue full, transcriber did not drain it")
+
+    def _enqueue(self, start, stop):
+        chunk = ChunkDescriptor(self.next_seq, start, stop, time.monotonic())
+        try:
+            self.queue.put_nowait(chunk)
+        except queue.Full:
+            self.dropped += 1
+            TELEMETRY.increment('chunks_dropped')
+            return
+        TELEMETRY.increment('chunks_dispatched')
+        self.next_seq += 1
+        self.dispatched += 1
+        self.max_depth = max(self.max_depth, self.queue.qsize())
+
+    def get(self, timeout=None):
+        """Block until the next chunk is ready; None marks the end of the stream"""
+        chunk = self.queue.get(timeout=timeout)
+        if chunk is not None:
+            wait = time.monotonic() - chunk.enqueued_at
+            self.received += 1
+            self.last_wait = wait
+            self.max_wait = max(self.max_wait, wait)
+            self.total_wait += wait
+            TELEMETRY.observe('chunk_queue_wait', wait * 1000)
+        return chunk
+
+    def stats(self):
+        """Backpressure counters for monitoring"""
+        return {
+            'queue_depth': self.queue.qsize(),
+            'max_queue_depth': self.max_depth,
+            'dispatched': self.dispatched,
+            'dropped': self.dropped,
+            'last_wait': self.last_wait,
+            'max_wait': self.max_wait,
+            'avg_wait': self.total_wait / self.received if self.received else 0.0,
+            **self.segmenter.stats(),
+        }
+
+
+# Outcome of recognizing one chunk: text is None when no speech was found
+RecognitionResult = namedtuple('RecognitionResult', ['text', 'confidence', 'started', 'duration'])
+
+
+class RecognizerBackend:
+    """Base class for speech recognition engines.
+
+    Subclasses implement ``_recognize`` and return ``(text, confidence)``;
+    ``confidence`` may be None when the engine does not report one. Engines
+    signal "no speech" with ``sr.UnknownValueError`` and service or setup
+    problems with ``sr.RequestError``, as SpeechRecognition does. Engines
+    that need an optional library name its ``module`` (installed as
+    ``package``); ``available()`` tells whether it is installed. An engine
+    that cannot be set up at all keeps the reason in ``load_error``, as every
+    chunk would fail the same way.
+    """
+
+    name = ''
+    label = ''
+    offline = False
+    sample_rate = 16000  # rate the engine works at natively
+    module = None
+    package = None
+
+    def __init__(self):
+        self._recognizer = None
+        self.load_error = None
+
+    @classmethod
+    def available(cls):
+        return cls.module is None or importlib.util.find_spec(cls.module) is not None
+
+    @property
+    def recognizer(self):
+        # Created on first use, so picking an engine does not load SpeechRecognition
+        if self._recognizer is None:
+            self._recognizer = sr.Recognizer()
+        return self._recognizer
+
+    def recognize(self, audio_data):
+        """Transcribe an ``sr.AudioData`` chunk into a RecognitionResult"""
+        started = time.time()
+        try:
+            text, confidence = self._recognize(audio_data)
+        except sr.UnknownValueError:
+            text, confidence = None, None
+        return RecognitionResult(text, confidence, started, time.time() - started)
+
+    def _recognize(self, audio_data):
+        raise NotImplementedError
+
+
+class GoogleRecognizerBackend(RecognizerBackend):
+    """Google Web Speech API (needs a network connection)"""
+
+    name = 'google'
+    label = 'Google Speech Recognition (online)'
+
+    def _recognize(self, audio_data):
+        return self.recognizer.recognize_google(audio_data, with_confidence=True)
+
+
+class SphinxRecognizerBackend(RecognizerBackend):
+    """CMU PocketSphinx, runs locally on the CPU (needs ``pocketsphinx``)"""
+
+    name = 'sphinx'
+    label = 'PocketSphinx (offline)'
+    offline = True
+    module = package = 'pocketsphinx'
+
+    def _recognize(self, audio_data):
+        return self.recognizer.recognize_sphinx(audio_data), None
+
+
+class WhisperRecognizerBackend(RecognizerBackend):
+    """OpenAI Whisper model run locally on the CPU (needs ``openai-whisper``).
+
+    The model is loaded once, on first use, and shared by all workers;
+    inference on it is serialized, as the model keeps decoding state.
+    """
+
+    name = 'whisper'
+    label = 'Whisper base model (offline)'
+    offline = True
+    module = 'whisper'
+    package = 'openai-whisper'
+    model_name = 'base'
+
+    def __init__(self):
+        super().__init__()
+        self._model = None
+        self._model_lock = threading.Lock()
+
+    def _recognize(self, audio_data):
+        pcm = np.frombuffer(audio_data.get_raw_data(convert_rate=self.sample_rate, convert_width=2), dtype=np.int16)
+        with self._model_lock:
+            if self._model is None:
+                if self.load_error:
+                    raise sr.RequestError(self.load_error)
+                try:
+                    self._model = whisper.load_model(self.model_name)
+                except Exception as e:
+                    self.load_error = f"could not load the Whisper {self.model_name} model: {e}"
+                    raise sr.RequestError(self.load_error)
+            result = self._model.transcribe(pcm.astype(np.float32) / 32768, language='english', fp16=False)
+        text = result['text'].strip()
+        if not text:
+            raise sr.UnknownValueError()
+        return text, None
+
+
+RECOGNIZER_BACKENDS = {
+    backend.name: backend
+    for backend in (GoogleRecognizerBackend, SphinxRecognizerBackend, WhisperRecognizerBackend)
+}
+
+
+def create_recognizer_backend(name):
+    """Instantiate a recognizer backend by name, falling back to Google"""
+    return RECOGNIZER_BACKENDS.get(name, GoogleRecognizerBackend)()
+
+
+class ChunkEncoder:
+    """Turns captured float32 chunks into the 16-bit PCM payload a recognizer wants.
+
+    Chunks are resampled once from the capture rate to the recognizer's rate
+    with a polyphase filter, whose FIR low-pass also does the anti-aliasing.
+    At 16 kHz a payload is about a third of the size it is at 44.1 kHz.
+    """
+
+    def __init__(self, source_rate, target_rate):
+        self.source_rate = source_rate
+        self.target_rate = target_rate
+        divisor = gcd(source_rate, target_rate)
+        self.up = target_rate // divisor
+        self.down = source_rate // divisor
+        self.lock = threading.Lock()
+        self.chunks = 0
+        self.source_bytes = 0
+        self.payload_bytes = 0
+
+    def resample(self, samples):
+        """Resample float samples to the target rate"""
+        if self.up == self.down:
+            return samples
+        return signal.resample_poly(samples, self.up, self.down)
+
+    def encode(self, samples):
+        """Resample and quantize a chunk into an ``sr.AudioData``"""
+        resampled = self.resample(samples)
+        pcm = (np.clip(resampled, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+        with self.lock:
+            self.chunks += 1
+            self.source_bytes += len(samples) * 2
+            self.payload_bytes += len(pcm)
+        return sr.AudioData(pcm, self.target_rate, 2)
+
+    def stats(self):
+        """Payload size counters, in bytes of 16-bit PCM"""
+        with self.lock:
+            return {
+                'target_rate': self.target_rate,
+                'chunks': self.chunks,
+                'source_bytes': self.source_bytes,
+                'payload_bytes': self.payload_bytes,
+            }
+
+
+RECORDINGS_DIRNAME = "recordings"
+
+
+class AudioRecorder:
+    """Streams the captured audio to a WAV file while a meeting is recorded.
+
+    Another reader of the capture ring buffer: a background thread copies out
+    whatever has been written every ``interval`` seconds, resamples it to
+    ``target_rate`` and appends it as 16-bit mono PCM, so memory use stays flat
+    however long the meeting runs. Each block is resampled with ``context``
+    extra samples on both sides that are trimmed off again, so the joins are
+    seamless; the file trails the capture by a fraction of a second. PCM
+    frames have a fixed size, so any sample can be seeked to directly.
+    """
+
+    def __init__(self, buffer, source_rate, target_rate=16000, interval=0.5):
+        self.buffer = buffer
+        self.resampler = ChunkEncoder(source_rate, target_rate)
+        self.target_rate = target_rate
+        self.interval = interval
+        # Whole resampling periods, so block edges map to exact output samples
+        self.context = self.resampler.down * max(1, 4000 // self.resampler.down)
+        self.stopped = threading.Event()
+        self.thread = None
+        self.file = None
+        self.path = None
+        self.origin = 0
+        self.pos = 0
+        self.frames = 0
+        self.lost_frames = 0
+
+    def offset(self, pos):
+        """Sample offset in the recording of capture position ``pos``"""
+        return self.output_length(pos - self.origin)
+
+    def output_length(self, samples):
+        """Recording samples for ``samples`` captured samples"""
+        return samples * self.resampler.up // self.resampler.down
+
+    def start(self, path):
+        """Begin writing at the current capture position"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.file = wave.open(path, 'wb')
+        self.file.setnchannels(1)
+        self.file.setsampwidth(2)
+        self.file.setframerate(self.target_rate)
+        self.origin = self.pos = self.buffer.write_pos - self.buffer.write_pos % self.resampler.down
+        self.frames = 0
+        self.lost_frames = 0
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Write out the rest of the capture and close the file"""
+        if self.thread is None:
+            return
+        self.stopped.set()
+        self.thread.join()
+        self.thread = None
+
+    def _run(self):
+        try:
+            while not self.stopped.wait(self.interval):
+                self.write_available(final=False)
+            self.write_available(final=True)
+        except Exception as e:
+            print(f"Audio recording error: {e}")
+        finally:
+            self.file.close()
+            self.file = None
+
+    def write_available(self, final):
+        """Append everything captured so far, minus the look-ahead unless ``final``"""
+        write_pos = self.buffer.write_pos
+        down = self.resampler.down
+        end = write_pos if final else write_pos - self.context
+        if not final:
+            end -= (end - self.pos) % down
+        if end <= self.pos:
+            return
+
+        start = max(0, self.pos - self.context)
+        stop = min(end + self.context, write_pos)
+        samples = self.buffer.read(start, stop)
+        if samples is None:
+            # Fell behind the ring buffer: keep the timeline with silence
+            caught_up = self.buffer.catch_up(self.pos)
+            caught_up += -caught_up % down
+            silence = self.output_length(caught_up - self.pos)
+            self._write(np.zeros(silence, dtype=np.float32))
+            self.lost_frames += silence
+            self.pos = caught_up
+            return
+
+        resampled = self.resampler.resample(samples)
+        first = self.output_length(self.pos - start)
+        if final:
+            self._write(resampled[first:])
+        else:
+            self._write(resampled[first:first + self.output_length(end - self.pos)])
+        self.pos = end
+
+    def _write(self, samples):
+        pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+        self.file.writeframes(pcm.tobytes())
+        self.frames += len(pcm)
+
+    def stats(self):
+        return {
+            'frames': self.frames,
+            'seconds': self.frames / self.target_rate,
+            'lost_frames': self.lost_frames,
+        }
+
+
+def read_recording(path, offset, count):
+    """Samples ``[offset, offset + count)`` of a meeting recording and its rate"""
+    with wave.open(path, 'rb') as f:
+        f.setpos(min(offset, f.getnframes()))
+        frames = f.readframes(count)
+        rate = f.getframerate()
+    return np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768, rate
+
+
+def is_recording_format(path):
+    """Whether a WAV file is 16-bit mono PCM, the only kind ``read_recording`` can play"""
+    try:
+        with wave.open(path, 'rb') as f:
+            return f.getnchannels() == 1 and f.getsampwidth() == 2
+    except (wave.Error, EOFError):
+        return False
+
+
+def write_recording(path, samples, rate):
+    """Write float samples to a 16-bit mono WAV recording"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with wave.open(temp_path, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes((np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16).tobytes())
+    os.replace(temp_path, path)
+
+
+def export_recording(recording, source_dir, target_dir):
+    """Copy a meeting's recording next to a meeting saved in another folder"""
+    if not recording:
+        return recording
+    source = os.path.join(source_dir, *recording['file'].split("/"))
+    target = os.path.join(target_dir, *recording['file'].split("/"))
+    if os.path.abspath(source) != os.path.abspath(target) and os.path.exists(source):
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        temp_path = f"{target}.{os.getpid()}.tmp"
+        shutil.copyfile(source, temp_path)
+        os.replace(temp_path, target)
+    return recording
+
+
+class TranscriptSequencer:
+    """Releases per-chunk results strictly in chunk order.
+
+    Workers report results as they finish, in any order; ``on_result`` is
+    called for each one only after every earlier chunk has been released.
+    """
+
+    def __init__(self, on_result):
+        self.on_result = on_result
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.pending = {}
+            self.next_seq = 0
+
+    def complete(self, seq, result):
+        """Record the result for chunk ``seq`` and release whatever is now in order"""
+        with self.lock:
+            self.pending[seq] = result
+            while self.next_seq in self.pending:
+                self.on_result(self.pending.pop(self.next_seq))
+                self.next_seq += 1
+
+    def waiting(self):
+        """Number of finished results held back by an earlier chunk"""
+        return len(self.pending)
+
+
+class TranscriptionWorkerPool:
+    """Recognizes several chunks concurrently and hands results back in order.
+
+    ``recognize(audio)`` runs on a worker thread and returns a
+    RecognitionResult; ``on_result(chunk, result)`` is called in chunk order
+    (``result`` is None when the chunk was lost or recognition failed). At most
+    ``max_in_flight`` chunks are outstanding: ``submit`` blocks beyond that,
+    which pushes back on the chunk queue instead of growing a backlog here.
+    """
+
+    def __init__(self, recognize, on_result, max_workers=3, max_in_flight=None):
+        self.recognize = recognize
+        self.on_result = on_result
+        self.max_workers = max_workers
+        self.slots = threading.BoundedSemaphore(max_in_flight or max_workers * 2)
+        self.sequencer = TranscriptSequencer(self._release)
+        self.executor = None
+        self.executor_lock = threading.Lock()
+        self.stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.in_flight = 0
+            self.completed = 0
+            self.failed = 0
+            self.last_latency = 0.0
+            self.max_latency = 0.0
+            self.total_latency = 0.0
+            self.last_lag = 0.0
+            self.max_lag = 0.0
+
+    def start(self):
+        """Start a fresh set of workers for a new recording; returns them for ``shutdown``.
+
+        Chunks of the previous recording that are still being recognized are
+        drained first, so none of their results land in the new sequence.
+        """
+        with self.executor_lock:
+            if self.executor:
+                self.executor.shutdown(wait=True)
+            self.sequencer.reset()
+            self.reset_stats()
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="recognizer")
+            return self.executor
+
+    def submit(self, chunk, audio):
+        """Queue a chunk for recognition; ``audio`` of None just keeps its place in order"""
+        if audio is None:
+            self.sequencer.complete(chunk.seq, (chunk, None))
+            return
+        self.slots.acquire()
+        with self.stats_lock:
+            self.in_flight += 1
+        try:
+            self.executor.submit(self._run, chunk, audio)
+        except RuntimeError:
+            # The workers were shut down under us by a newer recording
+            with self.stats_lock:
+                self.in_flight -= 1
+            self.slots.release()
+            raise
+
+    def shutdown(self, executor=None):
+        """Wait for outstanding chunks to be recognized and released.
+
+        ``executor`` is what ``start`` returned; a newer recording's workers
+        are left running.
+        """
+        with self.executor_lock:
+            executor = executor or self.executor
+            if executor is None:
+                return
+            executor.shutdown(wait=True)
+            if executor is self.executor:
+                self.executor = None
+
+    def _run(self, chunk, audio):
+        started = time.monotonic()
+        result = None
+        try:
+            result = self.recognize(audio)
+        except Exception as e:
+            print(f"Transcription error: {e}")
+            with self.stats_lock:
+                self.failed += 1
+        latency = time.monotonic() - started
+        with self.stats_lock:
+            self.in_flight -= 1
+            self.completed += 1
+            self.last_latency = latency
+            self.max_latency = max(self.max_latency, latency)
+            self.total_latency += latency
+        self.slots.release()
+        self.sequencer.complete(chunk.seq, (chunk, result))
+
+    def _release(self, released):
+        chunk, result = released
+        # Lag from the chunk being captured to its text reaching the transcript
+        lag = time.monotonic() - chunk.enqueued_at
+        TELEMETRY.observe('transcript_lag', lag * 1000)
+        with self.stats_lock:
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+        try:
+            self.on_result(chunk, result)
+        except Exception as e:
+            print(f"Transcription error: {e}")
+
+    def stats(self):
+        """Pool counters for sizing ``max_workers``"""
+        with self.stats_lock:
+            return {
+                'workers': self.max_workers,
+                'in_flight': self.in_flight,
+                'waiting_for_order': self.sequencer.waiting(),
+                'completed': self.completed,
+                'failed': self.failed,
+                'last_latency': self.last_latency,
+                'max_latency': self.max_latency,
+                'avg_latency': self.total_latency / self.completed if self.completed else 0.0,
+                'last_lag': self.last_lag,
+                'max_lag': self.max_lag,
+            }
+
+
+def create_segmenter(sample_rate, vad_enabled=True, chunk_seconds=5):
+    """Chunking strategy for transcription: cut at pauses, or every ``chunk_seconds``"""
+    if vad_enabled:
+        return VoiceActivitySegmenter(sample_rate, max_segment=chunk_seconds * 3)
+    return FixedSegmenter(sample_rate * chunk_seconds, min_tail_samples=sample_rate // 2)
+
+
+def make_transcript_entry(result, start_time, offset_seconds):
+    """Transcript entry for speech that began ``offset_seconds`` into the meeting"""
+    # Stamp the entry with when it was said, not when recognition finished
+    timestamp = (start_time + timedelta(seconds=offset_seconds)).strftime("%H:%M:%S")
+    entry = {
+        'timestamp': timestamp,
+        'text': result.text
+    }
+    if result.confidence is not None:
+        entry['confidence'] = round(result.confidence, 3)
+    return entry
+
+
+def load_audio_file(path):
+    """Mono float32 samples in [-1, 1] and the sample rate of a WAV file"""
+    rate, data = wav.read(path)
+    if data.dtype == np.uint8:
+        data = (data.astype(np.float32) - 128) / 128
+    elif np.issubdtype(data.dtype, np.integer):
+        data = data.astype(np.float32) / np.iinfo(data.dtype).max
+    if data.ndim > 1:
+        data = data.mean(axis=1)
+    return data.astype(np.float32), rate
+
+
+def transcribe_samples(samples, sample_rate, backend, segmenter, block_seconds=1.0):
+    """Recognize recorded audio the way live capture does.
+
+    The samples are fed through a capture ring buffer in ``block_seconds``
+    blocks and cut by ``segmenter``. Returns ``(results, errors)``: a
+    ``(start, stop, result)`` for every chunk with recognized text, positions
+    in samples, and the messages of chunks the engine could not recognize.
+    """
+    encoder = ChunkEncoder(sample_rate, backend.sample_rate)
+    buffer = AudioRingBuffer(sample_rate * 60)
+    block = max(1, int(sample_rate * block_seconds))
+    results = []
+    errors = []
+
+    def recognize(spans):
+        for start, stop in spans:
+            audio_chunk = buffer.read(start, stop)
+            if audio_chunk is None:
+                continue
+            try:
+                result = backend.recognize(encoder.encode(audio_chunk))
+            except sr.RequestError as e:
+                errors.append(str(e))
+                continue
+            if result is not None and result.text and result.text.strip():
+                results.append((start, stop, result))
+
+    for offset in range(0, len(samples), block):
+        buffer.write(samples[offset:offset + block])
+        recognize(segmenter.segments(buffer))
+    recognize(segmenter.flush(buffer))
+    return results, errors
+
+
+SUMMARY_SYSTEM_PROMPT = (
+    "You are a helpful assistant that creates concise, professional meeting summaries. "
+    "Focus on key points, action items, and important decisions."
+)
+
+
+def format_transcript(entries):
+    """Render transcript entries as "[HH:MM:SS] text" lines"""
+    return "\n".join(f"[{entry['timestamp']}] {entry['text']}" for entry in entries)
+
+
+class RollingSummarizer:
+    """Summarizes the transcript incrementally while the meeting is recorded.
+
+    Map: each time ``window_chars`` of new transcript has accumulated, that
+    window is summarized on a background worker. Reduce: whenever the last
+    ``fan_in`` partial summaries share a level they are merged into a single
+    summary one level up, so only a handful of partials exist at any time.
+    The final summary is then one cheap merge of those partials plus the
+    transcript tail that has not been summarized yet.
+
+    Partials are kept in ``meeting['partial_summaries']`` as dicts with
+    ``level``, ``start`` and ``end`` (transcript indices) and ``summary``, in
+    transcript order, so they are saved and reloaded with the meeting.
+    ``chat(messages, max_tokens)`` performs one completion and returns its text;
+    ``on_update(meeting)`` is called after the partials have changed.
+    ``reset()`` must be called when the meeting starts over, so work still
+    running for the old transcript is dropped instead of stored.
+    """
+
+    def __init__(self, chat, window_chars=6000, fan_in=4, partial_max_tokens=300, on_update=None):
+        self.chat = chat
+        self.on_update = on_update
+        self.window_chars = window_chars
+        self.fan_in = fan_in
+        self.partial_max_tokens = partial_max_tokens
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summarizer")
+        self.pending = False
+        self.generation = 0
+
+    def reset(self):
+        """Forget the current meeting; partials still being made for it are discarded"""
+        self.generation += 1
+        self.pending = False
+
+    def transcript_updated(self, meeting):
+        """Schedule summarizing any newly completed window in the background"""
+        if not self.pending:
+            self.pending = True
+            self.executor.submit(self._advance_in_background, meeting, self.generation)
+
+    def _advance_in_background(self, meeting, generation):
+        if generation == self.generation:
+            self.pending = False
+        try:
+            self.advance(meeting, generation)
+        except Exception as e:
+            print(f"Rolling summary error: {e}")
+
+    def partials(self, meeting):
+        """Partial summaries that are consistent with the meeting's transcript"""
+        partials = meeting.get('partial_summaries') or []
+        if partials and partials[-1]['end'] > len(meeting['transcript']):
+            return []  # Transcript was replaced underneath them
+        return partials
+
+    def advance(self, meeting, generation=None):
+        """Summarize every complete window not yet covered, then merge"""
+        if generation is None:
+            generation = self.generation
+        transcript = meeting['transcript']
+        partials = list(self.partials(meeting))
+        start = partials[-1]['end'] if partials else 0
+
+        while True:
+            end, size = start, 0
+            while end < len(transcript) and size < self.window_chars:
+                size += len(transcript[end]['text']) + 12
+                end += 1
+            if size < self.window_chars:
+                break  # Not a full window yet
+
+            if generation != self.generation:
+                return  # Meeting was reset
+            summary = self.chat(self.map_messages(transcript[start:end]), self.partial_max_tokens)
+            partials.append({'level': 0, 'start': start, 'end': end, 'summary': summary})
+            self._reduce(partials)
+            if generation != self.generation:
+                return  # Meeting was reset while the completions ran
+            # Swap the whole list so readers never see a half-updated one
+            meeting['partial_summaries'] = list(partials)
+            if self.on_update:
+                self.on_update(meeting)
+            start = end
+
+    def _reduce(self, partials):
+        while len(partials) >= self.fan_in:
+            group = partials[-self.fan_in:]
+            level = group[0]['level']
+            if any(partial['level'] != level for partial in group):
+                break
+            summary = self.chat(
+                self.reduce_messages([partial['summary'] for partial in group]),
+                self.partial_max_tokens
+            )
+            partials[-self.fan_in:] = [{
+                'level': level + 1,
+                'start': group[0]['start'],
+                'end': group[-1]['end'],
+                'summary': summary,
+            }]
+
+    def final_messages(self, meeting):
+        """Catch up on unsummarized windows and build the final summary prompt"""
+        # Runs on the summarizer worker so it never races the background map
+        self.executor.submit(self.advance, meeting).result()
+
+        partials = self.partials(meeting)
+        if not partials:
+            return [
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                {"role": "user", "content": f"Please summarize this meeting transcript:\n\n{format_transcript(meeting['transcript'])}"}
+            ]
+
+        parts = [partial['summary'] for partial in partials]
+        tail = meeting['transcript'][partials[-1]['end']:]
+        content = "Please combine these summaries of consecutive parts of a meeting into one summary"
+        if tail:
+            content += ", together with the transcript of its final minutes"
+        content += ":\n\n" + "\n\n".join(f"Part {i}:\n{part}" for i, part in enumerate(parts, 1))
+        if tail:
+            content += f"\n\nFinal minutes:\n{format_transcript(tail)}"
+        return [
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": content}
+        ]
+
+    def summarize(self, meeting, max_tokens=500):
+        """Produce the final meeting summary"""
+        return self.chat(self.final_messages(meeting), max_tokens)
+
+    @staticmethod
+    def map_messages(entries):
+        return [
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": "Summarize this part of a meeting transcript. Keep key points, "
+                                        "decisions and action items with their timestamps:\n\n" + format_transcript(entries)}
+        ]
+
+    @staticmethod
+    def reduce_messages(summaries):
+        return [
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": "Merge these summaries of consecutive parts of a meeting into one summary, "
+                                        "keeping key points, decisions and action items:\n\n" + "\n\n".join(summaries)}
+        ]
+
+
+class SummaryCache:
+    """On-disk cache of completions, keyed by a hash of the full request.
+
+    The key covers the model, every message (system prompt and transcript
+    text) and ``max_tokens``, so any change to the input is a miss. Entries
+    are evicted least-recently-used first once they exceed ``max_bytes``.
+    """
+
+    def __init__(self, path, max_bytes=50 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS summaries_lru ON summaries (last_used)")
+
+    @staticmethod
+    def make_key(model, messages, max_tokens):
+        request = json.dumps([model, messages, max_tokens], ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(request.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Cached completion for ``key``, or None"""
+        with self.lock:
+            row = self.connection.execute("SELECT value FROM summaries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            with self.connection:
+                self.connection.execute("UPDATE summaries SET last_used = ? WHERE key = ?", (time.time(), key))
+            return row[0]
+
+    def put(self, key, value):
+        """Store a completion and evict the least recently used ones over the size limit"""
+        size = len(value.encode('utf-8'))
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO summaries (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, value, size, time.time())
+            )
+            total = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM summaries").fetchone()[0]
+            if total > self.max_bytes:
+                for old_key, old_size in self.connection.execute(
+                        "SELECT key, size FROM summaries ORDER BY last_used").fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    self.connection.execute("DELETE FROM summaries WHERE key = ?", (old_key,))
+                    total -= old_size
+                    self.evictions += 1
+
+    def stats(self):
+        """Hit/miss counters and current cache size"""
+        with self.lock:
+            entries, size = self.connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM summaries").fetchone()
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': entries,
+                'bytes': size,
+            }
+
+
+class SummaryClient:
+    """OpenAI chat completions for summaries, answered from the cache when possible"""
+
+    def __init__(self, api_key, model="gpt-3.5-turbo", cache=None):
+        self.api_key = api_key
+        self.model = model
+        self.cache = cache
+        self.client = None
+
+    def get_client(self):
+        """OpenAI client for the current API key"""
+        if self.client is None or self.client.api_key != self.api_key:
+            self.client = openai.OpenAI(api_key=self.api_key)
+        return self.client
+
+    def cached(self, messages, max_tokens):
+        """``(key, cached reply or None)``"""
+        if self.cache is None:
+            return None, None
+        key = self.cache.make_key(self.model, messages, max_tokens)
+        return key, self.cache.get(key)
+
+    def chat_completion(self, messages, max_tokens):
+        """Run one chat completion and return the reply text"""
+        key, reply = self.cached(messages, max_tokens)
+        if reply is not None:
+            return reply
+
+        with TELEMETRY.timer('openai_request'):
+            response = self.get_client().chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=max_tokens
+            )
+        # No content (e.g. a filtered reply) is returned as empty and never cached
+        reply = response.choices[0].message.content or ''
+        if key is not None and reply:
+            self.cache.put(key, reply)
+        return reply
+
+    def stream_chat_completion(self, messages, max_tokens, on_text, cancel=None):
+        """Stream a chat completion, passing each piece of text to ``on_text``.
+
+        Returns the full reply, or None if the ``cancel`` event was set meanwhile.
+        """
+        key, reply = self.cached(messages, max_tokens)
+        if reply is not None:
+            on_text(reply)
+            return reply
+
+        stream = self.get_client().chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            stream=True
+        )
+        parts = []
+        try:
+            for chunk in stream:
+                if cancel is not None and cancel.is_set():
+                    return None
+                if not chunk.choices:
+                    continue
+                text = chunk.choices[0].delta.content
+                if text:
+                    parts.append(text)
+                    on_text(text)
+        finally:
+            stream.close()
+        reply = "".join(parts)
+        if key is not None and reply:
+            self.cache.put(key, reply)
+        return reply
+
+
+ASSETS_DIRNAME = "meeting_assets"
+
+
+class AssetStore:
+    """Content-addressed folder of meeting images next to the meeting files.
+
+    Files are named after the SHA-256 of their bytes, so an image is written
+    once however many meetings or entries refer to it. Meeting JSON refers to
+    them by a path relative to the meeting file's folder, e.g.
+    ``meeting_assets/<hash>.png``.
+    """
+
+    def __init__(self, base_dir):
+        self.base_dir = base_dir
+        self.root = os.path.join(base_dir, ASSETS_DIRNAME)
+
+    def ref_for(self, digest, ext):
+        return f"{ASSETS_DIRNAME}/{digest}.{ext}"
+
+    def path(self, ref):
+        return os.path.join(self.base_dir, *ref.split("/"))
+
+    def contains(self, ref):
+        return os.path.exists(self.path(ref))
+
+    def put(self, data, ext="png"):
+        """Store image bytes unless already present; returns ``(ref, digest)``"""
+        digest = hashlib.sha256(data).hexdigest()
+        ref = self.ref_for(digest, ext)
+        path = self.path(ref)
+        if not os.path.exists(path):
+            os.makedirs(self.root, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        return ref, digest
+
+    def read(self, ref):
+        with open(self.path(ref), 'rb') as f:
+            return f.read()
+
+
+def screenshot_bytes(entry, base_dir):
+    """Image bytes of a screenshot entry, stored as a file or inline (legacy)"""
+    if entry.get('ref'):
+        return AssetStore(base_dir).read(entry['ref'])
+    if isinstance(entry['image'], DeferredImage):
+        return entry['image'].read()
+    return base64.b64decode(entry['image'])
+
+
+def export_screenshots(screenshots, source_dir, target_dir, on_progress=None):
+    """Screenshot entries whose images are files in ``target_dir``'s asset store.
+
+    Legacy entries with inline base64 images are written out as files, and
+    images (and thumbnails) that live in another folder's store are copied
+    byte for byte; entries already in the target store are returned unchanged.
+    ``on_progress(done, total)`` is called after each image that was copied.
+    """
+    source = AssetStore(source_dir)
+    target = AssetStore(target_dir)
+    same_dir = os.path.abspath(source_dir) == os.path.abspath(target_dir)
+    exported = []
+    for entry in screenshots:
+        if not entry.get('ref') and not entry.get('image'):
+            continue  # Capture failed before the image was stored
+        if same_dir and entry.get('ref'):
+            exported.append(entry)
+            continue
+
+        updated = {key: value for key, value in entry.items() if key != 'image'}
+        if not (entry.get('ref') and target.contains(entry['ref'])):
+            ext = os.path.splitext(entry.get('ref') or entry.get('filename') or '.png')[1].lstrip('.') or 'png'
+            updated['ref'], updated['sha256'] = target.put(screenshot_bytes(entry, source_dir), ext)
+
+        thumbnail = entry.get('thumbnail')
+        if thumbnail and not same_dir and not target.contains(thumbnail):
+            try:
+                target.put(source.read(thumbnail), 'jpg')
+            except OSError:
+                del updated['thumbnail']  # Regenerated by the viewer when needed
+        exported.append(updated)
+        if on_progress:
+            on_progress(len(exported), len(screenshots))
+    return exported
+
+
+# Binary meeting files start with this magic and a format version byte
+MEETING_MAGIC = b"MTGPK\x01"
+
+
+class MeetingSerializer:
+    """Base class for meeting file formats.
+
+    ``dumps`` turns saved meeting data into bytes and ``loads`` turns them
+    back into the same dict. Formats that need an optional library name it
+    in ``module``; ``available()`` tells whether it is installed.
+    """
+
+    name = ''
+    label = ''
+    extension = '.json'
+    module = None
+
+    @classmethod
+    def available(cls):
+        return cls.module is None or importlib.util.find_spec(cls.module) is not None
+
+    def dumps(self, meeting_data):
+        raise NotImplementedError
+
+    def loads(self, data):
+        raise NotImplementedError
+
+
+class JsonSerializer(MeetingSerializer):
+    """Indented JSON via the standard library, the original format"""
+
+    name = 'json'
+    label = 'JSON'
+
+    def dumps(self, meeting_data):
+        return json.dumps(meeting_data, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class FastJsonSerializer(JsonSerializer):
+    """The same indented JSON written and parsed by ``orjson``, several times faster"""
+
+    name = 'orjson'
+    label = 'JSON (fast, orjson)'
+    module = 'orjson'
+
+    def dumps(self, meeting_data):
+        return orjson.dumps(meeting_data, option=orjson.OPT_INDENT_2)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class MsgpackSerializer(MeetingSerializer):
+    """Compact binary format: MessagePack with the transcript stored column-wise.
+
+    Layout: ``MEETING_MAGIC``, the length of the ``meta`` block as a 4-byte
+    big-endian integer, the ``meta`` block, then the rest of the meeting, so
+    the library can read ``meta`` without unpacking the transcript. A transcript whose
+    entries all have the same keys is stored as one list per key instead of
+    repeating the keys in every entry.
+    """
+
+    name = 'msgpack'
+    label = 'Binary (MessagePack)'
+    extension = '.msgpack'
+    module = 'msgpack'
+
+    def dumps(self, meeting_data):
+        body = {key: value for key, value in meeting_data.items() if key != 'meta'}
+        transcript = body.get('transcript')
+        if transcript and all(isinstance(entry, dict) for entry in transcript):
+            keys = list(transcript[0])
+            if all(list(entry) == keys for entry in transcript):
+                body['transcript'] = {key: [entry[key] for entry in transcript] for key in keys}
+        meta = msgpack.packb(meeting_data.get('meta'), use_bin_type=True)
+        return b"".join([
+            MEETING_MAGIC, len(meta).to_bytes(4, 'big'), meta, msgpack.packb(body, use_bin_type=True)
+        ])
+
+    def loads(self, data):
+        meta, offset = self.read_meta(data)
+        body = msgpack.unpackb(data[offset:], raw=False)
+        transcript = body.get('transcript')
+        if isinstance(transcript, dict):
+            keys = list(transcript)
+            body['transcript'] = [dict(zip(keys, values)) for values in zip(*transcript.values())]
+        return body if meta is None else {'meta': meta, **body}
+
+    @staticmethod
+    def read_meta(data):
+        """``(meta, offset of the body)``; raises ValueError if ``data`` is cut short"""
+        start = len(MEETING_MAGIC) + 4
+        end = start + int.from_bytes(data[len(MEETING_MAGIC):start], 'big')
+        if len(data) < end:
+            raise ValueError("Meeting file header is truncated")
+        return msgpack.unpackb(data[start:end], raw=False), end
+
+
+MEETING_FORMATS = {
+    serializer.name: serializer
+    for serializer in (JsonSerializer, FastJsonSerializer, MsgpackSerializer)
+}
+
+# Compression applied on top of any format: name -> (file suffix, magic, module)
+MEETING_COMPRESSIONS = {
+    'none': ('', b"", None),
+    'gzip': ('.gz', b"\x1f\x8b", None),
+    'zstd': ('.zst', b"\x28\xb5\x2f\xfd", 'zstandard'),
+}
+
+MEETING_EXTENSIONS = tuple(
+    serializer.extension + suffix
+    for serializer in (JsonSerializer, MsgpackSerializer)
+    for suffix, _, _ in MEETING_COMPRESSIONS.values()
+)
+
+
+def compression_available(compression):
+    module = MEETING_COMPRESSIONS[compression][2]
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+def create_meeting_serializer(name):
+    """Instantiate a meeting format by name, falling back to the fastest JSON available"""
+    serializer = MEETING_FORMATS.get(name)
+    if serializer is None or not serializer.available():
+        serializer = FastJsonSerializer if FastJsonSerializer.available() else JsonSerializer
+    return serializer()
+
+
+def is_meeting_file(name):
+    return name.lower().endswith(MEETING_EXTENSIONS)
+
+
+def meeting_file_format(filename):
+    """``(format, compression)`` a meeting file should be written in, from its extension"""
+    name = filename.lower()
+    compression = 'none'
+    for candidate, (suffix, _, _) in MEETING_COMPRESSIONS.items():
+        if suffix and name.endswith(suffix):
+            compression, name = candidate, name[:-len(suffix)]
+    file_format = 'msgpack' if name.endswith(MsgpackSerializer.extension) else 'orjson'
+    return file_format, compression
+
+
+def encode_meeting(meeting_data, file_format='json', compression='none'):
+    """Bytes of a meeting file in the given format and compression"""
+    data = create_meeting_serializer(file_format).dumps(meeting_data)
+    if compression == 'gzip':
+        # mtime=0 keeps the output identical for identical meetings
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if compression == 'zstd':
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return data
+
+
+def decompressing_reader(f):
+    """Readable stream of the uncompressed contents of a binary file object"""
+    magic = f.read(4)
+    f.seek(0)
+    if magic.startswith(MEETING_COMPRESSIONS['gzip'][1]):
+        return gzip.GzipFile(fileobj=f)
+    if magic.startswith(MEETING_COMPRESSIONS['zstd'][1]):
+        return zstandard.ZstdDecompressor().stream_reader(f)
+    return f
+
+
+def decode_meeting(data):
+    """Meeting data from the bytes of a meeting file of any supported format"""
+    if data.startswith(MEETING_COMPRESSIONS['gzip'][1]):
+        try:
+            data = gzip.decompress(data)
+        except (OSError, EOFError) as e:
+            raise ValueError(f"Corrupt meeting file: {e}")
+    elif data.startswith(MEETING_COMPRESSIONS['zstd'][1]):
+        try:
+            data = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Corrupt meeting file: {e}")
+    if data.startswith(MEETING_MAGIC):
+        return MsgpackSerializer().loads(data)
+    # Any JSON meeting file, with the faster parser when it is installed
+    return create_meeting_serializer('orjson').loads(data)
+
+
+def meeting_filename(title, when=None, extension='.json'):
+    """Default file name for a meeting saved at ``when``"""
+    return f"meeting_{(when or datetime.now()).strftime('%Y%m%d_%H%M%S')}_{title.replace(' ', '_')}{extension}"
+
+
+def meeting_extension(file_format, compression='none'):
+    """File extension of a meeting saved in ``file_format`` with ``compression``"""
+    return MEETING_FORMATS[file_format].extension + MEETING_COMPRESSIONS[compression][0]
+
+
+def serialize_meeting(meeting, screenshots=None, recording=None, end_time=None):
+    """Meeting in the form it is saved to disk, led by its ``meta`` header"""
+    meeting_data = {
+        'title': meeting['title'],
+        'start_time': meeting['start_time'].isoformat() if meeting['start_time'] else None,
+        'end_time': (end_time or datetime.now()).isoformat(),
+        'transcript': meeting['transcript'],
+        'summary': meeting['summary'],
+        'partial_summaries': meeting['partial_summaries'],
+        'notes': meeting['notes'],
+        'screenshots': meeting['screenshots'] if screenshots is None else screenshots,
+        'recording': meeting.get('recording') if recording is None else recording
+    }
+    return {'meta': meeting_meta(meeting_data), **meeting_data}
+
+
+MEETING_WRITE_BLOCK = 1024 * 1024
+
+
+def write_meeting_file(filename, meeting_data, file_format=None, compression=None, on_progress=None):
+    """Write a meeting file atomically, by default in the format its extension names.
+
+    The bytes go to a temporary file next to ``filename`` that replaces it
+    only once complete and flushed, so a crash never leaves a truncated
+    meeting. ``on_progress(written, total)`` is called after every block.
+    """
+    default_format, default_compression = meeting_file_format(filename)
+    data = memoryview(encode_meeting(meeting_data, file_format or default_format, compression or default_compression))
+    temp_path = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            for offset in range(0, len(data), MEETING_WRITE_BLOCK):
+                f.write(data[offset:offset + MEETING_WRITE_BLOCK])
+                if on_progress:
+                    on_progress(min(offset + MEETING_WRITE_BLOCK, len(data)), len(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, filename)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def read_meeting_file(filename):
+    """Meeting data of a file in any supported format"""
+    with open(filename, 'rb') as f:
+        return decode_meeting(f.read())
+
+
+class DeferredImage:
+    """Inline base64 screenshot of a legacy meeting file, left in the file until viewed"""
+
+    def __init__(self, path, offset, length):
+        self.path = path
+        self.offset = offset
+        self.length = length
+        self.mtime = os.path.getmtime(path)
+
+    def read(self):
+        """Decoded image bytes"""
+        if os.path.getmtime(self.path) != self.mtime:
+            raise ValueError("Meeting file changed since it was opened")
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            text = f.read(self.length).decode('ascii')
+        if '\\' in text:
+            text = json.loads(f'"{text}"')
+        return base64.b64decode(text)
+
+
+class MeetingFileStream:
+    """Reads a JSON meeting file field by field instead of parsing it whole.
+
+    Iterating yields ``(key, value)`` in file order. The long lists
+    (transcript, notes, screenshots, partial summaries) come as several
+    ``(key, batch)`` pairs, so the start of a meeting can be shown while the
+    rest is still being read. With ``path`` set, inline base64 screenshots
+    are skipped over and become DeferredImages that read them from the file
+    when needed, so memory use does not grow with the images.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+    LISTS = ('transcript', 'partial_summaries', 'notes', 'screenshots')
+
+    def __init__(self, f, path=None, batch_size=200):
+        self.f = f
+        self.path = path
+        self.batch_size = batch_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = b""
+        self.pos = 0   # read position in the buffer
+        self.base = 0  # file offset of the start of the buffer
+
+    def __iter__(self):
+        self._expect(b"{")
+        if self._peek() == b"}":
+            return
+        while True:
+            key = self._value()
+            self._expect(b":")
+            if key in self.LISTS and self._peek() == b"[":
+                yield from self._list(key)
+            else:
+                yield key, self._value()
+            if self._separator(b"}"):
+                return
+
+    def _read(self):
+        """Append the next chunk of the file to the buffer; False at the end"""
+        data = self.f.read(self.CHUNK_SIZE)
+        if not data:
+            return False
+        self.base += self.pos
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def _peek(self):
+        """Next non-whitespace byte, without consuming it"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in b" \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos:self.pos + 1]
+            if not self._read():
+                raise ValueError("Unexpected end of meeting file")
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ValueError(f"Expected {char.decode()} at byte {self.base + self.pos} of meeting file")
+        self.pos += 1
+
+    def _separator(self, closing):
+        """Consume a comma or ``closing``; True at ``closing``"""
+        char = self._peek()
+        if char not in (b",", closing):
+            raise ValueError(f"Expected , or {closing.decode()} at byte {self.base + self.pos} of meeting file")
+        self.pos += 1
+        return char == closing
+
+    def _value(self):
+        """Decode the JSON value at the read position"""
+        self._peek()
+        window = 1024
+        while True:
+            data = self.buffer[self.pos:self.pos + window]
+            # A cut multi-byte character at the end of the window is dropped
+            text = data.decode('utf-8', errors='ignore')
+            try:
+                value, end = self.decoder.raw_decode(text)
+                # A value ending right at the window edge may continue past it
+                if end < len(text):
+                    break
+            except ValueError:
+                pass
+            if self.pos + window < len(self.buffer):
+                window *= 2
+            elif not self._read():
+                value, end = self.decoder.raw_decode(text)
+                break
+        self.pos += end if text.isascii() else len(text[:end].encode('utf-8'))
+        return value
+
+    def _list(self, key):
+        self._expect(b"[")
+        if self._peek() == b"]":
+            self.pos += 1
+            yield key, []
+            return
+        batch = []
+        while True:
+            batch.append(self._screenshot() if key == 'screenshots' and self.path else self._value())
+            if len(batch) >= self.batch_size:
+                yield key, batch
+                batch = []
+            if self._separator(b"]"):
+                break
+        if batch:
+            yield key, batch
+
+    def _screenshot(self):
+        """Screenshot entry with an inline image left in the file"""
+        if self._peek() != b"{":
+            return self._value()
+        self.pos += 1
+        entry = {}
+        if self._peek() == b"}":
+            self.pos += 1
+            return entry
+        while True:
+            key = self._value()
+            self._expect(b":")
+            if key == 'image' and self._peek() == b'"':
+                entry[key] = self._deferred_string()
+            else:
+                entry[key] = self._value()
+            if self._separator(b"}"):
+                return entry
+
+    def _deferred_string(self):
+        """Skip over a string value, returning a DeferredImage for its contents"""
+        self.pos += 1
+        start = self.base + self.pos
+        search = self.pos
+        while True:
+            end = self.buffer.find(b'"', search)
+            if end < 0:
+                # Drop what has been scanned, the string is never held in memory
+                self.base += len(self.buffer)
+                self.buffer, self.pos, search = b"", 0, 0
+                if not self._read():
+                    raise ValueError("Unterminated string in meeting file")
+                continue
+            escapes = len(self.buffer[:end]) - len(self.buffer[:end].rstrip(b"\\"))
+            if escapes % 2 == 0:
+                break
+            search = end + 1
+        self.pos = end + 1
+        return DeferredImage(self.path, start, self.base + end - start)
+
+
+def iter_meeting_file(path, batch_size=200):
+    """``(key, value)`` pairs of a meeting file as they are read, see MeetingFileStream.
+
+    Plain JSON files are streamed; binary and compressed files, which never
+    hold inline images, are decoded whole and then handed out the same way.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(len(MEETING_MAGIC))
+        f.seek(0)
+        if not head.startswith((MEETING_MAGIC, MEETING_COMPRESSIONS['gzip'][1], MEETING_COMPRESSIONS['zstd'][1])):
+            yield from MeetingFileStream(f, path, batch_size)
+            return
+        meeting_data = decode_meeting(f.read())
+    for key, value in meeting_data.items():
+        if key in MeetingFileStream.LISTS and isinstance(value, list):
+            for start in range(0, max(len(value), 1), batch_size):
+                yield key, value[start:start + batch_size]
+        else:
+            yield key, value
+
+
+CATALOG_FILENAME = ".meeting_catalog.sqlite"
+MEETING_FORMAT_VERSION = 1
+
+
+def meeting_meta(meeting_data):
+    """Summary block written at the top of a meeting file"""
+    duration = None
+    if meeting_data.get('start_time') and meeting_data.get('end_time'):
+        duration = (datetime.fromisoformat(meeting_data['end_time']) -
+                    datetime.fromisoformat(meeting_data['start_time'])).total_seconds()
+    return {
+        'format': MEETING_FORMAT_VERSION,
+        'title': meeting_data.get('title') or '',
+        'start_time': meeting_data.get('start_time'),
+        'end_time': meeting_data.get('end_time'),
+        'duration_seconds': duration,
+        'transcript_entries': len(meeting_data.get('transcript') or []),
+        'notes': len(meeting_data.get('notes') or []),
+        'screenshots': len(meeting_data.get('screenshots') or []),
+        'has_summary': bool(meeting_data.get('summary')),
+    }
+
+
+def read_meeting_header(path, max_bytes=64 * 1024):
+    """The ``meta`` block of a meeting file, read from its first bytes only.
+
+    Returns None for files written before the block existed.
+    """
+    with open(path, 'rb') as f:
+        try:
+            reader = decompressing_reader(f)
+            head = b""
+            while len(head) < max_bytes:
+                data = reader.read(max_bytes - len(head))
+                if not data:
+                    break
+                head += data
+        except Exception as e:
+            # Truncated or corrupt gzip/zstd data
+            raise ValueError(f"Corrupt meeting file: {e}")
+    if head.startswith(MEETING_MAGIC):
+        try:
+            meta, _ = MsgpackSerializer.read_meta(head)
+        except ValueError:
+            return None
+        return meta if isinstance(meta, dict) else None
+
+    head = head.decode('utf-8', errors='ignore')
+    match = re.match(r'\s*\{\s*"meta"\s*:\s*', head)
+    if match is None:
+        return None
+    try:
+        meta, _ = json.JSONDecoder().raw_decode(head, match.end())
+    except ValueError:
+        return None
+    return meta if isinstance(meta, dict) else None
+
+
+class MeetingCatalog:
+    """Metadata of every meeting file, for listing meetings without opening them.
+
+    Rows are keyed by path and remember the file's size and modification
+    time, so a directory scan only reads the header of files that are new or
+    have changed; files from before the header existed are parsed in full
+    once. Saving a meeting updates its row directly.
+    """
+
+    COLUMNS = ('path', 'size', 'mtime', 'title', 'start_time', 'end_time', 'duration_seconds',
+               'transcript_entries', 'notes', 'screenshots', 'has_summary')
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS catalog ("
+                "path TEXT PRIMARY KEY, size INTEGER, mtime REAL, title TEXT, start_time TEXT, end_time TEXT, "
+                "duration_seconds REAL, transcript_entries INTEGER, notes INTEGER, screenshots INTEGER, "
+                "has_summary INTEGER)"
+            )
+
+    def update(self, path, meta):
+        """Record the metadata of a meeting file that was just written"""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        self._put([self._row(path, stat.st_size, stat.st_mtime, meta)])
+
+    @staticmethod
+    def _row(path, size, mtime, meta):
+        return (path, size, mtime, meta.get('title') or '', meta.get('start_time'), meta.get('end_time'),
+                meta.get('duration_seconds'), meta.get('transcript_entries', 0), meta.get('notes', 0),
+                meta.get('screenshots', 0), int(bool(meta.get('has_summary'))))
+
+    def _put(self, rows):
+        with self.lock, self.connection:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO catalog ({', '.join(self.COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(self.COLUMNS))})",
+                rows
+            )
+
+    def scan(self, directory):
+        """Bring the catalog up to date with ``directory`` and return its meetings, newest first"""
+        directory = os.path.abspath(directory)
+        with self.lock:
+            known = {
+                path: (size, mtime) for path, size, mtime in self.connection.execute(
+                    "SELECT path, size, mtime FROM catalog WHERE path LIKE ?", (os.path.join(directory, '%'),))
+                if os.path.dirname(path) == directory
+            }
+
+        changed, present = [], set()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not is_meeting_file(entry.name) or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                present.add(entry.path)
+                if known.get(entry.path) == (stat.st_size, stat.st_mtime):
+                    continue
+                try:
+                    meta = read_meeting_header(entry.path)
+                    if meta is None:
+                        # Older file without a header: parse it once
+                        meeting_data = read_meeting_file(entry.path)
+                        if not isinstance(meeting_data, dict) or 'transcript' not in meeting_data:
+                            continue
+                        meta = meeting_meta(meeting_data)
+                except (OSError, ValueError) as e:
+                    print(f"Meeting catalog error: {entry.name}: {e}")
+                    continue
+                changed.append(self._row(entry.path, stat.st_size, stat.st_mtime, meta))
+
+        self._put(changed)
+        removed = [(path,) for path in known if path not in present]
+        with self.lock, self.connection:
+            self.connection.executemany("DELETE FROM catalog WHERE path = ?", removed)
+        return self.meetings(directory)
+
+    def meetings(self, directory):
+        """Catalogued meetings in ``directory`` as dicts, newest first"""
+        directory = os.path.abspath(directory)
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM catalog WHERE path LIKE ? "
+                f"ORDER BY start_time DESC, path", (os.path.join(directory, '%'),)
+            ).fetchall()
+        return [dict(zip(self.COLUMNS, row)) for row in rows if os.path.dirname(row[0]) == directory]
+
+
+JOURNAL_FILENAME = ".meeting_journal.jsonl"
+
+
+class MeetingJournal:
+    """Append-only log of the changes made to the meeting in progress.
+
+    Each transcript entry, note, stored screenshot and summary update is
+    appended as one JSON line, so a change costs O(change) on disk instead
+    of a rewrite of the whole meeting. A background thread writes and fsyncs
+    the lines in batches every ``sync_interval`` seconds. The first line is a
+    ``start`` record for a new meeting or a ``base`` record naming the
+    meeting file the changes apply to; saving compacts the log into that
+    file, and after a crash ``replay`` rebuilds the unsaved meeting.
+    """
+
+    LISTS = {'transcript': 'transcript', 'note': 'notes', 'screenshot': 'screenshots'}
+
+    def __init__(self, path, sync_interval=1.0):
+        self.path = path
+        self.sync_interval = sync_interval
+        self.lock = threading.Condition()
+        self.file_lock = threading.Lock()  # taken before ``lock``, never after
+        self.pending = []
+        self.active = False
+        self.file = None
+        self.records = 0
+        self.syncs = 0
+        self.writer = threading.Thread(target=self._write_loop, daemon=True)
+        self.writer.start()
+
+    def start(self, meeting, meeting_dir):
+        """Begin a log for a new meeting"""
+        self._begin({
+            'op': 'start',
+            'title': meeting['title'],
+            'start_time': meeting['start_time'].isoformat() if meeting['start_time'] else None,
+            'meeting_dir': meeting_dir,
+            'recording': meeting.get('recording'),
+        })
+
+    def compact(self, filename):
+        """Everything so far is saved in ``filename``; log further changes on top of it"""
+        self._begin({'op': 'base', 'file': os.path.abspath(filename)})
+
+    def _begin(self, header):
+        with self.file_lock:
+            with self.lock:
+                self.pending = []
+            self._close_file()
+            # Swap in the new log whole so a crash never leaves one without a header
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(header, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+            self.file = open(self.path, 'a', encoding='utf-8')
+            with self.lock:
+                self.active = True
+
+    def resume(self):
+        """Keep appending to a log that was just replayed"""
+        with self.file_lock:
+            self._close_file()
+            self.file = open(self.path, 'a', encoding='utf-8')
+            # Isolate a torn last line so it cannot swallow the next record
+            if self.file.tell() and not self._ends_with_newline():
+                self.file.write("\n")
+            with self.lock:
+                self.active = True
+
+    def _ends_with_newline(self):
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def append(self, op, **fields):
+        """Log one change; written to disk by the next batch (any thread)"""
+        fields['op'] = op
+        line = json.dumps(fields, ensure_ascii=False)
+        with self.lock:
+            if not self.active:
+                return
+            self.pending.append(line)
+            self.lock.notify()
+
+    def _write_loop(self):
+        while True:
+            with self.lock:
+                while not self.pending:
+                    self.lock.wait()
+            time.sleep(self.sync_interval)  # Let a batch build up
+            try:
+                self.sync()
+            except Exception as e:
+                print(f"Journal error: {e}")
+
+    def sync(self):
+        """Write and fsync everything appended so far"""
+        with self.file_lock:
+            with self.lock:
+                lines = self.pending
+                self.pending = []
+            if not lines or self.file is None:
+                return
+            self.file.write("\n".join(lines) + "\n")
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.records += len(lines)
+            self.syncs += 1
+
+    def discard(self):
+        """Drop the log once the meeting is saved or thrown away"""
+        with self.file_lock:
+            with self.lock:
+                self.pending = []
+                self.active = False
+            self._close_file()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def close(self):
+        """Flush outstanding changes and stop logging; the log is kept for recovery"""
+        with self.lock:
+            self.active = False
+        self.sync()
+        with self.file_lock:
+            self._close_file()
+
+    def _close_file(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def stats(self):
+        with self.lock:
+            return {'records': self.records, 'syncs': self.syncs, 'pending': len(self.pending)}
+
+    @classmethod
+    def replay(cls, path):
+        """Rebuild a logged meeting: ``(meeting_data, meeting_dir, changes)``.
+
+        ``meeting_data`` has the same shape as a saved meeting file.
+        Undecodable lines (a write torn by the crash) are skipped. Raises
+        OSError or ValueError if the file a ``base`` log applies to cannot
+        be read.
+        """
+        records = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+        if not records or records[0].get('op') not in ('start', 'base'):
+            return None, None, 0
+
+        header = records[0]
+        if header['op'] == 'base':
+            meeting_data = read_meeting_file(header['file'])
+            meeting_dir = os.path.dirname(header['file'])
+        else:
+            meeting_data = {
+                'title': header['title'],
+                'start_time': header['start_time'],
+                'transcript': [],
+                'summary': '',
+                'partial_summaries': [],
+                'notes': [],
+                'screenshots': [],
+                'recording': header.get('recording')
+            }
+            meeting_dir = header['meeting_dir']
+
+        for record in records[1:]:
+            op = record.get('op')
+            if op in cls.LISTS:
+                meeting_data.setdefault(cls.LISTS[op], []).append(record['entry'])
+            elif op == 'summary':
+                meeting_data['summary'] = record['summary']
+            elif op == 'partial_summaries':
+                meeting_data['partial_summaries'] = record['partials']
+        return meeting_data, meeting_dir, len(records) - 1
+
+
+INDEX_FILENAME = ".meeting_index.sqlite"
+
+
+def meeting_index_entries(meeting_data):
+    """Searchable text of a meeting as ``(kind, position, timestamp, text)`` rows"""
+    rows = [('title', 0, '', meeting_data.get('title') or '')]
+    rows += [
+        ('transcript', position, entry.get('timestamp', ''), entry.get('text', ''))
+        for position, entry in enumerate(meeting_data.get('transcript') or [])
+    ]
+    rows += [
+        ('note', position, note.get('timestamp', ''), note.get('text', ''))
+        for position, note in enumerate(meeting_data.get('notes') or [])
+    ]
+    if meeting_data.get('summary'):
+        rows.append(('summary', 0, '', meeting_data['summary']))
+    return rows
+
+
+def read_meeting_for_index(path):
+    """Parse a meeting file into what the index stores, or None if it is not one"""
+    try:
+        meeting_data = read_meeting_file(path)
+        if not isinstance(meeting_data, dict) or 'transcript' not in meeting_data:
+            return None
+        return (os.path.abspath(path), meeting_data.get('title') or '', meeting_data.get('start_time'),
+                os.path.getmtime(path), meeting_index_entries(meeting_data))
+    except (OSError, ValueError) as e:
+        print(f"Search index error: {path}: {e}")
+        return None
+
+
+class MeetingIndex:
+    """Full-text index over saved meetings, backed by SQLite FTS5.
+
+    Titles, transcript entries, notes and summaries are rows of an FTS5
+    table, so a search is answered from the inverted index and ranked by
+    BM25 without opening a single meeting file. Row ids are the meeting's id
+    shifted left by ``ROW_BITS`` plus the row number, which lets a meeting's
+    rows be replaced with one rowid range delete when it is saved again.
+    """
+
+    ROW_BITS = 24
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS meetings ("
+                "id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, title TEXT, start_time TEXT, mtime REAL)"
+            )
+            self.connection.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS meeting_text USING fts5("
+                "text, kind UNINDEXED, position UNINDEXED, timestamp UNINDEXED)"
+            )
+
+    def add(self, path, meeting_data):
+        """Index (or re-index) one saved meeting"""
+        self.store([(os.path.abspath(path), meeting_data.get('title') or '', meeting_data.get('start_time'),
+                     os.path.getmtime(path), meeting_index_entries(meeting_data))])
+
+    def store(self, meetings, replace_all=False):
+        """Write ``(path, title, start_time, mtime, entries)`` tuples in one transaction"""
+        with self.lock, self.connection:
+            if replace_all:
+                self.connection.execute("DELETE FROM meeting_text")
+                self.connection.execute("DELETE FROM meetings")
+            for path, title, start_time, mtime, entries in meetings:
+                row = self.connection.execute("SELECT id FROM meetings WHERE path = ?", (path,)).fetchone()
+                if row is None:
+                    meeting_id = self.connection.execute(
+                        "INSERT INTO meetings (path, title, start_time, mtime) VALUES (?, ?, ?, ?)",
+                        (path, title, start_time, mtime)
+                    ).lastrowid
+                else:
+                    meeting_id = row[0]
+                    self.connection.execute(
+                        "UPDATE meetings SET title = ?, start_time = ?, mtime = ? WHERE id = ?",
+                        (title, start_time, mtime, meeting_id)
+                    )
+                    self.connection.execute(
+                        "DELETE FROM meeting_text WHERE rowid BETWEEN ? AND ?",
+                        (meeting_id << self.ROW_BITS, ((meeting_id + 1) << self.ROW_BITS) - 1)
+                    )
+                base = meeting_id << self.ROW_BITS
+                self.connection.executemany(
+                    "INSERT INTO meeting_text (rowid, text, kind, position, timestamp) VALUES (?, ?, ?, ?, ?)",
+                    ((base + n, text, kind, position, timestamp)
+                     for n, (kind, position, timestamp, text) in enumerate(entries))
+                )
+
+    def rebuild(self, directory, workers=None):
+        """Re-index every meeting file in ``directory``, parsing them in parallel"""
+        files = [
+            os.path.join(directory, name) for name in sorted(os.listdir(directory))
+            if is_meeting_file(name)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            meetings = [meeting for meeting in pool.map(read_meeting_for_index, files, chunksize=16) if meeting]
+        self.store(meetings, replace_all=True)
+        return len(meetings), sum(len(meeting[4]) for meeting in meetings)
+
+    @staticmethod
+    def match_expression(query):
+        """FTS5 query for all words of ``query``, the last one also as a prefix"""
+        terms = ['"' + term.replace('"', '""') + '"' for term in query.split()]
+        if terms:
+            terms[-1] += '*'
+        return " ".join(terms)
+
+    def search(self, query, limit=200):
+        """Best matching rows across all meetings, best first"""
+        expression = self.match_expression(query)
+        if not expression:
+            return []
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT m.path, m.title, m.start_time, t.kind, t.position, t.timestamp, "
+                "snippet(meeting_text, 0, '«', '»', '…', 16) "
+                "FROM meeting_text t JOIN meetings m ON m.id = (t.rowid >> ?) "
+                "WHERE meeting_text MATCH ? ORDER BY rank LIMIT ?",
+                (self.ROW_BITS, expression, limit)
+            ).fetchall()
+        keys = ('path', 'title', 'start_time', 'kind', 'position', 'timestamp', 'snippet')
+        return [dict(zip(keys, row)) for row in rows]
+
+    def stats(self):
+        with self.lock:
+            meetings = self.connection.execute("SELECT COUNT(*) FROM meetings").fetchone()[0]
+        return {'meetings': meetings}
+
+
+THUMBNAIL_SIZE = (640, 360)
+
+
+def make_thumbnail(image, size=THUMBNAIL_SIZE):
+    """JPEG preview of an image fitted inside ``size``, as used by the viewer"""
+    thumbnail = image.convert('RGB')
+    thumbnail.thumbnail(size, Image.Resampling.BILINEAR)
+    buffer = io.BytesIO()
+    thumbnail.save(buffer, format='JPEG', quality=85)
+    return buffer.getvalue()
+
+
+def load_preview(entry, meeting_dir):
+    """Decoded preview image of a screenshot entry, building its thumbnail if needed"""
+    store = AssetStore(meeting_dir)
+    if entry.get('thumbnail') and store.contains(entry['thumbnail']):
+        data = store.read(entry['thumbnail'])
+    else:
+        data = make_thumbnail(Image.open(io.BytesIO(screenshot_bytes(entry, meeting_dir))))
+        try:
+            # Keep the preview next to the meeting for next time
+            entry['thumbnail'], _ = store.put(data, 'jpg')
+        except OSError:
+            pass
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    return image
+
+
+# Screenshots whose hashes differ in more bits are never compared pixel by pixel
+SIMILAR_HASH_BITS = 16
+# Share of thumbnail pixels that may change in a duplicate (a cursor, a clock ticking)
+DUPLICATE_CHANGED_PIXELS = 0.0005
+# Share of thumbnail pixels that must change for a new slide (an added bullet, not a caret)
+SLIDE_CHANGED_PIXELS = 0.002
+
+
+def perceptual_hash(image):
+    """256-bit difference hash (dHash) of an image, as 64 hex digits.
+
+    The image is shrunk to 17x16 grayscale and each bit records whether a pixel
+    is brighter than its right-hand neighbour. An added bullet changes only a
+    couple of bits, so the hash just picks the screenshots worth comparing
+    pixel by pixel with ``changed_fraction``.
+    """
+    small = np.asarray(image.convert('L').resize((17, 16), Image.Resampling.BOX), dtype=np.int16)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return np.packbits(bits).tobytes().hex()
+
+
+def hash_distance(first, second):
+    """Number of differing bits between two perceptual hashes (all of them for hashes of another size)"""
+    if len(first) != len(second):
+        return 4 * max(len(first), len(second))
+    return bin(int(first, 16) ^ int(second, 16)).count('1')
+
+
+def image_fingerprint(thumbnail):
+    """Grayscale pixels of a JPEG thumbnail at half size, for comparing screenshots"""
+    image = Image.open(io.BytesIO(thumbnail)).convert('L')
+    return np.asarray(image.reduce(2), dtype=np.int16)
+
+
+def changed_fraction(first, second, tolerance=24):
+    """Share of pixels that differ by more than ``tolerance`` between two fingerprints"""
+    if first.shape != second.shape:
+        return 1.0
+    return np.count_nonzero(np.abs(first - second) > tolerance) / first.size
+
+
+def screenshot_fingerprint(entry, meeting_dir):
+    """Fingerprint of a stored screenshot, from its thumbnail if there is one; None if unreadable"""
+    try:
+        store = AssetStore(meeting_dir)
+        if entry.get('thumbnail') and store.contains(entry['thumbnail']):
+            return image_fingerprint(store.read(entry['thumbnail']))
+        return image_fingerprint(make_thumbnail(Image.open(io.BytesIO(screenshot_bytes(entry, meeting_dir)))))
+    except (OSError, ValueError) as e:
+        print(f"Screenshot comparison error: {e}")
+        return None
+
+
+def similar_screenshot(screenshots, phash, fingerprint, threshold, meeting_dir):
+    """Most recent stored screenshot with at most ``threshold`` of its pixels changed.
+
+    Only screenshots within ``SIMILAR_HASH_BITS`` of ``phash`` are decoded and compared.
+    """
+    for entry in reversed(list(screenshots)):
+        if not entry.get('phash') or not entry.get('ref') or entry.get('duplicate_of'):
+            continue
+        if hash_distance(entry['phash'], phash) > SIMILAR_HASH_BITS:
+            continue
+        stored = screenshot_fingerprint(entry, meeting_dir)
+        if stored is not None and changed_fraction(stored, fingerprint) <= threshold:
+            return entry
+    return None
+
+
+def grab_screen(exclude=None, screen_width=None):
+    """Grab the whole screen, blanking out the ``exclude`` box.
+
+    ``exclude`` is ``(left, top, right, bottom)`` in Tk screen coordinates;
+    ``screen_width`` (from Tk) scales it on displays where the grab has more
+    pixels than Tk has points.
+    """
+    image = ImageGrab.grab()
+    if exclude:
+        scale = image.width / screen_width if screen_width else 1.0
+        image.paste(0, tuple(int(value * scale) for value in exclude))
+    return image
+
+
+class ScreenshotPipeline:
+    """Encodes, thumbnails and stores screenshots on worker threads.
+
+    The Tk thread only grabs the screen; ``submit`` hands the raw image over
+    and returns at once. ``image`` may also be a function that grabs it, which
+    then runs on the worker too. When the work is done the entry gets its ``ref``,
+    ``sha256``, ``thumbnail`` and perceptual hash and ``on_done(entry)`` is
+    called from the worker. Per-phase timings are kept for the latest capture
+    and in total.
+
+    If ``find_duplicate(phash, fingerprint)`` returns an earlier entry, the
+    image is not stored again: the entry points at the earlier image and
+    records it in ``duplicate_of``, or with ``drop_duplicates`` is marked
+    ``discarded``. ``fingerprint`` is the ``image_fingerprint`` of the new
+    thumbnail.
+    """
+
+    # Format name -> (file extension, PIL save options)
+    FORMATS = {
+        'PNG': ('png', {'compress_level': 6}),
+        'WEBP': ('webp', {'quality': 85, 'method': 4}),
+        'JPEG': ('jpg', {'quality': 90}),
+    }
+
+    def __init__(self, max_workers=2):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="screenshot")
+        self.lock = threading.Lock()
+        self.futures = set()
+        self.captures = 0
+        self.duplicates = 0
+        self.last_timings = {}
+        self.total_timings = {}
+
+    def submit(self, image, entry, store, image_format='PNG', grab_ms=0.0, on_done=None,
+               find_duplicate=None, drop_duplicates=False):
+        """Queue a grabbed image for encoding and storage"""
+        future = self.executor.submit(
+            self._process, image, entry, store, image_format, grab_ms, on_done, find_duplicate, drop_duplicates
+        )
+        with self.lock:
+            self.futures.add(future)
+        future.add_done_callback(self._forget)
+        return future
+
+    def _forget(self, future):
+        with self.lock:
+            self.futures.discard(future)
+
+    def wait(self):
+        """Block until every queued screenshot has been stored"""
+        with self.lock:
+            pending = list(self.futures)
+        wait_futures(pending)
+
+    def encode(self, image, image_format):
+        """Encode an image; returns ``(bytes, extension)``"""
+        ext, options = self.FORMATS[image_format]
+        if image_format == 'JPEG' and image.mode != 'RGB':
+            image = image.convert('RGB')
+        buffer = io.BytesIO()
+        image.save(buffer, format=image_format, **options)
+        return buffer.getvalue(), ext
+
+    def _process(self, image, entry, store, image_format, grab_ms, on_done, find_duplicate, drop_duplicates):
+        try:
+            if callable(image):
+                started = time.perf_counter()
+                image = image()
+                grab_ms = (time.perf_counter() - started) * 1000
+            started = time.perf_counter()
+            entry['phash'] = perceptual_hash(image)
+            thumbnail = make_thumbnail(image)
+            thumbnailed = time.perf_counter()
+            original = find_duplicate(entry['phash'], image_fingerprint(thumbnail)) if find_duplicate else None
+            if original is not None:
+                if drop_duplicates:
+                    entry['discarded'] = True
+                else:
+                    entry.update({
+                        'ref': original['ref'],
+                        'sha256': original.get('sha256'),
+                        'thumbnail': original.get('thumbnail'),
+                        'duplicate_of': original['filename'],
+                    })
+                with self.lock:
+                    self.duplicates += 1
+                return
+
+            compared = time.perf_counter()
+            data, ext = self.encode(image, image_format)
+            encoded = time.perf_counter()
+            ref, digest = store.put(data, ext)
+            thumbnail_ref, _ = store.put(thumbnail, 'jpg')
+            persisted = time.perf_counter()
+
+            entry.update({'ref': ref, 'sha256': digest, 'thumbnail': thumbnail_ref})
+            self._record({
+                'grab_ms': grab_ms,
+                'thumbnail_ms': (thumbnailed - started) * 1000,
+                'encode_ms': (encoded - compared) * 1000,
+                'persist_ms': (persisted - encoded) * 1000,
+            })
+        except Exception as e:
+            print(f"Error saving screenshot: {e}")
+            entry['error'] = str(e)
+        finally:
+            entry.pop('pending', None)
+            if on_done:
+                on_done(entry)
+
+    def _record(self, timings):
+        for phase, value in timings.items():
+            TELEMETRY.observe(f"screenshot_{phase[:-3]}", value)
+        with self.lock:
+            self.captures += 1
+            self.last_timings = timings
+            for phase, value in timings.items():
+                self.total_timings[phase] = self.total_timings.get(phase, 0.0) + value
+
+    def stats(self):
+        """Timing of the last capture and average per phase, in milliseconds"""
+        with self.lock:
+            averages = {
+                f"avg_{phase}": total / self.captures for phase, total in self.total_timings.items()
+            } if self.captures else {}
+            return {
+                'captures': self.captures,
+                'duplicates': self.duplicates,
+                'pending': len(self.futures),
+                **self.last_timings,
+                **averages,
+            }
+
+
+class PhotoImageCache:
+    """LRU cache of Tk images, bounded by their decoded size in bytes"""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.images = OrderedDict()
+        self.size = 0
+
+    def get(self, key):
+        photo = self.images.get(key)
+        if photo is not None:
+            self.images.move_to_end(key)
+        return photo
+
+    def put(self, key, photo, keep=()):
+        """Add an image, evicting the least recently used ones except ``keep``"""
+        if key in self.images:
+            self.size -= self._bytes(self.images.pop(key))
+        self.images[key] = photo
+        self.size += self._bytes(photo)
+        for old_key in list(self.images):
+            if self.size <= self.max_bytes:
+                break
+            if old_key == key or old_key in keep:
+                continue
+            self.size -= self._bytes(self.images.pop(old_key))
+
+    def clear(self):
+        self.images.clear()
+        self.size = 0
+
+    @staticmethod
+    def _bytes(photo):
+        return photo.width() * photo.height() * 4
+
+
+class BatchedTextRenderer:
+    """Coalesces appends to a textbox into one insert per frame interval.
+
+    ``append`` may be called from any thread; pending text is inserted by a
+    single ``root.after`` callback every ``interval_ms``. With ``max_lines``
+    set the textbox keeps only that many trailing lines while the view is
+    following the end; ``first_line`` counts the lines dropped from the top
+    so callers can page older entries back in with ``prepend``.
+    """
+
+    def __init__(self, root, textbox, interval_ms=100, max_lines=None, on_change=None, metric=None):
+        self.root = root
+        self.textbox = textbox
+        self.interval_ms = interval_ms
+        self.max_lines = max_lines
+        self.on_change = on_change
+        self.metric = metric  # telemetry stage timed for each flush
+        self.lock = threading.Lock()
+        self.pending = []
+        self.scheduled = False
+        self.first_line = 0
+
+    def append(self, text, tag=None):
+        """Queue text for the next batched insert"""
+        with self.lock:
+            self.pending.append((text, tag))
+            if self.scheduled:
+                return
+            self.scheduled = True
+        self.root.after(self.interval_ms, self.flush)
+
+    def flush(self):
+        """Insert everything queued so far (Tk thread)"""
+        with self.lock:
+            pending = self.pending
+            self.pending = []
+            self.scheduled = False
+        if not pending:
+            return
+
+        started = time.perf_counter()
+        following = self.textbox.yview()[1] >= 0.999
+        # One insert per run of equally tagged text, usually just one
+        run_text, run_tag = [], pending[0][1]
+        for text, tag in pending + [(None, None)]:
+            if text is None or tag != run_tag:
+                self.textbox.insert("end", "".join(run_text), run_tag)
+                run_text, run_tag = [], tag
+            if text is not None:
+                run_text.append(text)
+
+        if following:
+            self.trim()
+            self.textbox.see("end")
+        self.changed()
+        if self.metric:
+            TELEMETRY.observe(self.metric, (time.perf_counter() - started) * 1000)
+
+    def trim(self):
+        """Drop lines from the top beyond the scrollback limit"""
+        if not self.max_lines:
+            return
+        excess = self.line_count() - self.max_lines
+        if excess > 0:
+            self.textbox.delete("1.0", f"{excess + 1}.0")
+            self.first_line += excess
+
+    def line_count(self):
+        return int(self.textbox.index("end-1c").split(".")[0]) - 1
+
+    def set_lines(self, lines):
+        """Replace the content, showing only the newest ``max_lines`` lines"""
+        with self.lock:
+            self.pending = []
+        shown = lines[-self.max_lines:] if self.max_lines else lines
+        self.first_line = len(lines) - len(shown)
+        self.textbox.delete("1.0", "end")
+        self.textbox.insert("1.0", "".join(shown))
+        self.textbox.see("end")
+        self.changed()
+
+    def prepend(self, lines):
+        """Page older lines back in above the current content"""
+        self.textbox.insert("1.0", "".join(lines))
+        self.first_line -= len(lines)
+        self.changed()
+
+    def clear(self):
+        self.set_lines([])
+
+    def changed(self):
+        if self.on_change:
+            self.on_change(self)
+
+
+class ScreenshotViewer:
+    """Scrollable screenshot list that only builds the rows in view.
+
+    Rows have a fixed height, so the visible range follows directly from
+    the scroll position. Previews are read (or generated and saved next to
+    the meeting) by a background worker and turned into PhotoImages on the
+    Tk thread; decoded previews live in a shared memory-bounded LRU cache,
+    so reopening the viewer is instant for recently seen screenshots.
+    """
+
+    ROW_HEIGHT = THUMBNAIL_SIZE[1] + 60
+    OVERSCAN = 2
+
+    def __init__(self, app, screenshots, meeting_dir, cache, loader):
+        self.app = app
+        self.screenshots = list(screenshots)
+        self.meeting_dir = meeting_dir
+        self.cache = cache
+        self.loader = loader
+        self.rows = {}  # index -> canvas item ids
+        self.requested = set()
+        self.closed = False
+
+        self.window = ctk.CTkToplevel(app.root)
+        self.window.title("🖼️ Screenshot Viewer")
+        self.window.geometry("800x600")
+        self.window.resizable(True, True)
+
+        # Make it modal
+        self.window.transient(app.root)
+        self.window.grab_set()
+
+        # Center the window
+        self.window.geometry("+%d+%d" % (app.root.winfo_rootx() + 50, app.root.winfo_rooty() + 50))
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        title_label = ctk.CTkLabel(
+            self.window,
+            text=f"📸 Meeting Screenshots ({len(self.screenshots)})",
+            font=ctk.CTkFont(size=24, weight="bold"),
+            text_color=("#4a9eff", "#66b3ff")
+        )
+        title_label.pack(pady=(20, 10))
+
+        body = ctk.CTkFrame(self.window, fg_color=("#3a3a3a", "#2a2a2a"), corner_radius=10)
+        body.pack(fill="both", expand=True, padx=20, pady=(0, 10))
+        self.canvas = tk.Canvas(body, bg="#2a2a2a", highlightthickness=0)
+        scrollbar = ctk.CTkScrollbar(body, command=self.scroll)
+        scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True, padx=10, pady=10)
+        self.canvas.configure(
+            yscrollcommand=scrollbar.set,
+            yscrollincrement=self.ROW_HEIGHT // 4,
+            scrollregion=(0, 0, 0, len(self.screenshots) * self.ROW_HEIGHT)
+        )
+
+        self.canvas.bind("<Configure>", lambda event: self.refresh())
+        self.canvas.bind("<MouseWheel>", self.on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda event: self.scroll("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda event: self.scroll("scroll", 1, "units"))
+
+        close_button = ctk.CTkButton(
+            self.window, 
+            text="Close Viewer", 
+            command=self.close,
+            fg_color=("#4a9eff", "#66b3ff"),
+            hover_color=("#1976d2", "#4a9eff"),
+            height=40,
+            font=ctk.CTkFont(size=14, weight="bold"),
+            corner_radius=10
+        )
+        close_button.pack(pady=(0, 20))
+
+        # Focus on the viewer window
+        self.window.focus_set()
+
+    def scroll(self, *args):
+        self.canvas.yview(*args)
+        self.refresh()
+
+    def on_mousewheel(self, event):
+        self.scroll("scroll", -1 if event.delta > 0 else 1, "units")
+
+    def visible_range(self):
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first = max(0, int(top // self.ROW_HEIGHT) - self.OVERSCAN)
+        last = min(len(self.screenshots), int(bottom // self.ROW_HEIGHT) + 1 + self.OVERSCAN)
+        return range(first, last)
+
+    def refresh(self):
+        """Build rows that scrolled into view and drop the ones that left it"""
+        if self.closed:
+            return
+        visible = self.visible_range()
+        for index in [index for index in self.rows if index not in visible]:
+            for item in self.rows.pop(index):
+                self.canvas.delete(item)
+        for index in visible:
+            if index not in self.rows:
+                self.draw_row(index)
+
+    def cache_key(self, index):
+        entry = self.screenshots[index]
+        return entry.get('sha256') or entry.get('thumbnail') or f"{self.meeting_dir}:{index}"
+
+    def draw_row(self, index):
+        entry = self.screenshots[index]
+        top = index * self.ROW_HEIGHT
+        label = f"📸 {entry['timestamp']} - {entry['filename']}"
+        if entry.get('duplicate_of'):
+            label += f" (same as {entry['duplicate_of']})"
+        items = [self.canvas.create_text(
+            10, top + 20, text=label, anchor="w", fill="#66bb6a", font=("TkDefaultFont", 14, "bold")
+        )]
+
+        photo = self.cache.get(self.cache_key(index))
+        if photo is not None:
+            items.append(self.place_image(index, photo))
+        else:
+            items.append(self.canvas.create_text(
+                10 + THUMBNAIL_SIZE[0] // 2, top + 40 + THUMBNAIL_SIZE[1] // 2, text="Loading...", fill="#aaaaaa"
+            ))
+            if index not in self.requested:
+                self.requested.add(index)
+                self.loader.submit(self.load_preview, index)
+        self.rows[index] = items
+
+    def place_image(self, index, photo):
+        item = self.canvas.create_image(10, index * self.ROW_HEIGHT + 40, image=photo, anchor="nw")
+        self.canvas.tag_bind(item, "<Button-1>", lambda event: self.show_full_size(index))
+        return item
+
+    def load_preview(self, index):
+        """Read or build the preview for a row (worker thread)"""
+        try:
+            image = load_preview(self.screenshots[index], self.meeting_dir)
+            error = None
+        except Exception as e:
+            image, error = None, e
+        self.app.root.after(0, self.preview_ready, index, image, error)
+
+    def preview_ready(self, index, image, error):
+        """Show a loaded preview if its row is still on screen (Tk thread)"""
+        self.requested.discard(index)
+        if self.closed:
+            return
+        if image is not None:
+            photo = ImageTk.PhotoImage(image)
+            visible_keys = {self.cache_key(i) for i in self.rows}
+            self.cache.put(self.cache_key(index), photo, keep=visible_keys)
+        if index not in self.rows:
+            return
+        placeholder = self.rows[index].pop()
+        self.canvas.delete(placeholder)
+        if image is not None:
+            self.rows[index].append(self.place_image(index, photo))
+        else:
+            self.rows[index].append(self.canvas.create_text(
+                10, index * self.ROW_HEIGHT + 60, text=f"❌ Error displaying image: {str(error)}",
+                anchor="w", fill="#ff7676"
+            ))
+
+    def show_full_size(self, index):
+        """Open one screenshot at full resolution (fitted to the screen)"""
+        entry = self.screenshots[index]
+        try:
+            img = Image.open(io.BytesIO(screenshot_bytes(entry, self.meeting_dir)))
+            img.thumbnail((self.window.winfo_screenwidth() - 100, self.window.winfo_screenheight() - 150), Image.Resampling.LANCZOS)
+        except Exception as e:
+            messagebox.showerror("Error", f"Error displaying image: {str(e)}")
+            return
+        full_window = ctk.CTkToplevel(self.window)
+        full_window.title(f"📸 {entry['filename']}")
+        full_window.transient(self.window)
+        photo = ImageTk.PhotoImage(img)
+        img_label = ctk.CTkLabel(full_window, image=photo, text="")
+        img_label.image = photo  # Keep a reference
+        img_label.pack(padx=10, pady=10)
+        full_window.focus_set()
+
+    def close(self):
+        self.closed = True
+        self.window.destroy()
+
+
 class MeetingSummarizer:
     def __init__(self):
         # Set up OpenAI API
         self.api_key = os.getenv('OPENAI_API_KEY')
-        if self.api_key:
-            openai.api_key = self.api_key
+        self.summary_cache = SummaryCache('.summary_cache.sqlite')
+        self.summary_client = SummaryClient(self.api_key, "gpt-3.5-turbo", self.summary_cache)
         
-        # Initialize speech recognition
-        self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
+        # Initialize speech recognition (the engine itself loads on first use)
+        self.recognizer_backend = create_recognizer_backend(os.getenv('RECOGNIZER_BACKEND', 'google'))
+        self.engine_error_backend = None  # Engine whose setup failure was already shown
         
         # Audio recording variables
         self.is_recording = False
-        self.audio_data = []
         self.sample_rate = 44100
+        self.chunk_encoder = ChunkEncoder(self.sample_rate, self.recognizer_backend.sample_rate)
+        self.chunk_seconds = 5
+        self.capture_window_seconds = 60  # how much audio the capture buffer holds
+        self.capture_buffer = AudioRingBuffer(self.sample_rate * self.capture_window_seconds)
+        self.vad_enabled = True  # cut chunks at pauses and skip silence
+        self.chunk_dispatcher = ChunkDispatcher(self.capture_buffer, self.create_segmenter())
+        self.recognizer_workers = 3
+        self.transcription_pool = TranscriptionWorkerPool(
+            self.recognize_chunk, self.add_transcript_result, max_workers=self.recognizer_workers
+        )
         self.recording_thread = None
+        self.transcribe_thread = None
+        
+        # The capture is also streamed to disk so passages can be replayed
+        self.audio_recorder = AudioRecorder(self.capture_buffer, self.sample_rate, target_rate=16000)
         
         # Meeting data
         self.current_meeting = {
@@ -42,12 +3037,88 @@ class MeetingSummarizer:
             'start_time': None,
             'transcript': [],
             'summary': '',
+            'partial_summaries': [],
             'notes': [],
-            'screenshots': []
+            'screenshots': [],
+            'recording': None
         }
         
+        # Folder that screenshot references of the current meeting resolve against
+        self.meeting_dir = os.getcwd()
+        
+        # Screenshots are encoded and stored off the Tk thread
+        self.screenshot_format = os.getenv('SCREENSHOT_FORMAT', 'PNG').upper()
+        if self.screenshot_format not in ScreenshotPipeline.FORMATS:
+            self.screenshot_format = 'PNG'
+        
+        # Meeting file format; formats whose library is missing fall back to JSON
+        self.meeting_format = create_meeting_serializer(os.getenv('MEETING_FORMAT', 'orjson')).name
+        self.meeting_compression = os.getenv('MEETING_COMPRESSION', 'none')
+        if self.meeting_compression not in MEETING_COMPRESSIONS or not compression_available(self.meeting_compression):
+            self.meeting_compression = 'none'
+        self.screenshot_delay_ms = 300  # time for the window to minimize
+        self.screenshot_pipeline = ScreenshotPipeline()
+        
+        # Transcript textbox holds a bounded window of the newest entries
+        self.transcript_scrollback = 2000
+        self.transcript_page_size = 500
+        
+        # Screenshot viewer previews: decoded in the background, kept in an LRU cache
+        self.preview_cache = PhotoImageCache()
+        self.preview_loader = ThreadPoolExecutor(max_workers=2, thread_name_prefix="preview")
+        
+        # Near-identical screenshots are stored as references to the first one
+        self.duplicate_threshold = DUPLICATE_CHANGED_PIXELS  # max share of changed pixels for a duplicate
+        self.auto_capture = False
+        self.auto_capture_interval_ms = 3000
+        self.slide_change_threshold = SLIDE_CHANGED_PIXELS  # min share of changed pixels for a new slide
+        self.slides_in_flight = []  # (entry, fingerprint) of accepted slides that are still being stored
+        self.slides_lock = threading.Lock()
+        
+        # Summarize the transcript window by window while recording
+        self.rolling_summarizer = RollingSummarizer(self.summary_client.chat_completion, on_update=self.partial_summaries_updated)
+        
+        # Every change is logged as it happens so a crash loses at most a second
+        self.journal = MeetingJournal(JOURNAL_FILENAME)
+        
+        # Saved meetings are listed from a metadata catalog and searchable from a full-text index
+        self.meeting_index = MeetingIndex(INDEX_FILENAME)
+        self.meeting_catalog = MeetingCatalog(CATALOG_FILENAME)
+        self.index_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="index")
+        self.search_results = []
+        
+        # Pipeline telemetry, exported for Prometheus and shown in the Diagnostics tab
+        TELEMETRY.gauges = self.component_stats
+        self.metrics_interval_ms = 15000
+        self.diagnostics_interval_ms = 1000
+        self.diagnostics_refresh = None
+        
+        # Final summary runs on a background thread and streams into the UI
+        self.summary_thread = None
+        self.save_thread = None
+        self.ui_closed = False
+        self.loading_meeting = None
+        self.load_started = 0.0
+        self.load_cancel = threading.Event()
+        self.summary_cancel = threading.Event()
+        self.summary_stream_lock = threading.Lock()
+        self.summary_stream_buffer = []
+        self.summary_generation = 0  # Bumped when the meeting is cleared; older runs are ignored
+        self.summary_flush_ms = 50
+        
+        STARTUP_PROFILE.mark("app state")
+        
         # Setup GUI
         self.setup_gui()
+        STARTUP_PROFILE.mark("GUI")
+        
+        # Load the heavy modules and audio devices once the window is up
+        self.prewarm_thread = None
+        self.root.after(0, self.window_shown)
+        
+        # Offer to restore a meeting left unsaved by a crash
+        self.root.after(0, self.recover_journal)
+        self.root.after(self.metrics_interval_ms, self.export_metrics)
         
     def setup_gui(self):
         # Configure customtkinter with modern theme
@@ -261,7 +3332,21 @@ class MeetingSummarizer:
             font=ctk.CTkFont(size=20, weight="bold"),
             text_color=("#4a9eff", "#66b3ff")
         )
-        transcript_title.pack(anchor="w")
+        transcript_title.pack(side="left")
+        
+        # Older entries beyond the scrollback window are paged in on request
+        self.earlier_button = ctk.CTkButton(
+            transcript_header,
+            text="⬆️ Show Earlier Entries",
+            command=self.show_earlier_transcript,
+            fg_color=("#607d8b", "#90a4ae"),
+            hover_color=("#455a64", "#607d8b"),
+            height=32,
+            font=ctk.CTkFont(size=13, weight="bold"),
+            corner_radius=10,
+            state="disabled"
+        )
+        self.earlier_button.pack(side="right")
         
         # Modern transcript text area
         self.transcript_text = ctk.CTkTextbox(
@@ -276,6 +3361,13 @@ class MeetingSummarizer:
         )
         self.transcript_text.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
+        # Double-click an entry to hear that passage of the recording
+        self.transcript_text.bind("<Double-Button-1>", self.play_transcript_entry)
+        self.transcript_renderer = BatchedTextRenderer(
+            self.root, self.transcript_text, max_lines=self.transcript_scrollback,
+            on_change=self.update_earlier_button, metric='transcript_render'
+        )
+        
         # Summary tab with modern design
         summary_frame = ctk.CTkFrame(self.notebook, fg_color=("#2b2b2b", "#1a1a1a"), corner_radius=15)
         self.notebook.add(summary_frame, text="🤖 AI Summary")
@@ -359,6 +3451,19 @@ class MeetingSummarizer:
         )
         screenshot_button.pack(side="right", padx=(0, 10))
         
+        # Automatic slide-change capture toggle
+        self.auto_capture_button = ctk.CTkButton(
+            notes_input_frame, 
+            text="🎞️ Auto Capture: Off", 
+            command=self.toggle_auto_capture,
+            fg_color=("#607d8b", "#90a4ae"),
+            hover_color=("#455a64", "#607d8b"),
+            height=45,
+            font=ctk.CTkFont(size=14, weight="bold"),
+            corner_radius=10
+        )
+        self.auto_capture_button.pack(side="right", padx=(0, 10))
+        
         # Modern add note button
         add_note_button = ctk.CTkButton(
             notes_input_frame, 
@@ -384,6 +3489,7 @@ class MeetingSummarizer:
             border_width=1
         )
         self.notes_text.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        self.notes_renderer = BatchedTextRenderer(self.root, self.notes_text)
         
         # Screenshot viewer button
         view_screenshots_button = ctk.CTkButton(
@@ -398,6 +3504,159 @@ class MeetingSummarizer:
         )
         view_screenshots_button.pack(pady=(0, 20))
         
+        # Search tab: full-text search across all saved meetings
+        search_frame = ctk.CTkFrame(self.notebook, fg_color=("#2b2b2b", "#1a1a1a"), corner_radius=15)
+        self.notebook.add(search_frame, text="🔍 Search")
+        
+        # Search header
+        search_header = ctk.CTkFrame(search_frame, fg_color="transparent")
+        search_header.pack(fill="x", padx=20, pady=(20, 10))
+        
+        search_title = ctk.CTkLabel(
+            search_header,
+            text="🔎 Search All Saved Meetings",
+            font=ctk.CTkFont(size=20, weight="bold"),
+            text_color=("#00bcd4", "#26c6da")
+        )
+        search_title.pack(anchor="w")
+        
+        # Search input section
+        search_input_frame = ctk.CTkFrame(search_frame, fg_color="transparent")
+        search_input_frame.pack(fill="x", padx=20, pady=(0, 20))
+        
+        self.search_entry = ctk.CTkEntry(
+            search_input_frame, 
+            placeholder_text="Search titles, transcripts, notes and summaries...",
+            height=45,
+            font=ctk.CTkFont(size=14),
+            fg_color=("#3a3a3a", "#2a2a2a"),
+            border_color=("#00bcd4", "#26c6da"),
+            border_width=2,
+            corner_radius=10
+        )
+        self.search_entry.pack(side="left", fill="x", expand=True, padx=(0, 15))
+        self.search_entry.bind("<Return>", lambda event: self.run_search())
+        
+        reindex_button = ctk.CTkButton(
+            search_input_frame, 
+            text="🔄 Rebuild Index", 
+            command=self.rebuild_search_index,
+            fg_color=("#607d8b", "#90a4ae"),
+            hover_color=("#455a64", "#607d8b"),
+            height=45,
+            font=ctk.CTkFont(size=14, weight="bold"),
+            corner_radius=10
+        )
+        reindex_button.pack(side="right", padx=(10, 0))
+        
+        search_button = ctk.CTkButton(
+            search_input_frame, 
+            text="🔍 Search", 
+            command=self.run_search,
+            fg_color=("#00bcd4", "#26c6da"),
+            hover_color=("#0097a7", "#00bcd4"),
+            height=45,
+            font=ctk.CTkFont(size=14, weight="bold"),
+            corner_radius=10
+        )
+        search_button.pack(side="right")
+        
+        # Ranked hits; double-click one to open the meeting at that entry
+        style.configure('Treeview', background='#2a2a2a', fieldbackground='#2a2a2a', foreground='white',
+                        rowheight=28, borderwidth=0)
+        style.configure('Treeview.Heading', background='#3a3a3a', foreground='white', borderwidth=0)
+        style.map('Treeview', background=[('selected', '#4a9eff')])
+        
+        self.search_tree = ttk.Treeview(search_frame, columns=("meeting", "time", "match"), show="headings")
+        self.search_tree.heading("meeting", text="Meeting")
+        self.search_tree.heading("time", text="Time")
+        self.search_tree.heading("match", text="Match")
+        self.search_tree.column("meeting", width=220, stretch=False)
+        self.search_tree.column("time", width=150, stretch=False)
+        self.search_tree.column("match", width=600)
+        self.search_tree.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        self.search_tree.bind("<Double-1>", lambda event: self.open_search_result())
+        
+        # Where each kind of hit is shown once its meeting is open
+        self.result_tabs = {
+            'title': transcript_frame,
+            'transcript': transcript_frame,
+            'summary': summary_frame,
+            'note': notes_frame,
+        }
+        
+        # Library tab: every meeting in the folder, listed from the catalog
+        library_frame = ctk.CTkFrame(self.notebook, fg_color=("#2b2b2b", "#1a1a1a"), corner_radius=15)
+        self.notebook.add(library_frame, text="📚 Library")
+        self.library_frame = library_frame
+        
+        # Library header
+        library_header = ctk.CTkFrame(library_frame, fg_color="transparent")
+        library_header.pack(fill="x", padx=20, pady=(20, 10))
+        
+        library_title = ctk.CTkLabel(
+            library_header,
+            text="📚 Meeting Library",
+            font=ctk.CTkFont(size=20, weight="bold"),
+            text_color=("#8bc34a", "#9ccc65")
+        )
+        library_title.pack(side="left")
+        
+        refresh_library_button = ctk.CTkButton(
+            library_header,
+            text="🔄 Refresh",
+            command=self.refresh_library,
+            fg_color=("#607d8b", "#90a4ae"),
+            hover_color=("#455a64", "#607d8b"),
+            height=32,
+            font=ctk.CTkFont(size=13, weight="bold"),
+            corner_radius=10
+        )
+        refresh_library_button.pack(side="right")
+        
+        # Double-click a meeting to open it
+        library_columns = {
+            "title": ("Title", 300), "date": ("Date", 150), "duration": ("Duration", 90),
+            "entries": ("Entries", 80), "notes": ("Notes", 70), "screenshots": ("Screenshots", 100),
+            "summary": ("Summary", 80), "size": ("Size", 90),
+        }
+        self.library_tree = ttk.Treeview(library_frame, columns=tuple(library_columns), show="headings")
+        for column, (heading, width) in library_columns.items():
+            self.library_tree.heading(column, text=heading)
+            self.library_tree.column(column, width=width, stretch=column == "title")
+        self.library_tree.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        self.library_tree.bind("<Double-1>", lambda event: self.open_library_meeting())
+        self.notebook.bind("<<NotebookTabChanged>>", self.tab_changed)
+        
+        # Diagnostics tab: live pipeline latencies and counters
+        diagnostics_frame = ctk.CTkFrame(self.notebook, fg_color=("#2b2b2b", "#1a1a1a"), corner_radius=15)
+        self.notebook.add(diagnostics_frame, text="📊 Diagnostics")
+        self.diagnostics_frame = diagnostics_frame
+        
+        # Diagnostics header
+        diagnostics_header = ctk.CTkFrame(diagnostics_frame, fg_color="transparent")
+        diagnostics_header.pack(fill="x", padx=20, pady=(20, 10))
+        
+        diagnostics_title = ctk.CTkLabel(
+            diagnostics_header,
+            text="📊 Pipeline Diagnostics",
+            font=ctk.CTkFont(size=20, weight="bold"),
+            text_color=("#e91e63", "#f06292")
+        )
+        diagnostics_title.pack(anchor="w")
+        
+        self.diagnostics_text = ctk.CTkTextbox(
+            diagnostics_frame, 
+            wrap="none",
+            fg_color=("#3a3a3a", "#2a2a2a"),
+            text_color=("#ffffff", "#ffffff"),
+            font=ctk.CTkFont(family="Courier New", size=13),
+            corner_radius=10,
+            border_color=("#e91e63", "#f06292"),
+            border_width=1
+        )
+        self.diagnostics_text.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        
         # Settings tab with modern design
         settings_frame = ctk.CTkFrame(self.notebook, fg_color=("#2b2b2b", "#1a1a1a"), corner_radius=15)
         self.notebook.add(settings_frame, text="⚙️ Settings")
@@ -467,6 +3726,89 @@ class MeetingSummarizer:
         )
         save_api_button.pack(side="right")
         
+        # Speech recognition engine setting
+        engine_frame = ctk.CTkFrame(settings_frame, fg_color=("#3a3a3a", "#2a2a2a"), corner_radius=10)
+        engine_frame.pack(fill="x", padx=20, pady=(0, 20))
+        
+        engine_header = ctk.CTkLabel(
+            engine_frame,
+            text="🎤 Speech Recognition Engine",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            text_color=("#4a9eff", "#66b3ff")
+        )
+        engine_header.pack(anchor="w", padx=20, pady=(20, 15))
+        
+        self.engine_menu = ctk.CTkOptionMenu(
+            engine_frame,
+            values=[backend.label for backend in RECOGNIZER_BACKENDS.values()],
+            command=self.select_recognizer_backend,
+            height=40,
+            font=ctk.CTkFont(size=14),
+            corner_radius=10
+        )
+        self.engine_menu.set(self.recognizer_backend.label)
+        self.engine_menu.pack(anchor="w", padx=20, pady=(0, 20))
+        
+        # Screenshot format setting
+        screenshot_frame = ctk.CTkFrame(settings_frame, fg_color=("#3a3a3a", "#2a2a2a"), corner_radius=10)
+        screenshot_frame.pack(fill="x", padx=20, pady=(0, 20))
+        
+        screenshot_header = ctk.CTkLabel(
+            screenshot_frame,
+            text="📸 Screenshot Format",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            text_color=("#4a9eff", "#66b3ff")
+        )
+        screenshot_header.pack(anchor="w", padx=20, pady=(20, 15))
+        
+        self.screenshot_format_menu = ctk.CTkOptionMenu(
+            screenshot_frame,
+            values=list(ScreenshotPipeline.FORMATS),
+            command=self.select_screenshot_format,
+            height=40,
+            font=ctk.CTkFont(size=14),
+            corner_radius=10
+        )
+        self.screenshot_format_menu.set(self.screenshot_format)
+        self.screenshot_format_menu.pack(anchor="w", padx=20, pady=(0, 20))
+        
+        # Meeting file format setting
+        file_format_frame = ctk.CTkFrame(settings_frame, fg_color=("#3a3a3a", "#2a2a2a"), corner_radius=10)
+        file_format_frame.pack(fill="x", padx=20, pady=(0, 20))
+        
+        file_format_header = ctk.CTkLabel(
+            file_format_frame,
+            text="💾 Meeting File Format",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            text_color=("#4a9eff", "#66b3ff")
+        )
+        file_format_header.pack(anchor="w", padx=20, pady=(20, 15))
+        
+        file_format_row = ctk.CTkFrame(file_format_frame, fg_color="transparent")
+        file_format_row.pack(fill="x", padx=20, pady=(0, 20))
+        
+        self.meeting_format_menu = ctk.CTkOptionMenu(
+            file_format_row,
+            values=[serializer.label for serializer in MEETING_FORMATS.values() if serializer.available()],
+            command=self.select_meeting_format,
+            height=40,
+            font=ctk.CTkFont(size=14),
+            corner_radius=10
+        )
+        self.meeting_format_menu.set(MEETING_FORMATS[self.meeting_format].label)
+        self.meeting_format_menu.pack(side="left", padx=(0, 10))
+        
+        self.meeting_compression_menu = ctk.CTkOptionMenu(
+            file_format_row,
+            values=[name for name in MEETING_COMPRESSIONS if compression_available(name)],
+            command=self.select_meeting_compression,
+            height=40,
+            font=ctk.CTkFont(size=14),
+            corner_radius=10
+        )
+        self.meeting_compression_menu.set(self.meeting_compression)
+        self.meeting_compression_menu.pack(side="left")
+        
         # Instructions section with modern design
         instructions_frame = ctk.CTkFrame(settings_frame, fg_color=("#3a3a3a", "#2a2a2a"), corner_radius=10)
         instructions_frame.pack(fill="x", padx=20, pady=(0, 20))
@@ -530,6 +3872,7 @@ class MeetingSummarizer:
         file_menu.add_command(label="📂 Load Meeting", command=self.load_meeting)
         file_menu.add_command(label="💾 Save Meeting", command=self.save_meeting)
         file_menu.add_command(label="💾 Save As", command=self.save_meeting_as)
+        file_menu.add_command(label="📚 Meeting Library", command=lambda: self.notebook.select(self.library_frame))
         file_menu.add_separator()
         file_menu.add_command(label="🔄 New Meeting", command=self.clear_old_recording)
         
@@ -545,6 +3888,10 @@ class MeetingSummarizer:
         help_menu.add_separator()
         help_menu.add_command(label="ℹ️ About", command=self.show_about)
         
+    def create_segmenter(self):
+        """Build the chunking strategy for live transcription"""
+        return create_segmenter(self.sample_rate, self.vad_enabled, self.chunk_seconds)
+    
     def toggle_recording(self):
         if not self.is_recording:
             self.start_recording()
@@ -553,23 +3900,41 @@ class MeetingSummarizer:
     
     def clear_old_recording(self):
         """Clear old recording data and reset interface"""
+        # The last recording's transcriber has to be done with the chunk queue before it is reset
+        if not self.is_recording:
+            for thread in (self.recording_thread, self.transcribe_thread):
+                if thread:
+                    thread.join()
+        
         # Clear audio data
-        self.audio_data = []
+        self.capture_buffer.reset()
+        self.chunk_dispatcher.reset()
+        
+        # Partial summaries still running belong to the old meeting, and so does an AI summary
+        self.rolling_summarizer.reset()
+        self.drop_summary_run()
+        
+        # Stop logging: changes to the next meeting must not land on top of this one's log,
+        # which is kept until a recording or a loaded file begins a new one
+        self.journal.close()
         
         # Clear transcript text
-        self.transcript_text.delete("1.0", "end")
+        self.transcript_renderer.clear()
         
         # Clear summary text
         self.summary_text.delete("1.0", "end")
         
         # Clear notes text
-        self.notes_text.delete("1.0", "end")
+        self.notes_renderer.clear()
         
         # Reset meeting data
         self.current_meeting['transcript'] = []
         self.current_meeting['summary'] = ''
+        self.current_meeting['partial_summaries'] = []
         self.current_meeting['notes'] = []
         self.current_meeting['screenshots'] = []
+        self.current_meeting['recording'] = None
+        self.meeting_dir = os.getcwd()
         
         # Reset button states
         self.summary_button.configure(state="disabled")
@@ -583,6 +3948,14 @@ class MeetingSummarizer:
         if not self.title_entry.get().strip():
             messagebox.showerror("Error", "Please enter a meeting title first!")
             return
+        if self.block_while_busy():
+            return
+        if self.transcribe_thread and self.transcribe_thread.is_alive():
+            messagebox.showwarning("Transcribing", "The last recording is still being transcribed, please wait a moment.")
+            return
+        if not self.recognizer_backend.available():
+            self.show_missing_engine(self.recognizer_backend)
+            return
         
         # Clear old recording data
         self.clear_old_recording()
@@ -593,6 +3966,12 @@ class MeetingSummarizer:
         self.current_meeting['transcript'] = []
         self.current_meeting['summary'] = ''
         
+        # Stream the audio to recordings/ next to the meeting
+        recording_file = f"{RECORDINGS_DIRNAME}/recording_{self.current_meeting['start_time'].strftime('%Y%m%d_%H%M%S')}.wav"
+        self.audio_recorder.start(os.path.join(self.meeting_dir, *recording_file.split("/")))
+        self.current_meeting['recording'] = {'file': recording_file, 'sample_rate': self.audio_recorder.target_rate}
+        self.journal.start(self.current_meeting, self.meeting_dir)
+        
         self.record_button.configure(text="⏸️ Pause Recording", fg_color=("#ff9800", "#ffb74d"))
         self.stop_button.configure(state="normal")
         self.status_label.configure(text="🔴 Recording in progress...", text_color=("#ff5252", "#ff7676"))
@@ -609,7 +3988,11 @@ class MeetingSummarizer:
         self.is_recording = False
         self.record_button.configure(text="🎙️ Start Recording", fg_color=("#00c853", "#00e676"))
         self.stop_button.configure(state="disabled")
-        self.status_label.configure(text="🟡 Recording stopped", text_color=("#ff9800", "#ffb74d"))
+        status_text = "🟡 Recording stopped"
+        skipped = self.chunk_dispatcher.stats().get('skipped_fraction')
+        if skipped:
+            status_text += f" ({skipped:.0%} silence skipped)"
+        self.status_label.configure(text=status_text, text_color=("#ff9800", "#ffb74d"))
         
         # Ask user if they want to save
         if self.current_meeting['transcript']:
@@ -645,64 +4028,135 @@ class MeetingSummarizer:
                     time.sleep(0.1)
         except Exception as e:
             print(f"Audio recording error: {e}")
+        finally:
+            # Hand over the last partial chunk and wake the transcriber
+            self.chunk_dispatcher.close()
+            self.audio_recorder.stop()
     
     def audio_callback(self, indata, frames, time, status):
         """Callback for audio recording"""
+        if status and status.input_overflow:
+            self.capture_buffer.input_overflows += 1
+            TELEMETRY.increment('input_overflows')
         if self.is_recording:
-            self.audio_data.extend(indata.copy())
+            with TELEMETRY.timer('capture_callback'):
+                # Single slice copy of the mono channel into the ring buffer
+                self.capture_buffer.write(indata[:, 0])
+                self.chunk_dispatcher.notify()
     
     def transcribe_live(self):
         """Live transcription of audio"""
         def transcribe_loop():
-            while self.is_recording:
+            workers = self.transcription_pool.start()
+            while True:
                 try:
-                    # Process audio in chunks
-                    if len(self.audio_data) > self.sample_rate * 5:  # 5 second chunks
-                        audio_chunk = np.array(self.audio_data[:self.sample_rate * 5])
-                        self.audio_data = self.audio_data[self.sample_rate * 5:]
-                        
-                        # Convert to audio data
-                        audio_data = sr.AudioData(
-                            (audio_chunk * 32767).astype(np.int16).tobytes(),
-                            self.sample_rate, 2
-                        )
-                        
-                        # Transcribe
-                        try:
-                            text = self.recognizer.recognize_google(audio_data)
-                            if text.strip():
-                                timestamp = datetime.now().strftime("%H:%M:%S")
-                                transcript_entry = f"[{timestamp}] {text}\n"
-                                
-                                self.current_meeting['transcript'].append({
-                                    'timestamp': timestamp,
-                                    'text': text
-                                })
-                                
-                                # Update GUI in main thread
-                                self.root.after(0, self.update_transcript, transcript_entry)
-                                
-                        except sr.UnknownValueError:
-                            pass
-                        except sr.RequestError as e:
-                            print(f"Speech recognition error: {e}")
+                    # Block until the capture side hands over a full chunk
+                    chunk = self.chunk_dispatcher.get()
+                    if chunk is None:
+                        break  # Recording finished
                     
-                    time.sleep(1)
+                    # Copy the chunk out before the ring buffer wraps over it;
+                    # None (overwritten) still keeps its place in the sequence
+                    with TELEMETRY.timer('chunk_dispatch'):
+                        audio_chunk = self.capture_buffer.read(chunk.start, chunk.stop)
+                        self.transcription_pool.submit(chunk, audio_chunk)
                 except Exception as e:
                     print(f"Transcription error: {e}")
-                    time.sleep(1)
+            
+            self.transcription_pool.shutdown(workers)
+        
+        self.transcribe_thread = threading.Thread(target=transcribe_loop)
+        self.transcribe_thread.daemon = True
+        self.transcribe_thread.start()
+    
+    def recognize_chunk(self, audio_chunk):
+        """Recognize one chunk of audio (runs on a worker thread)"""
+        # Downsample to the engine's rate and convert to audio data
+        with TELEMETRY.timer('encode'):
+            audio_data = self.chunk_encoder.encode(audio_chunk)
+        
+        # Transcribe
+        try:
+            with TELEMETRY.timer('recognize'):
+                return self.recognizer_backend.recognize(audio_data)
+        except sr.RequestError as e:
+            TELEMETRY.increment('recognition_errors')
+            if self.recognizer_backend.load_error:
+                self.call_in_ui(self.report_engine_error, self.recognizer_backend)
+            else:
+                print(f"Speech recognition error: {e}")
+            return None
+    
+    def report_engine_error(self, backend):
+        """Tell the user once that the recognition engine could not be set up"""
+        if self.engine_error_backend is backend:
+            return
+        self.engine_error_backend = backend
+        messagebox.showerror("Speech Recognition Error", f"{backend.label} is not working:\n\n{backend.load_error}")
+        self.status_label.configure(text="❌ Speech recognition is not working", text_color=("#ff5252", "#ff7676"))
+    
+    def add_transcript_result(self, chunk, result):
+        """Append a recognized chunk to the transcript (called in chunk order)"""
+        if result is None or not result.text or not result.text.strip():
+            return
+        start_time = self.current_meeting['start_time'] or datetime.now()
+        entry = make_transcript_entry(result, start_time, chunk.start / self.sample_rate)
+        if self.current_meeting['recording']:
+            # Where the passage is in the recording, in samples
+            entry['audio_offset'] = self.audio_recorder.offset(chunk.start)
+            entry['audio_length'] = self.audio_recorder.output_length(chunk.stop - chunk.start)
+        self.current_meeting['transcript'].append(entry)
+        self.journal.append('transcript', entry=entry)
+        if self.api_key:
+            self.rolling_summarizer.transcript_updated(self.current_meeting)
         
-        transcribe_thread = threading.Thread(target=transcribe_loop)
-        transcribe_thread.daemon = True
-        transcribe_thread.start()
+        # Batched into the GUI by the transcript renderer
+        self.update_transcript(f"[{entry['timestamp']}] {entry['text']}\n")
     
     def update_transcript(self, text):
-        """Update transcript text box"""
-        self.transcript_text.insert("end", text)
-        self.transcript_text.see("end")
+        """Update transcript text box (batched, safe from any thread)"""
+        self.transcript_renderer.append(text)
+    
+    def update_earlier_button(self, renderer):
+        """Enable paging when older transcript entries are not shown"""
+        self.earlier_button.configure(state="normal" if renderer.first_line > 0 else "disabled")
+    
+    def show_earlier_transcript(self):
+        """Page the previous block of transcript entries back into the textbox"""
+        first = self.transcript_renderer.first_line
+        start = max(0, first - self.transcript_page_size)
+        entries = self.current_meeting['transcript'][start:first]
+        self.transcript_renderer.prepend([f"[{entry['timestamp']}] {entry['text']}\n" for entry in entries])
+        self.transcript_text.see("1.0")
+    
+    def play_transcript_entry(self, event):
+        """Play the recorded audio of the transcript entry that was double-clicked"""
+        recording = self.current_meeting.get('recording')
+        if not recording:
+            return
+        line = int(self.transcript_text.index(f"@{event.x},{event.y}").split(".")[0])
+        index = self.transcript_renderer.first_line + line - 1
+        if not 0 <= index < len(self.current_meeting['transcript']):
+            return
+        entry = self.current_meeting['transcript'][index]
+        if 'audio_offset' not in entry:
+            return
+        
+        path = os.path.join(self.meeting_dir, *recording['file'].split("/"))
+        try:
+            samples, rate = read_recording(path, entry['audio_offset'], entry['audio_length'])
+            sd.play(samples, rate)
+            self.status_label.configure(text=f"🔊 Playing passage from {entry['timestamp']}", text_color=("#4a9eff", "#66b3ff"))
+        except Exception as e:
+            messagebox.showerror("Playback Error", f"Failed to play recording: {str(e)}")
     
     def generate_summary(self):
-        """Generate AI summary of the meeting"""
+        """Generate AI summary of the meeting, or cancel the one in progress"""
+        if self.summary_thread and self.summary_thread.is_alive():
+            self.summary_cancel.set()
+            self.status_label.configure(text="⏹️ Cancelling AI summary...", text_color=("#ff9800", "#ffb74d"))
+            return
+        
         if not self.current_meeting['transcript']:
             messagebox.showwarning("Warning", "No transcript available to summarize!")
             return
@@ -711,416 +4165,869 @@ class MeetingSummarizer:
             messagebox.showerror("Error", "OpenAI API key required for summaries!")
             return
         
-        # Prepare transcript text
-        transcript_text = "\n".join([f"[{entry['timestamp']}] {entry['text']}" 
-                                   for entry in self.current_meeting['transcript']])
+        self.status_label.configure(text="🤖 Generating AI summary...", text_color=("#ff9800", "#ffb74d"))
+        self.summary_button.configure(text="⏹️ Cancel Summary")
+        self.summary_text.delete("1.0", "end")
         
+        self.summary_cancel.clear()
+        self.summary_stream_buffer = []
+        self.summary_thread = threading.Thread(
+            target=self.summary_worker, args=(self.current_meeting, self.summary_generation)
+        )
+        self.summary_thread.daemon = True
+        self.summary_thread.start()
+        self.root.after(self.summary_flush_ms, self.flush_summary_stream)
+    
+    def drop_summary_run(self):
+        """Cancel an AI summary in progress and ignore whatever it still produces"""
+        self.summary_cancel.set()
+        with self.summary_stream_lock:
+            self.summary_generation += 1
+            self.summary_stream_buffer = []
+    
+    def summary_worker(self, meeting, generation):
+        """Produce the summary off the Tk thread, streaming tokens into a buffer"""
         try:
-            self.status_label.configure(text="🤖 Generating AI summary...", text_color=("#ff9800", "#ffb74d"))
-            
-            # Use OpenAI to generate summary
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that creates concise, professional meeting summaries. Focus on key points, action items, and important decisions."},
-                    {"role": "user", "content": f"Please summarize this meeting transcript:\n\n{transcript_text}"}
-                ],
-                max_tokens=500
-            )
-            
-            summary = response.choices[0].message.content
-            self.current_meeting['summary'] = summary
-            
-            # Update GUI
+            with TELEMETRY.timer('summary'):
+                # Only the final merge is left if windows were summarized while recording
+                messages = self.rolling_summarizer.final_messages(meeting)
+                summary = None
+                if not self.summary_cancel.is_set():
+                    summary = self.summary_client.stream_chat_completion(
+                        messages, 500, lambda text: self.queue_summary_text(text, generation), self.summary_cancel
+                    )
+            self.root.after(0, self.finish_summary, meeting, summary, None, generation)
+        except Exception as e:
+            self.root.after(0, self.finish_summary, meeting, None, e, generation)
+    
+    def queue_summary_text(self, text, generation):
+        """Collect streamed text; the Tk thread inserts it in batches"""
+        with self.summary_stream_lock:
+            if generation == self.summary_generation:
+                self.summary_stream_buffer.append(text)
+    
+    def flush_summary_stream(self):
+        """Insert all text streamed since the last flush in one go"""
+        with self.summary_stream_lock:
+            text = "".join(self.summary_stream_buffer)
+            self.summary_stream_buffer = []
+        if text:
+            self.summary_text.insert("end", text)
+            self.summary_text.see("end")
+        if self.summary_thread and self.summary_thread.is_alive():
+            self.root.after(self.summary_flush_ms, self.flush_summary_stream)
+    
+    def finish_summary(self, meeting, summary, error, generation):
+        """Wrap up a summary run on the Tk thread"""
+        self.flush_summary_stream()
+        self.summary_button.configure(text="🤖 Generate AI Summary")
+        if generation != self.summary_generation:
+            return  # The meeting was cleared (the dict is reused) while the summary ran
+        
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to generate summary: {str(error)}")
+            self.status_label.configure(text="❌ Summary generation failed", text_color=("#ff5252", "#ff7676"))
+        elif summary is None:
+            # Cancelled: put back whatever summary the meeting already had
+            self.summary_text.delete("1.0", "end")
+            self.summary_text.insert("1.0", meeting['summary'])
+            self.status_label.configure(text="⏹️ AI summary cancelled", text_color=("#ff9800", "#ffb74d"))
+        else:
+            meeting['summary'] = summary
+            self.journal.append('summary', summary=summary)
             self.summary_text.delete("1.0", "end")
             self.summary_text.insert("1.0", summary)
-            
             self.status_label.configure(text="✅ AI summary generated successfully!", text_color=("#4caf50", "#66bb6a"))
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate summary: {str(e)}")
-            self.status_label.configure(text="❌ Summary generation failed", text_color=("#ff5252", "#ff7676"))
+    
+    def partial_summaries_updated(self, meeting):
+        """Log new rolling summaries (summarizer thread)"""
+        if meeting is self.current_meeting:
+            self.journal.append('partial_summaries', partials=meeting['partial_summaries'])
     
     def add_note(self):
         """Add a manual note"""
+        if self.is_loading():
+            self.block_while_busy()
+            return
         note_text = self.note_entry.get().strip()
         if note_text:
             timestamp = datetime.now().strftime("%H:%M:%S")
             note_entry = f"[{timestamp}] {note_text}\n"
             
-            self.current_meeting['notes'].append({
+            note = {
                 'timestamp': timestamp,
                 'text': note_text
-            })
+            }
+            self.current_meeting['notes'].append(note)
+            self.journal.append('note', entry=note)
             
-            self.notes_text.insert("end", note_entry)
-            self.notes_text.see("end")
+            self.notes_renderer.append(note_entry)
             self.note_entry.delete(0, "end")
     
     def take_screenshot(self):
         """Take a screenshot and add it to notes"""
+        if self.block_while_busy():
+            return
+        
+        # Minimize the app window temporarily and grab once it is out of the way,
+        # without blocking the Tk event loop while we wait
+        self.root.iconify()
+        self.root.after(self.screenshot_delay_ms, self.grab_screenshot)
+    
+    def grab_screenshot(self):
+        """Grab the screen and hand the image to the screenshot pipeline"""
         try:
-            # Minimize the app window temporarily
-            self.root.iconify()
-            time.sleep(0.5)  # Wait for window to minimize
-            
             # Take screenshot
+            started = time.perf_counter()
             screenshot = ImageGrab.grab()
-            
-            # Restore the app window
-            self.root.deiconify()
-            self.root.lift()
-            self.root.focus_force()
-            
-            # Add screenshot to meeting data
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            
-            # Convert to base64 for storage
-            buffer = io.BytesIO()
-            screenshot.save(buffer, format='PNG')
-            img_str = base64.b64encode(buffer.getvalue()).decode()
-            
-            screenshot_data = {
-                'timestamp': timestamp,
-                'image': img_str,
-                'filename': f"screenshot_{timestamp.replace(':', '-')}.png"
-            }
-            
-            self.current_meeting['screenshots'].append(screenshot_data)
-            
-            # Add screenshot entry to notes
-            screenshot_entry = f"[{timestamp}] 📸 Screenshot captured: {screenshot_data['filename']}\n"
-            self.notes_text.insert("end", screenshot_entry)
-            self.notes_text.see("end")
-            
-            # Show success message
-            self.status_label.configure(text="📸 Screenshot captured and added to notes!", text_color=("#4caf50", "#66bb6a"))
-            
+            grab_ms = (time.perf_counter() - started) * 1000
         except Exception as e:
-            # Restore window if error occurs
+            messagebox.showerror("Screenshot Error", f"Failed to take screenshot: {str(e)}")
+            self.status_label.configure(text="❌ Screenshot failed", text_color=("#ff5252", "#ff7676"))
+            return
+        finally:
+            # Restore the app window
             self.root.deiconify()
             self.root.lift()
             self.root.focus_force()
-            
-            messagebox.showerror("Screenshot Error", f"Failed to take screenshot: {str(e)}")
+        
+        # Add screenshot to meeting data right away; the image reference is
+        # filled in once it has been encoded and stored
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        ext = ScreenshotPipeline.FORMATS[self.screenshot_format][0]
+        screenshot_data = {
+            'timestamp': timestamp,
+            'filename': f"screenshot_{timestamp.replace(':', '-')}.{ext}",
+            'pending': True
+        }
+        self.current_meeting['screenshots'].append(screenshot_data)
+        
+        # Add screenshot entry to notes, tagged so it can be updated later
+        tag = f"screenshot-{id(screenshot_data)}"
+        screenshot_entry = f"[{timestamp}] 📸 Screenshot captured: {screenshot_data['filename']} (saving...)\n"
+        self.notes_renderer.append(screenshot_entry, tag)
+        
+        self.screenshot_pipeline.submit(
+            screenshot, screenshot_data, AssetStore(self.meeting_dir), self.screenshot_format, grab_ms,
+            lambda entry: self.root.after(0, self.screenshot_stored, entry, tag),
+            find_duplicate=lambda phash, fingerprint: self.find_similar_screenshot(
+                phash, fingerprint, self.duplicate_threshold
+            )
+        )
+        self.status_label.configure(text="📸 Screenshot captured, saving...", text_color=("#4caf50", "#66bb6a"))
+    
+    def screenshot_stored(self, screenshot_data, tag):
+        """Update the notes entry once the pipeline has stored a screenshot"""
+        if screenshot_data.get('error'):
+            text = f"[{screenshot_data['timestamp']}] ❌ Screenshot could not be saved: {screenshot_data['error']}\n"
             self.status_label.configure(text="❌ Screenshot failed", text_color=("#ff5252", "#ff7676"))
+        elif screenshot_data.get('duplicate_of'):
+            text = (f"[{screenshot_data['timestamp']}] 📸 Screenshot captured: {screenshot_data['filename']} "
+                    f"(same as {screenshot_data['duplicate_of']})\n")
+            self.status_label.configure(text="📸 Screenshot matches an earlier one, stored as a reference", text_color=("#4caf50", "#66bb6a"))
+        else:
+            text = f"[{screenshot_data['timestamp']}] 📸 Screenshot captured: {screenshot_data['filename']}\n"
+            timings = self.screenshot_pipeline.stats()
+            self.status_label.configure(
+                text=f"📸 Screenshot added to notes (grab {timings.get('grab_ms', 0):.0f} ms, "
+                     f"encode {timings.get('encode_ms', 0):.0f} ms, save {timings.get('persist_ms', 0):.0f} ms)",
+                text_color=("#4caf50", "#66bb6a")
+            )
+        
+        self.notes_renderer.flush()  # The tagged line may still be queued
+        ranges = self.notes_text.tag_ranges(tag)
+        if ranges:
+            self.notes_text.delete(ranges[0], ranges[1])
+            self.notes_text.insert(ranges[0], text)
+        self.notes_text.tag_delete(tag)
+        
+        # Log it once stored, unless the meeting it belonged to is gone already
+        if not screenshot_data.get('error') and any(entry is screenshot_data for entry in self.current_meeting['screenshots']):
+            self.journal.append('screenshot', entry=screenshot_data)
     
-    def save_screenshot_to_file(self, screenshot_data, base_path):
-        """Save screenshot to file"""
-        try:
-            # Create screenshots directory
-            screenshots_dir = os.path.join(base_path, "screenshots")
-            os.makedirs(screenshots_dir, exist_ok=True)
-            
-            # Decode and save image
-            img_data = base64.b64decode(screenshot_data['image'])
-            img = Image.open(io.BytesIO(img_data))
-            
-            filepath = os.path.join(screenshots_dir, screenshot_data['filename'])
-            img.save(filepath, 'PNG')
-            
-            return filepath
-        except Exception as e:
-            print(f"Error saving screenshot: {e}")
-            return None
+    def find_similar_screenshot(self, phash, fingerprint, threshold):
+        """Most recent stored screenshot with at most ``threshold`` of its pixels changed"""
+        return similar_screenshot(self.current_meeting['screenshots'], phash, fingerprint, threshold, self.meeting_dir)
+    
+    def toggle_auto_capture(self):
+        """Turn automatic slide-change capture on or off"""
+        self.auto_capture = not self.auto_capture
+        if self.auto_capture:
+            self.auto_capture_button.configure(text="🎞️ Auto Capture: On", fg_color=("#4caf50", "#66bb6a"))
+            self.status_label.configure(text="🎞️ Capturing slide changes automatically", text_color=("#4caf50", "#66bb6a"))
+            self.root.after(self.auto_capture_interval_ms, self.auto_capture_tick)
+        else:
+            self.auto_capture_button.configure(text="🎞️ Auto Capture: Off", fg_color=("#607d8b", "#90a4ae"))
+    
+    def auto_capture_tick(self):
+        """Grab the screen and keep the frame only if the slide has changed"""
+        if not self.auto_capture:
+            return
+        self.root.after(self.auto_capture_interval_ms, self.auto_capture_tick)
+        
+        # Skip a beat rather than queue up work if encoding is behind or a save is copying images
+        if self.screenshot_pipeline.stats()['pending'] > 1 or self.is_saving() or self.is_loading():
+            return
+        
+        # The grab runs on a pipeline worker; the app's own window is left out of it
+        exclude = None
+        if self.root.state() != 'iconic':
+            left, top = self.root.winfo_rootx(), self.root.winfo_rooty()
+            exclude = (left, top, left + self.root.winfo_width(), top + self.root.winfo_height())
+        screen_width = self.root.winfo_screenwidth()
+        
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        ext = ScreenshotPipeline.FORMATS[self.screenshot_format][0]
+        screenshot_data = {
+            'timestamp': timestamp,
+            'filename': f"slide_{timestamp.replace(':', '-')}.{ext}",
+            'pending': True
+        }
+        self.screenshot_pipeline.submit(
+            lambda: grab_screen(exclude, screen_width), screenshot_data, AssetStore(self.meeting_dir),
+            self.screenshot_format, 0.0,
+            lambda entry: self.root.after(0, self.slide_captured, entry),
+            find_duplicate=lambda phash, fingerprint: self.find_similar_slide(screenshot_data, phash, fingerprint),
+            drop_duplicates=True
+        )
+    
+    def find_similar_slide(self, screenshot_data, phash, fingerprint):
+        """Earlier slide matching ``fingerprint``, stored or still being stored (any thread).
+        
+        A slide that is new is registered as in flight in the same step, so two
+        grabs of one slide being encoded side by side are not both kept.
+        """
+        with self.slides_lock:
+            original = self.find_similar_screenshot(phash, fingerprint, self.slide_change_threshold)
+            if original is None:
+                for entry, in_flight in self.slides_in_flight:
+                    if (hash_distance(entry['phash'], phash) <= SIMILAR_HASH_BITS
+                            and changed_fraction(in_flight, fingerprint) <= self.slide_change_threshold):
+                        return entry
+                self.slides_in_flight.append((screenshot_data, fingerprint))
+            return original
+    
+    def slide_captured(self, screenshot_data):
+        """Add an automatically captured slide to the meeting"""
+        with self.slides_lock:
+            if not (screenshot_data.get('discarded') or screenshot_data.get('error')):
+                self.current_meeting['screenshots'].append(screenshot_data)
+            self.slides_in_flight = [
+                (entry, fingerprint) for entry, fingerprint in self.slides_in_flight if entry is not screenshot_data
+            ]
+        if screenshot_data.get('discarded') or screenshot_data.get('error'):
+            return
+        self.journal.append('screenshot', entry=screenshot_data)
+        self.notes_renderer.append(f"[{screenshot_data['timestamp']}] 🎞️ Slide change captured: {screenshot_data['filename']}\n")
+    
+    def view_screenshots(self):
+        """Open a window to view all screenshots"""
+        if not self.current_meeting['screenshots']:
+            messagebox.showinfo("No Screenshots", "No screenshots have been taken yet.")
+            return
+        
+        ScreenshotViewer(
+            self, self.current_meeting['screenshots'], self.meeting_dir,
+            self.preview_cache, self.preview_loader
+        )
+    
+    def register_saved_meeting(self, filename, meeting_data):
+        """Add a meeting that was just written to the search index and the catalog"""
+        entries = meeting_index_entries(meeting_data)
+        meeting = (os.path.abspath(filename), meeting_data['title'], meeting_data['start_time'],
+                   os.path.getmtime(filename), entries)
+        
+        def store():
+            try:
+                self.meeting_index.store([meeting])
+                self.meeting_catalog.update(filename, meeting_data['meta'])
+            except Exception as e:
+                print(f"Search index error: {e}")
+        
+        self.index_worker.submit(store)
     
-    def view_screenshots(self):
-        """Open a window to view all screenshots"""
-        if not self.current_meeting['screenshots']:
-            messagebox.showinfo("No Screenshots", "No screenshots have been taken yet.")
+    def run_search(self):
+        """Search all indexed meetings and list the hits, best first"""
+        query = self.search_entry.get().strip()
+        self.search_tree.delete(*self.search_tree.get_children())
+        if not query:
             return
         
-        # Create screenshot viewer window
-        viewer_window = ctk.CTkToplevel(self.root)
-        viewer_window.title("🖼️ Screenshot Viewer")
-        viewer_window.geometry("800x600")
-        viewer_window.resizable(True, True)
+        started = time.perf_counter()
+        try:
+            self.search_results = self.meeting_index.search(query)
+        except sqlite3.Error as e:
+            messagebox.showerror("Search Error", f"Search failed: {str(e)}")
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
         
-        # Make it modal
-        viewer_window.transient(self.root)
-        viewer_window.grab_set()
+        for i, hit in enumerate(self.search_results):
+            when = (hit['start_time'] or '')[:10]
+            if hit['timestamp']:
+                when = f"{when} {hit['timestamp']}".strip()
+            self.search_tree.insert("", "end", iid=str(i), values=(hit['title'], when, hit['snippet']))
         
-        # Center the window
-        viewer_window.geometry("+%d+%d" % (self.root.winfo_rootx() + 50, self.root.winfo_rooty() + 50))
+        self.status_label.configure(
+            text=f"🔍 {len(self.search_results)} matches in {elapsed_ms:.0f} ms",
+            text_color=("#00bcd4", "#26c6da")
+        )
+    
+    def rebuild_search_index(self):
+        """Re-read every meeting file in the working folder into the index"""
+        self.status_label.configure(text="🔄 Rebuilding search index...", text_color=("#ff9800", "#ffb74d"))
         
-        # Create scrollable frame for screenshots
-        main_frame = ctk.CTkScrollableFrame(viewer_window)
-        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        def rebuild():
+            started = time.perf_counter()
+            try:
+                meetings, entries = self.meeting_index.rebuild(os.getcwd())
+            except Exception as e:
+                print(f"Search index error: {e}")
+                self.root.after(0, lambda: self.status_label.configure(
+                    text="❌ Search index rebuild failed", text_color=("#ff5252", "#ff7676")))
+                return
+            elapsed = time.perf_counter() - started
+            self.root.after(0, lambda: self.status_label.configure(
+                text=f"✅ Indexed {meetings} meetings ({entries} entries) in {elapsed:.1f} s",
+                text_color=("#4caf50", "#66bb6a")))
         
-        # Add title
-        title_label = ctk.CTkLabel(
-            main_frame,
-            text="📸 Meeting Screenshots",
-            font=ctk.CTkFont(size=24, weight="bold"),
-            text_color=("#4a9eff", "#66b3ff")
-        )
-        title_label.pack(pady=(0, 20))
+        self.index_worker.submit(rebuild)
+    
+    def open_search_result(self):
+        """Open the meeting of the selected hit and show the matching entry"""
+        selection = self.search_tree.selection()
+        if not selection or self.block_while_busy():
+            return
+        hit = self.search_results[int(selection[0])]
         
-        # Display each screenshot
-        for i, screenshot_data in enumerate(self.current_meeting['screenshots']):
-            # Screenshot container
-            screenshot_frame = ctk.CTkFrame(main_frame, fg_color=("#3a3a3a", "#2a2a2a"), corner_radius=10)
-            screenshot_frame.pack(fill="x", pady=(0, 20))
-            
-            # Screenshot header
-            header_frame = ctk.CTkFrame(screenshot_frame, fg_color="transparent")
-            header_frame.pack(fill="x", padx=15, pady=(15, 10))
-            
-            timestamp_label = ctk.CTkLabel(
-                header_frame,
-                text=f"📸 {screenshot_data['timestamp']} - {screenshot_data['filename']}",
-                font=ctk.CTkFont(size=16, weight="bold"),
-                text_color=("#4caf50", "#66bb6a")
-            )
-            timestamp_label.pack(side="left")
-            
-            # Image display
+        def show_hit():
+            if hit['kind'] == 'transcript':
+                # Page older entries in until the hit is in the textbox
+                while self.transcript_renderer.first_line > hit['position']:
+                    self.show_earlier_transcript()
+                self.highlight_line(self.transcript_text, hit['position'] - self.transcript_renderer.first_line + 1)
+            elif hit['kind'] == 'note':
+                self.highlight_line(self.notes_text, hit['position'] + 1)
+        
+        try:
+            self.open_meeting_file(hit['path'], on_loaded=show_hit)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load meeting: {str(e)}")
+            self.status_label.configure(text="❌ Failed to load meeting", text_color=("#ff5252", "#ff7676"))
+            return
+        self.notebook.select(self.result_tabs[hit['kind']])
+    
+    def highlight_line(self, textbox, line):
+        """Scroll to a line of a textbox and mark it"""
+        textbox.tag_remove("search_hit", "1.0", "end")
+        textbox.tag_add("search_hit", f"{line}.0", f"{line}.end")
+        textbox.tag_config("search_hit", background="#00838f")
+        textbox.see(f"{line}.0")
+    
+    def tab_changed(self, event):
+        """Refresh the library or diagnostics whenever their tab is shown"""
+        selected = self.notebook.select()
+        if selected == str(self.library_frame):
+            self.refresh_library()
+        elif selected == str(self.diagnostics_frame):
+            self.refresh_diagnostics()
+    
+    def refresh_library(self):
+        """Scan the working folder in the background and list its meetings"""
+        directory = os.getcwd()
+        
+        def scan():
+            started = time.perf_counter()
             try:
-                # Decode base64 image
-                img_data = base64.b64decode(screenshot_data['image'])
-                img = Image.open(io.BytesIO(img_data))
-                
-                # Resize image to fit window (max width 700px)
-                max_width = 700
-                if img.width > max_width:
-                    ratio = max_width / img.width
-                    new_width = int(img.width * ratio)
-                    new_height = int(img.height * ratio)
-                    img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                
-                # Convert to PhotoImage for tkinter
-                photo = ImageTk.PhotoImage(img)
-                
-                # Create label to display image
-                img_label = ctk.CTkLabel(screenshot_frame, image=photo, text="")
-                img_label.image = photo  # Keep a reference
-                img_label.pack(pady=(0, 15))
-                
+                meetings = self.meeting_catalog.scan(directory)
             except Exception as e:
-                error_label = ctk.CTkLabel(
-                    screenshot_frame,
-                    text=f"❌ Error displaying image: {str(e)}",
-                    font=ctk.CTkFont(size=14),
-                    text_color=("#ff5252", "#ff7676")
-                )
-                error_label.pack(pady=(0, 15))
+                print(f"Meeting catalog error: {e}")
+                return
+            self.root.after(0, self.show_library, meetings, time.perf_counter() - started)
         
-        # Add close button
-        close_button = ctk.CTkButton(
-            viewer_window, 
-            text="Close Viewer", 
-            command=viewer_window.destroy,
-            fg_color=("#4a9eff", "#66b3ff"),
-            hover_color=("#1976d2", "#4a9eff"),
-            height=40,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            corner_radius=10
+        self.index_worker.submit(scan)
+    
+    def show_library(self, meetings, elapsed):
+        """Fill the library list from catalog rows"""
+        self.library_tree.delete(*self.library_tree.get_children())
+        for meeting in meetings:
+            duration = ''
+            if meeting['duration_seconds'] is not None:
+                duration = str(timedelta(seconds=int(meeting['duration_seconds'])))
+            self.library_tree.insert("", "end", iid=meeting['path'], values=(
+                meeting['title'],
+                (meeting['start_time'] or '')[:16].replace('T', ' '),
+                duration,
+                meeting['transcript_entries'],
+                meeting['notes'],
+                meeting['screenshots'],
+                "✓" if meeting['has_summary'] else "",
+                f"{meeting['size'] / (1024 * 1024):.1f} MB"
+            ))
+        self.status_label.configure(
+            text=f"📚 {len(meetings)} meetings listed in {elapsed * 1000:.0f} ms",
+            text_color=("#8bc34a", "#9ccc65")
         )
-        close_button.pack(pady=(0, 20))
+    
+    def open_library_meeting(self):
+        """Load the meeting selected in the library"""
+        selection = self.library_tree.selection()
+        if not selection or self.block_while_busy():
+            return
+        try:
+            self.open_meeting_file(selection[0])
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load meeting: {str(e)}")
+            self.status_label.configure(text="❌ Failed to load meeting", text_color=("#ff5252", "#ff7676"))
+            return
+        self.notebook.select(self.result_tabs['transcript'])
+    
+    def component_stats(self):
+        """Counters of each pipeline component, exported as gauges"""
+        return {
+            'capture': self.capture_buffer.stats(),
+            'chunks': self.chunk_dispatcher.stats(),
+            'recognizer': self.transcription_pool.stats(),
+            'encoder': self.chunk_encoder.stats(),
+            'recorder': self.audio_recorder.stats(),
+            'summary_cache': self.summary_cache.stats(),
+            'screenshots': self.screenshot_pipeline.stats(),
+            'journal': self.journal.stats(),
+        }
+    
+    def export_metrics(self):
+        """Write the metrics file for Prometheus, then again after the interval"""
+        try:
+            TELEMETRY.write(METRICS_FILENAME)
+        except Exception as e:
+            print(f"Metrics export error: {e}")
+        self.root.after(self.metrics_interval_ms, self.export_metrics)
+    
+    def refresh_diagnostics(self):
+        """Redraw the diagnostics tab every second while it is shown"""
+        # Showing the tab again must not start a second refresh loop
+        if self.diagnostics_refresh:
+            self.root.after_cancel(self.diagnostics_refresh)
+            self.diagnostics_refresh = None
+        if self.notebook.select() != str(self.diagnostics_frame):
+            return
         
-        # Focus on the viewer window
-        viewer_window.focus_set()
+        stages, counters = TELEMETRY.summary()
+        lines = [f"{'Stage (ms)':<24}{'count':>8}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}"]
+        for stage, stats in stages.items():
+            lines.append(
+                f"{stage:<24}{stats['count']:>8}{stats['mean_ms']:>9.1f}{stats['p50_ms']:>9.1f}"
+                f"{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}{stats['max_ms']:>9.1f}"
+            )
+        lines += ["", "Events"]
+        lines += [f"{event:<24}{value:>8}" for event, value in counters.items()]
+        lines += ["", "Components"]
+        for component, stats in self.component_stats().items():
+            values = ", ".join(
+                f"{stat}={value:.3g}" if isinstance(value, float) else f"{stat}={value}"
+                for stat, value in stats.items()
+            )
+            lines.append(f"{component:<16}{values}")
+        
+        position = self.diagnostics_text.yview()[0]
+        self.diagnostics_text.delete("1.0", "end")
+        self.diagnostics_text.insert("1.0", "\n".join(lines))
+        self.diagnostics_text.yview_moveto(position)
+        self.diagnostics_refresh = self.root.after(self.diagnostics_interval_ms, self.refresh_diagnostics)
     
     def save_meeting(self):
         """Save meeting data to file"""
         if not self.current_meeting['title']:
             messagebox.showerror("Error", "No meeting data to save!")
             return
-        
-        # Prepare meeting data
-        meeting_data = {
-            'title': self.current_meeting['title'],
-            'start_time': self.current_meeting['start_time'].isoformat() if self.current_meeting['start_time'] else None,
-            'end_time': datetime.now().isoformat(),
-            'transcript': self.current_meeting['transcript'],
-            'summary': self.current_meeting['summary'],
-            'notes': self.current_meeting['notes'],
-            'screenshots': self.current_meeting['screenshots']
-        }
+        if self.block_while_busy():
+            return
         
         # Create filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"meeting_{timestamp}_{self.current_meeting['title'].replace(' ', '_')}.json"
+        filename = meeting_filename(
+            self.current_meeting['title'], extension=meeting_extension(self.meeting_format, self.meeting_compression)
+        )
         
-        # Save to file
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(meeting_data, f, indent=2, ensure_ascii=False)
-            
-            # Save screenshots to separate folder if any exist
-            if self.current_meeting['screenshots']:
-                try:
-                    # Create screenshots directory
-                    screenshots_dir = f"screenshots_{timestamp}_{self.current_meeting['title'].replace(' ', '_')}"
-                    os.makedirs(screenshots_dir, exist_ok=True)
-                    
-                    # Save each screenshot
-                    for screenshot_data in self.current_meeting['screenshots']:
-                        self.save_screenshot_to_file(screenshot_data, screenshots_dir)
-                    
-                    messagebox.showinfo("Success", f"Meeting saved as {filename}\nScreenshots saved to {screenshots_dir}/")
-                except Exception as screenshot_error:
-                    print(f"Warning: Could not save screenshots: {screenshot_error}")
-                    messagebox.showinfo("Success", f"Meeting saved as {filename}\nNote: Screenshots could not be saved separately")
-            else:
-                messagebox.showinfo("Success", f"Meeting saved as {filename}")
-            
-            self.status_label.configure(text="💾 Meeting saved successfully!", text_color=("#4caf50", "#66bb6a"))
-            
-            # Clear interface after saving
-            self.clear_interface_after_save()
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save meeting: {str(e)}")
+        # Write in the background, then clear the interface
+        self.start_save(filename, os.getcwd(), self.meeting_format, self.meeting_compression, clear_after=True)
     
     def load_meeting(self):
         """Load an existing meeting from file"""
+        if self.block_while_busy():
+            return
         try:
             # Open file dialog to select meeting file
             filename = filedialog.askopenfilename(
                 title="Select Meeting File",
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+                filetypes=self.meeting_filetypes(),
                 initialdir="."
             )
             
             if not filename:
                 return  # User cancelled
             
-            # Load meeting data
-            with open(filename, 'r', encoding='utf-8') as f:
-                meeting_data = json.load(f)
-            
-            # Clear current interface
-            self.clear_old_recording()
-            
-            # Load meeting data into interface
-            self.current_meeting = {
-                'title': meeting_data.get('title', ''),
-                'start_time': datetime.fromisoformat(meeting_data['start_time']) if meeting_data.get('start_time') else None,
-                'transcript': meeting_data.get('transcript', []),
-                'summary': meeting_data.get('summary', ''),
-                'notes': meeting_data.get('notes', []),
-                'screenshots': meeting_data.get('screenshots', [])
-            }
-            
-            # Update title entry
-            self.title_entry.delete(0, "end")
-            self.title_entry.insert(0, self.current_meeting['title'])
-            
-            # Update transcript text
-            if self.current_meeting['transcript']:
-                transcript_text = ""
-                for entry in self.current_meeting['transcript']:
-                    transcript_text += f"[{entry['timestamp']}] {entry['text']}\n"
-                self.transcript_text.delete("1.0", "end")
-                self.transcript_text.insert("1.0", transcript_text)
-            
-            # Update summary text
-            if self.current_meeting['summary']:
-                self.summary_text.delete("1.0", "end")
-                self.summary_text.insert("1.0", self.current_meeting['summary'])
-            
-            # Update notes text
-            if self.current_meeting['notes']:
-                notes_text = ""
-                for note in self.current_meeting['notes']:
-                    notes_text += f"[{note['timestamp']}] {note['text']}\n"
-                self.notes_text.delete("1.0", "end")
-                self.notes_text.insert("1.0", notes_text)
-            
-            # Enable buttons for editing
-            self.summary_button.configure(state="normal")
-            self.save_button.configure(state="normal")
-            self.save_as_button.configure(state="normal")
-            
-            # Update status
-            self.status_label.configure(
-                text=f"📂 Meeting loaded: {os.path.basename(filename)}", 
-                text_color=("#4a9eff", "#66b3ff")
-            )
-            
-            # Show success message
-            messagebox.showinfo(
-                "Meeting Loaded", 
-                f"Successfully loaded meeting:\n\n"
-                f"Title: {self.current_meeting['title']}\n"
-                f"Transcript entries: {len(self.current_meeting['transcript'])}\n"
-                f"Notes: {len(self.current_meeting['notes'])}\n"
-                f"Screenshots: {len(self.current_meeting['screenshots'])}\n\n"
-                f"You can now edit, add notes, take screenshots, or save changes."
-            )
+            # Show success message once the whole file is in
+            self.open_meeting_file(filename, on_loaded=self.show_loaded_message)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load meeting: {str(e)}")
             self.status_label.configure(text="❌ Failed to load meeting", text_color=("#ff5252", "#ff7676"))
     
+    def show_loaded_message(self):
+        messagebox.showinfo(
+            "Meeting Loaded", 
+            f"Successfully loaded meeting:\n\n"
+            f"Title: {self.current_meeting['title']}\n"
+            f"Transcript entries: {len(self.current_meeting['transcript'])}\n"
+            f"Notes: {len(self.current_meeting['notes'])}\n"
+            f"Screenshots: {len(self.current_meeting['screenshots'])}\n\n"
+            f"You can now edit, add notes, take screenshots, or save changes."
+        )
+    
+    def open_meeting_file(self, filename, on_loaded=None):
+        """Make a saved meeting the current one, reading it on a background thread.
+        
+        Title and transcript show up as soon as they are read; ``on_loaded``
+        runs once the whole file is in.
+        """
+        # Screenshot files are referenced relative to the meeting file
+        self.loading_meeting = self.reset_meeting(os.path.dirname(os.path.abspath(filename)))
+        self.load_started = time.perf_counter()
+        self.status_label.configure(
+            text=f"📂 Loading {os.path.basename(filename)}...",
+            text_color=("#ff9800", "#ffb74d")
+        )
+        threading.Thread(
+            target=self.load_worker, args=(self.current_meeting, filename, on_loaded), daemon=True
+        ).start()
+    
+    def is_loading(self):
+        return self.loading_meeting is not None
+    
+    def load_worker(self, meeting, filename, on_loaded):
+        """Stream a meeting file to the Tk thread one batch at a time"""
+        try:
+            for key, value in iter_meeting_file(filename):
+                applied = threading.Event()
+                self.call_in_ui(self.apply_loaded_field, meeting, filename, key, value, applied)
+                # Wait for the batch to be shown so the window keeps responding
+                while not applied.wait(0.1):
+                    if self.load_cancel.is_set():
+                        return
+            error = None
+        except Exception as e:
+            print(f"Meeting load error: {e}")
+            error = e
+        self.call_in_ui(self.finish_load, meeting, filename, on_loaded, error)
+    
+    def apply_loaded_field(self, meeting, filename, key, value, applied):
+        """Add one field (or batch of list entries) of a loading meeting to the interface"""
+        try:
+            if meeting is not self.current_meeting:
+                return
+            if key == 'transcript' and value and not meeting['transcript']:
+                TELEMETRY.observe('load_first_content', (time.perf_counter() - self.load_started) * 1000)
+            self.show_meeting_field(meeting, key, value)
+            if key == 'transcript':
+                self.status_label.configure(
+                    text=f"📂 Loading {os.path.basename(filename)}... {len(meeting['transcript'])} transcript entries",
+                    text_color=("#ff9800", "#ffb74d")
+                )
+        finally:
+            applied.set()
+    
+    def finish_load(self, meeting, filename, on_loaded, error):
+        """Enable editing once a meeting file has been read completely"""
+        if meeting is not self.current_meeting:
+            return
+        self.loading_meeting = None
+        TELEMETRY.observe('load_meeting', (time.perf_counter() - self.load_started) * 1000)
+        if error:
+            self.clear_old_recording()
+            messagebox.showerror("Error", f"Failed to load meeting: {str(error)}")
+            self.status_label.configure(text="❌ Failed to load meeting", text_color=("#ff5252", "#ff7676"))
+            return
+        
+        # Log edits on top of the file until it is saved again
+        self.journal.compact(filename)
+        
+        # Enable buttons for editing
+        self.summary_button.configure(state="normal")
+        self.save_button.configure(state="normal")
+        self.save_as_button.configure(state="normal")
+        
+        # Update status
+        self.status_label.configure(
+            text=f"📂 Meeting loaded: {os.path.basename(filename)}", 
+            text_color=("#4a9eff", "#66b3ff")
+        )
+        if on_loaded:
+            on_loaded()
+    
+    def show_meeting(self, meeting_data, meeting_dir):
+        """Make saved (or recovered) meeting data the current meeting"""
+        meeting = self.reset_meeting(meeting_dir)
+        for key, value in meeting_data.items():
+            self.show_meeting_field(meeting, key, value)
+        
+        # Enable buttons for editing
+        self.summary_button.configure(state="normal")
+        self.save_button.configure(state="normal")
+        self.save_as_button.configure(state="normal")
+    
+    def reset_meeting(self, meeting_dir):
+        """Clear the interface and start an empty current meeting kept in ``meeting_dir``"""
+        self.clear_old_recording()
+        self.title_entry.delete(0, "end")
+        self.meeting_dir = meeting_dir
+        self.current_meeting = {
+            'title': '',
+            'start_time': None,
+            'transcript': [],
+            'summary': '',
+            'partial_summaries': [],
+            'notes': [],
+            'screenshots': [],
+            'recording': None
+        }
+        return self.current_meeting
+    
+    def show_meeting_field(self, meeting, key, value):
+        """Put one field of saved meeting data, or a batch of its list entries, into the meeting and interface.
+        
+        List fields may come in several batches, which are added in order.
+        """
+        if key == 'title':
+            meeting['title'] = value or ''
+            self.title_entry.delete(0, "end")
+            self.title_entry.insert(0, meeting['title'])
+        elif key == 'start_time':
+            meeting['start_time'] = datetime.fromisoformat(value) if value else None
+        elif key == 'summary':
+            meeting['summary'] = value or ''
+            self.summary_text.delete("1.0", "end")
+            self.summary_text.insert("1.0", meeting['summary'])
+        elif key == 'recording':
+            meeting['recording'] = value
+        elif key in ('transcript', 'notes'):
+            renderer = self.transcript_renderer if key == 'transcript' else self.notes_renderer
+            lines = [f"[{entry['timestamp']}] {entry['text']}\n" for entry in value]
+            if meeting[key]:
+                renderer.append("".join(lines))
+                renderer.flush()
+            else:
+                renderer.set_lines(lines)
+            meeting[key].extend(value)
+        elif key in ('partial_summaries', 'screenshots'):
+            meeting[key].extend(value)
+    
+    def recover_journal(self):
+        """Offer to restore a meeting that was not saved before the app closed"""
+        if not os.path.exists(self.journal.path):
+            return
+        try:
+            meeting_data, meeting_dir, changes = MeetingJournal.replay(self.journal.path)
+        except (OSError, ValueError) as e:
+            # The saved file the changes apply to is gone or unreadable, and would be on every start
+            messagebox.showwarning(
+                "Recover Meeting",
+                f"Unsaved changes were found, but the meeting file they belong to could not be read:\n\n{e}\n\n"
+                f"The changes are discarded."
+            )
+            self.journal.discard()
+            return
+        if not changes:
+            self.journal.discard()  # Nothing happened after the last save
+            return
+        
+        restore = messagebox.askyesno(
+            "Recover Meeting?",
+            f"An unsaved meeting was found:\n\n"
+            f"Title: {meeting_data.get('title', '')}\n"
+            f"Transcript entries: {len(meeting_data.get('transcript', []))}\n"
+            f"Notes: {len(meeting_data.get('notes', []))}\n"
+            f"Screenshots: {len(meeting_data.get('screenshots', []))}\n\n"
+            f"Do you want to restore it?"
+        )
+        if not restore:
+            self.journal.discard()
+            return
+        
+        self.show_meeting(meeting_data, meeting_dir)
+        self.journal.resume()
+        self.status_label.configure(text="♻️ Unsaved meeting recovered - save it to keep it", text_color=("#4a9eff", "#66b3ff"))
+    
     def save_meeting_as(self):
         """Save meeting data to a new file with custom filename"""
         if not self.current_meeting['title']:
             messagebox.showerror("Error", "No meeting data to save!")
             return
+        if self.block_while_busy():
+            return
         
         try:
             # Open file dialog to choose save location and filename
+            extension = meeting_extension(self.meeting_format, self.meeting_compression)
             filename = filedialog.asksaveasfilename(
                 title="Save Meeting As",
-                defaultextension=".json",
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+                defaultextension=extension,
+                filetypes=self.meeting_filetypes(),
                 initialdir=".",
-                initialname=f"meeting_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{self.current_meeting['title'].replace(' ', '_')}.json"
+                initialname=meeting_filename(self.current_meeting['title'], extension=extension)
             )
             
             if not filename:
                 return  # User cancelled
             
-            # Prepare meeting data
-            meeting_data = {
-                'title': self.current_meeting['title'],
-                'start_time': self.current_meeting['start_time'].isoformat() if self.current_meeting['start_time'] else None,
-                'end_time': datetime.now().isoformat(),
-                'transcript': self.current_meeting['transcript'],
-                'summary': self.current_meeting['summary'],
-                'notes': self.current_meeting['notes'],
-                'screenshots': self.current_meeting['screenshots']
-            }
-            
-            # Save to file
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(meeting_data, f, indent=2, ensure_ascii=False)
-            
-            # Save screenshots to separate folder if any exist
-            if self.current_meeting['screenshots']:
-                try:
-                    # Create screenshots directory
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    screenshots_dir = f"screenshots_{timestamp}_{self.current_meeting['title'].replace(' ', '_')}"
-                    os.makedirs(screenshots_dir, exist_ok=True)
-                    
-                    # Save each screenshot
-                    for screenshot_data in self.current_meeting['screenshots']:
-                        self.save_screenshot_to_file(screenshot_data, screenshots_dir)
-                    
-                    messagebox.showinfo("Success", f"Meeting saved as {filename}\nScreenshots saved to {screenshots_dir}/")
-                except Exception as screenshot_error:
-                    print(f"Warning: Could not save screenshots: {screenshot_error}")
-                    messagebox.showinfo("Success", f"Meeting saved as {filename}\nNote: Screenshots could not be saved separately")
-            else:
-                messagebox.showinfo("Success", f"Meeting saved as {filename}")
+            # Another extension typed in the dialog picks its own format
+            file_format, compression = self.meeting_format, self.meeting_compression
+            if not filename.lower().endswith(extension):
+                file_format, compression = None, None
             
-            self.status_label.configure(text="💾 Meeting saved successfully!", text_color=("#4caf50", "#66bb6a"))
+            # Images go to the asset folder next to the chosen file
+            self.start_save(filename, os.path.dirname(os.path.abspath(filename)), file_format, compression)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save meeting: {str(e)}")
     
+    def is_saving(self):
+        return self.save_thread is not None and self.save_thread.is_alive()
+    
+    def block_while_busy(self):
+        """Ask the user to wait if a save is still being written or a meeting read; True if so"""
+        if self.is_saving():
+            messagebox.showwarning("Saving", "The meeting is still being saved, please wait a moment.")
+            return True
+        if self.is_loading():
+            messagebox.showwarning("Loading", "The meeting is still being loaded, please wait a moment.")
+            return True
+        return False
+    
+    def start_save(self, filename, target_dir, file_format=None, compression=None, clear_after=False):
+        """Snapshot the meeting and write it to ``filename`` on a background thread"""
+        meeting = self.current_meeting
+        snapshot = dict(meeting)
+        for key in ('transcript', 'partial_summaries', 'notes', 'screenshots'):
+            snapshot[key] = list(meeting[key])
+        # The end of a stopped recording must be on disk before it is copied
+        recording_thread = None if self.is_recording else self.recording_thread
+        
+        self.save_button.configure(state="disabled")
+        self.save_as_button.configure(state="disabled")
+        self.status_label.configure(text="💾 Saving meeting...", text_color=("#ff9800", "#ffb74d"))
+        self.save_thread = threading.Thread(
+            target=self.save_worker,
+            args=(meeting, snapshot, self.meeting_dir, target_dir, filename, file_format, compression,
+                  recording_thread, clear_after)
+        )
+        self.save_thread.start()
+    
+    def save_worker(self, meeting, snapshot, source_dir, target_dir, filename, file_format, compression,
+                    recording_thread, clear_after):
+        """Write a meeting snapshot off the Tk thread, reporting progress"""
+        try:
+            with TELEMETRY.timer('save_meeting'):
+                # Screenshots still being encoded must be stored first
+                self.report_save_progress("Waiting for screenshots...")
+                self.screenshot_pipeline.wait()
+                if recording_thread:
+                    recording_thread.join()
+                
+                # Copy the entries now that the pipeline has finished filling them in
+                screenshots = export_screenshots(
+                    [dict(entry) for entry in snapshot['screenshots']], source_dir, target_dir,
+                    on_progress=lambda done, total: self.report_save_progress(f"Storing screenshots {done}/{total}...")
+                )
+                self.report_save_progress("Copying the recording...")
+                recording = export_recording(snapshot['recording'], source_dir, target_dir)
+                
+                meeting_data = serialize_meeting(snapshot, screenshots=screenshots, recording=recording)
+                write_meeting_file(
+                    filename, meeting_data, file_format, compression,
+                    on_progress=lambda written, total: self.report_save_progress(f"Writing {written * 100 // total}%...")
+                )
+            self.call_in_ui(self.finish_save, meeting, snapshot, filename, target_dir, meeting_data, clear_after, None)
+        except Exception as e:
+            print(f"Save error: {e}")
+            self.call_in_ui(self.finish_save, meeting, snapshot, filename, target_dir, None, clear_after, e)
+    
+    def call_in_ui(self, callback, *args):
+        """Run ``callback`` on the Tk thread (any thread); dropped once the window has closed"""
+        if self.ui_closed:
+            return
+        try:
+            self.root.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            pass  # The main loop ended in the meantime
+    
+    def report_save_progress(self, text):
+        """Show how far a background save has got (any thread)"""
+        self.call_in_ui(lambda: self.status_label.configure(text=f"💾 {text}", text_color=("#ff9800", "#ffb74d")))
+    
+    def finish_save(self, meeting, snapshot, filename, target_dir, meeting_data, clear_after, error):
+        """Wrap up a background save on the Tk thread"""
+        self.save_button.configure(state="normal")
+        self.save_as_button.configure(state="normal")
+        if error is not None:
+            # The previous file, if any, is untouched and the journal still has everything
+            messagebox.showerror("Error", f"Failed to save meeting: {str(error)}")
+            self.status_label.configure(text="❌ Failed to save meeting", text_color=("#ff5252", "#ff7676"))
+            return
+        
+        self.register_saved_meeting(filename, meeting_data)
+        
+        # Notes, transcript or slides may have been added while the file was written
+        changed = meeting is not self.current_meeting or meeting['summary'] != snapshot['summary'] or any(
+            len(meeting[key]) != len(snapshot[key])
+            for key in ('transcript', 'partial_summaries', 'notes', 'screenshots')
+        )
+        if clear_after and not changed:
+            # Everything logged is in the meeting file now
+            self.journal.discard()
+        elif meeting is self.current_meeting:
+            # The meeting now lives next to the new file, and so do slides captured during the save
+            added = export_screenshots(meeting['screenshots'][len(snapshot['screenshots']):], self.meeting_dir, target_dir)
+            self.current_meeting['screenshots'] = meeting_data['screenshots'] + added
+            self.meeting_dir = target_dir
+            self.journal.compact(filename)
+            self.log_changes_since(snapshot)
+            for entry in added:
+                self.journal.append('screenshot', entry=entry)
+        
+        if meeting_data['screenshots']:
+            messagebox.showinfo("Success", f"Meeting saved as {filename}\nScreenshots stored in {ASSETS_DIRNAME}/")
+        else:
+            messagebox.showinfo("Success", f"Meeting saved as {filename}")
+        
+        if changed:
+            self.status_label.configure(text="💾 Meeting saved - changes made while saving are not in the file yet", text_color=("#ff9800", "#ffb74d"))
+        else:
+            self.status_label.configure(text="💾 Meeting saved successfully!", text_color=("#4caf50", "#66bb6a"))
+        
+        # Clear interface after saving
+        if clear_after and not changed:
+            self.clear_interface_after_save()
+    
+    def log_changes_since(self, snapshot):
+        """Journal what was added to the meeting after ``snapshot`` was saved"""
+        meeting = self.current_meeting
+        for op, key in (('transcript', 'transcript'), ('note', 'notes')):
+            for entry in meeting[key][len(snapshot[key]):]:
+                self.journal.append(op, entry=entry)
+        if len(meeting['partial_summaries']) != len(snapshot['partial_summaries']):
+            self.journal.append('partial_summaries', partials=meeting['partial_summaries'])
+        if meeting['summary'] != snapshot['summary']:
+            self.journal.append('summary', summary=meeting['summary'])
+    
     def clear_interface_after_save(self):
         """Clear interface after saving meeting data"""
         # Clear title entry
         self.title_entry.delete(0, "end")
         
         # Clear all text areas
-        self.transcript_text.delete("1.0", "end")
+        self.transcript_renderer.clear()
+        self.drop_summary_run()
         self.summary_text.delete("1.0", "end")
-        self.notes_text.delete("1.0", "end")
+        self.notes_renderer.clear()
         
         # Reset meeting data
         self.current_meeting = {
@@ -1128,9 +5035,12 @@ class MeetingSummarizer:
             'start_time': None,
             'transcript': [],
             'summary': '',
+            'partial_summaries': [],
             'notes': [],
-            'screenshots': []
+            'screenshots': [],
+            'recording': None
         }
+        self.meeting_dir = os.getcwd()
         
         # Reset button states
         self.record_button.configure(text="🎙️ Start Recording", fg_color=("#00c853", "#00e676"))
@@ -1143,7 +5053,7 @@ class MeetingSummarizer:
         self.status_label.configure(text="✨ Ready to record your next meeting", text_color=("#4caf50", "#66bb6a"))
         
         # Clear audio data
-        self.audio_data = []
+        self.capture_buffer.reset()
     
     def save_api_key(self):
         """Save OpenAI API key"""
@@ -1151,11 +5061,10 @@ class MeetingSummarizer:
         if api_key:
             try:
                 # Save to .env file
-                with open('.env', 'w') as f:
-                    f.write(f'OPENAI_API_KEY={api_key}')
+                set_key('.env', 'OPENAI_API_KEY', api_key)
                 
                 self.api_key = api_key
-                openai.api_key = api_key
+                self.summary_client.api_key = api_key
                 
                 messagebox.showinfo("Success", "API key saved successfully!")
                 
@@ -1164,6 +5073,68 @@ class MeetingSummarizer:
         else:
             messagebox.showwarning("Warning", "Please enter an API key!")
     
+    def select_recognizer_backend(self, label):
+        """Switch the speech recognition engine and remember the choice"""
+        for backend in RECOGNIZER_BACKENDS.values():
+            if backend.label == label:
+                break
+        else:
+            return
+        if not backend.available():
+            self.show_missing_engine(backend)
+            self.engine_menu.set(self.recognizer_backend.label)
+            return
+        
+        try:
+            self.recognizer_backend = backend()
+            self.chunk_encoder = ChunkEncoder(self.sample_rate, backend.sample_rate)
+            set_key('.env', 'RECOGNIZER_BACKEND', backend.name)
+            self.status_label.configure(text=f"🎤 Speech recognition: {backend.label}", text_color=("#4caf50", "#66bb6a"))
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to switch recognition engine: {str(e)}")
+    
+    def show_missing_engine(self, backend):
+        """Tell the user which package a recognition engine needs"""
+        messagebox.showerror(
+            "Engine Not Installed",
+            f"{backend.label} needs the {backend.package} package.\n\n"
+            f"Install it with: pip install {backend.package}"
+        )
+        self.status_label.configure(text=f"❌ {backend.package} is not installed", text_color=("#ff5252", "#ff7676"))
+    
+    def select_screenshot_format(self, image_format):
+        """Switch the screenshot image format and remember the choice"""
+        self.screenshot_format = image_format
+        try:
+            set_key('.env', 'SCREENSHOT_FORMAT', image_format)
+        except Exception as e:
+            print(f"Could not save screenshot format: {e}")
+    
+    def select_meeting_format(self, label):
+        """Switch the format new meeting files are saved in and remember the choice"""
+        for serializer in MEETING_FORMATS.values():
+            if serializer.label == label:
+                break
+        else:
+            return
+        self.meeting_format = serializer.name
+        try:
+            set_key('.env', 'MEETING_FORMAT', serializer.name)
+        except Exception as e:
+            print(f"Could not save meeting format: {e}")
+    
+    def select_meeting_compression(self, compression):
+        """Switch the compression of new meeting files and remember the choice"""
+        self.meeting_compression = compression
+        try:
+            set_key('.env', 'MEETING_COMPRESSION', compression)
+        except Exception as e:
+            print(f"Could not save meeting compression: {e}")
+    
+    def meeting_filetypes(self):
+        """File dialog filter for meeting files of every format"""
+        return [("Meeting files", " ".join(f"*{extension}" for extension in MEETING_EXTENSIONS)), ("All files", "*.*")]
+    
     def show_quick_start(self):
         """Show quick start guide"""
         quick_start_text = """
@@ -1243,21 +5214,41 @@ class MeetingSummarizer:
    • Screenshots are timestamped and stored
    • Use '🖼️ View Screenshots' to review all captures
    • Screenshots saved with meeting data
+   • Repeated shots of the same screen are stored only once
+   • '🎞️ Auto Capture' grabs the screen every few seconds and
+     keeps a shot only when the slide has changed
+     (this app's own window is blanked out of those shots)
 
 💾 SAVING:
    • Data saved as JSON file
    • Filename includes timestamp and title
-   • Screenshots saved to separate folder
+   • Screenshots saved as image files in meeting_assets folder
    • Interface automatically clears after saving
    • Ready for next meeting
 
 📂 LOADING MEETINGS:
    • Use '📂 Load Meeting' button to open saved files
    • All data (transcript, notes, screenshots) is restored
+   • Large files show the transcript right away and finish loading in the background
    • Can add more notes or take additional screenshots
    • Use '💾 Save As' to save changes with new filename
    • Perfect for continuing work on previous meetings
 
+🔍 SEARCH:
+   • Search titles, transcripts, notes and summaries of all saved meetings
+   • Matches are ranked best first, with the meeting and time
+   • Double-click a match to open the meeting at that entry
+   • '🔄 Rebuild Index' re-reads all meeting files in the folder
+
+📚 LIBRARY:
+   • Lists every meeting in the folder with date, duration and counts
+   • Double-click a meeting to open it
+
+📊 DIAGNOSTICS:
+   • Latency of each pipeline stage (capture, recognition, summary, saving)
+   • Counters such as dropped chunks and recognition errors
+   • The same numbers are written to metrics.prom every 15 seconds
+
 🔄 WORKFLOW OPTIONS:
    Option 1: Record → Stop → Save → Clear
    Option 2: Record → Stop → Edit → Save → Clear
@@ -1288,11 +5279,23 @@ class MeetingSummarizer:
    • Filename format: meeting_YYYYMMDD_HHMMSS_Title.json
    • Can be moved or copied to other locations
 
+💾 MEETING FILE FORMAT:
+   • JSON: readable text, fast with 'pip install orjson'
+   • Binary (MessagePack): about half the size, needs 'pip install msgpack'
+   • gzip or zstd compression shrinks files about 6x (zstd needs 'pip install zstandard')
+   • Any format opens automatically; choice is saved locally in .env file
+
+🎤 SPEECH RECOGNITION ENGINE:
+   • Google: online, needs an internet connection
+   • PocketSphinx: offline, needs 'pip install pocketsphinx'
+   • Whisper: offline, needs 'pip install openai-whisper'
+   • Choice is saved locally in .env file
+
 🔧 TECHNICAL SETTINGS:
    • Sample rate: 44.1 kHz (CD quality)
    • Audio format: 16-bit PCM
    • Recording: System audio input
-   • Transcription: Google Speech Recognition
+   • Transcription: Google Speech Recognition (default)
 """
         self.show_help_dialog("⚙️ Settings Help", settings_text)
     
@@ -1427,10 +5430,210 @@ class MeetingSummarizer:
         # Focus on the help window
         help_window.focus_set()
     
-    def run(self):
+    def window_shown(self):
+        """First pass of the event loop: the window is on screen"""
+        self.root.update_idletasks()
+        STARTUP_PROFILE.mark("first frame")
+        self.prewarm_thread = threading.Thread(target=self.prewarm, name="prewarm", daemon=True)
+        self.prewarm_thread.start()
+    
+    def prewarm(self):
+        """Import deferred modules and open the audio devices in the background"""
+        for module in DEFERRED_MODULES:
+            try:
+                module.load_module()
+            except Exception as e:
+                print(f"Prewarm error: {e}")
+        try:
+            sd.query_devices()
+        except Exception as e:
+            print(f"Audio device error: {e}")
+    
+    def report_startup(self):
+        """Print the startup profile once prewarming is done, then quit"""
+        if self.prewarm_thread is None or self.prewarm_thread.is_alive():
+            self.root.after(50, self.report_startup)
+            return
+        print(STARTUP_PROFILE.report())
+        self.root.destroy()
+    
+    def run(self, profile_startup=False):
         """Start the application"""
+        if profile_startup:
+            self.root.after(0, self.report_startup)
         self.root.mainloop()
+        self.ui_closed = True
+        self.load_cancel.set()
+        # Let a save that is still writing finish before the journal closes; the
+        # journal is kept, so the meeting is offered for recovery on the next start
+        if self.save_thread:
+            self.save_thread.join()
+        self.journal.close()
+        try:
+            TELEMETRY.write(METRICS_FILENAME)
+        except Exception as e:
+            print(f"Metrics export error: {e}")
 
-if __name__ == "__main__":
+
+AUDIO_EXTENSIONS = ('.wav',)
+
+
+def process_audio_file(path, output_dir, engine='google', vad_enabled=True, summarize=True,
+                       file_format='orjson', compression='none'):
+    """Transcribe (and summarize) one recording into a meeting file; runs in a worker process.
+
+    Raises if any chunk could not be recognized, rather than writing an
+    incomplete meeting.
+    """
+    started = time.perf_counter()
+    samples, sample_rate = load_audio_file(path)
+    duration = len(samples) / sample_rate
+    backend = create_recognizer_backend(engine)
+    results, errors = transcribe_samples(samples, sample_rate, backend, create_segmenter(sample_rate, vad_enabled))
+    if errors:
+        raise RuntimeError(f"speech recognition failed for {len(errors)} chunk(s): {errors[0]}")
+
+    name = os.path.splitext(os.path.basename(path))[0]
+    if is_recording_format(path):
+        recording = {
+            'file': os.path.relpath(os.path.abspath(path), os.path.abspath(output_dir)).replace(os.sep, '/'),
+            'sample_rate': sample_rate
+        }
+    else:
+        # Playback reads 16-bit mono, so other formats get a copy like a live recording
+        recording = {'file': f"{RECORDINGS_DIRNAME}/{name}.wav", 'sample_rate': 16000}
+        write_recording(os.path.join(output_dir, RECORDINGS_DIRNAME, f"{name}.wav"),
+                        ChunkEncoder(sample_rate, 16000).resample(samples), 16000)
+
+    # The file was last written when the meeting ended
+    start_time = datetime.fromtimestamp(os.path.getmtime(path)) - timedelta(seconds=duration)
+    transcript = []
+    for start, stop, result in results:
+        entry = make_transcript_entry(result, start_time, start / sample_rate)
+        entry['audio_offset'] = start * recording['sample_rate'] // sample_rate
+        entry['audio_length'] = (stop - start) * recording['sample_rate'] // sample_rate
+        transcript.append(entry)
+
+    meeting = {
+        'title': name.replace('_', ' '),
+        'start_time': start_time,
+        'transcript': transcript,
+        'summary': '',
+        'partial_summaries': [],
+        'notes': [],
+        'screenshots': [],
+        'recording': recording
+    }
+
+    api_key = os.getenv('OPENAI_API_KEY')
+    if summarize and api_key and transcript:
+        summarizer = RollingSummarizer(SummaryClient(api_key, cache=SummaryCache('.summary_cache.sqlite')).chat_completion)
+        meeting['summary'] = summarizer.summarize(meeting)
+        summarizer.executor.shutdown()
+
+    filename = os.path.join(
+        output_dir, meeting_filename(meeting['title'], start_time, meeting_extension(file_format, compression))
+    )
+    write_meeting_file(filename, serialize_meeting(meeting, end_time=start_time + timedelta(seconds=duration)),
+                       file_format, compression)
+    return {
+        'file': filename,
+        'audio_seconds': duration,
+        'elapsed': time.perf_counter() - started,
+        'entries': len(transcript),
+    }
+
+
+def run_batch(directory, output_dir=None, workers=None, engine='google', vad_enabled=True, summarize=True,
+              file_format='orjson', compression='none'):
+    """Process every recording in ``directory`` on a pool of worker processes"""
+    output_dir = output_dir or directory
+    files = sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.lower().endswith(AUDIO_EXTENSIONS)
+    )
+    if not files:
+        print(f"No audio files found in {directory}")
+        return 1
+    os.makedirs(output_dir, exist_ok=True)
+
+    print(f"Processing {len(files)} file(s) with {workers or os.cpu_count()} worker(s)...")
+    started = time.perf_counter()
+    failed = 0
+    audio_seconds = 0.0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(process_audio_file, path, output_dir, engine, vad_enabled, summarize,
+                        file_format, compression): path
+            for path in files
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            name = os.path.basename(futures[future])
+            try:
+                stats = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"[{done}/{len(files)}] {name}: error: {e}")
+                continue
+            audio_seconds += stats['audio_seconds']
+            print(
+                f"[{done}/{len(files)}] {name}: {stats['audio_seconds']:.0f} s of audio in {stats['elapsed']:.1f} s "
+                f"({stats['audio_seconds'] / max(stats['elapsed'], 1e-6):.1f}x real time), "
+                f"{stats['entries']} entries{'' if stats['entries'] else ' (no speech found)'} "
+                f"-> {os.path.basename(stats['file'])}"
+            )
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"Done: {len(files) - failed} of {len(files)} file(s), {audio_seconds / 60:.1f} min of audio "
+        f"in {elapsed:.1f} s ({audio_seconds / max(elapsed, 1e-6):.1f}x real time)"
+    )
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Meeting Summarizer Pro")
+    parser.add_argument("--batch", metavar="DIR", help="transcribe and summarize the WAV files in DIR without the GUI")
+    parser.add_argument("--output", metavar="DIR", help="folder for the meeting files written in batch mode (default: DIR)")
+    parser.add_argument("--workers", type=int, help="worker processes for batch mode and reindexing (default: one per CPU)")
+    parser.add_argument("--engine", choices=sorted(RECOGNIZER_BACKENDS),
+                        default=os.getenv('RECOGNIZER_BACKEND', 'google'), help="speech recognition engine")
+    parser.add_argument("--no-vad", action="store_true", help="cut audio into fixed chunks instead of at pauses")
+    parser.add_argument("--no-summary", action="store_true", help="skip the AI summary in batch mode")
+    parser.add_argument("--format", choices=sorted(MEETING_FORMATS), default=os.getenv('MEETING_FORMAT', 'orjson'),
+                        help="format of the meeting files written in batch mode")
+    parser.add_argument("--compression", choices=sorted(MEETING_COMPRESSIONS),
+                        default=os.getenv('MEETING_COMPRESSION', 'none'), help="compression of those meeting files")
+    parser.add_argument("--reindex", nargs="?", const=".", metavar="DIR",
+                        help="rebuild the search index from the meeting files in DIR (default: current folder)")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print how long each startup phase and deferred import takes, then exit")
+    args = parser.parse_args(argv)
+
+    if args.reindex:
+        started = time.perf_counter()
+        meetings, entries = MeetingIndex(INDEX_FILENAME).rebuild(args.reindex, args.workers)
+        print(f"Indexed {meetings} meetings ({entries} entries) in {time.perf_counter() - started:.1f} s")
+        return 0
+
+    if args.batch:
+        if not compression_available(args.compression):
+            parser.error(f"{args.compression} compression needs the {MEETING_COMPRESSIONS[args.compression][2]} package")
+        backend = RECOGNIZER_BACKENDS[args.engine]
+        if not backend.available():
+            parser.error(f"the {backend.name} engine needs the {backend.package} package")
+        file_format = create_meeting_serializer(args.format).name
+        return run_batch(args.batch, args.output, args.workers, args.engine,
+                         vad_enabled=not args.no_vad, summarize=not args.no_summary,
+                         file_format=file_format, compression=args.compression)
+
+    for module in GUI_MODULES:
+        module.load_module()
+    STARTUP_PROFILE.mark("GUI imports")
     app = MeetingSummarizer()
-    app.run()
+    app.run(profile_startup=args.profile_startup)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
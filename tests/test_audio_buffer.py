@@ -0,0 +1,89 @@
+"""Capture ring buffer: wraparound, overruns and blocks as large as the buffer"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from meeting_summarizer import AudioRingBuffer  # noqa: E402
+
+
+def ramp(start, stop):
+    return np.arange(start, stop, dtype=np.float32)
+
+
+def test_read_across_wraparound():
+    buffer = AudioRingBuffer(100)
+    for start in range(0, 160, 40):
+        buffer.write(ramp(start, start + 40))
+
+    assert buffer.write_pos == 160
+    assert len(buffer.views(90, 130)) == 2  # Crosses the end of the array
+    np.testing.assert_array_equal(buffer.read(90, 130), ramp(90, 130))
+    np.testing.assert_array_equal(buffer.read(60, 160), ramp(60, 160))
+    assert buffer.overruns == 0
+
+
+def test_overwritten_samples_are_an_overrun():
+    buffer = AudioRingBuffer(100)
+    for start in range(0, 250, 50):
+        buffer.write(ramp(start, start + 50))
+
+    assert buffer.read(100, 180) is None
+    assert (buffer.overruns, buffer.overrun_samples) == (1, 80)
+    np.testing.assert_array_equal(buffer.read(150, 250), ramp(150, 250))
+
+
+def test_catch_up_skips_to_oldest_sample():
+    buffer = AudioRingBuffer(100)
+    buffer.write(ramp(0, 250))
+
+    assert buffer.catch_up(20) == 150
+    assert (buffer.overruns, buffer.overrun_samples) == (1, 130)
+    assert buffer.catch_up(200) == 200
+
+
+def test_read_during_write_in_progress():
+    buffer = AudioRingBuffer(100)
+    buffer.write(ramp(0, 100))
+    # A 30-sample write has announced itself but not finished
+    buffer.reserved_pos = 130
+
+    assert buffer.read(10, 50) is None
+    np.testing.assert_array_equal(buffer.read(30, 100), ramp(30, 100))
+
+
+def test_block_as_large_as_buffer_does_not_stick():
+    buffer = AudioRingBuffer(100)
+    buffer.write(ramp(0, 100))
+    np.testing.assert_array_equal(buffer.read(0, 100), ramp(0, 100))
+
+    buffer.write(ramp(100, 110))
+    buffer.write(ramp(110, 120))
+
+    np.testing.assert_array_equal(buffer.read(20, 120), ramp(20, 120))
+    assert buffer.oldest_pos() == 20
+
+
+def test_oversized_block_keeps_newest_samples():
+    buffer = AudioRingBuffer(100)
+    buffer.write(ramp(0, 10))
+    buffer.write(ramp(10, 260))
+
+    assert buffer.write_pos == 260
+    assert buffer.read(150, 160) is None
+    np.testing.assert_array_equal(buffer.read(160, 260), ramp(160, 260))
+
+
+def test_reset_forgets_everything():
+    buffer = AudioRingBuffer(100)
+    buffer.write(ramp(0, 250))
+    buffer.read(0, 10)
+
+    buffer.reset()
+
+    assert (buffer.write_pos, buffer.oldest_pos(), buffer.overruns) == (0, 0, 0)
+    buffer.write(ramp(0, 30))
+    np.testing.assert_array_equal(buffer.read(0, 30), ramp(0, 30))
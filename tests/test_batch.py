@@ -0,0 +1,80 @@
+"""Batch processing of recordings: failed recognition and recording links"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pytest
+import scipy.io.wavfile as wavfile
+import speech_recognition as sr
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from meeting_summarizer import (  # noqa: E402
+    RECOGNIZER_BACKENDS, RecognitionResult, RecognizerBackend, process_audio_file, read_meeting_file,
+    read_recording, run_batch
+)
+
+
+class EchoBackend(RecognizerBackend):
+    def recognize(self, audio_data):
+        return RecognitionResult("hello", 0.9, time.time(), 0.0)
+
+
+class OfflineBackend(RecognizerBackend):
+    def recognize(self, audio_data):
+        raise sr.RequestError("recognition connection failed")
+
+
+def speech(rate, seconds=6):
+    """Two seconds of tone, one of silence, repeated"""
+    t = np.arange(rate * seconds) / rate
+    return (0.3 * np.sin(2 * np.pi * 220 * t) * (t % 3 < 2)).astype(np.float32)
+
+
+def test_failed_recognition_is_not_saved(tmp_path, monkeypatch):
+    monkeypatch.setitem(RECOGNIZER_BACKENDS, 'google', OfflineBackend)
+    wavfile.write(tmp_path / "standup.wav", 16000, (speech(16000) * 32767).astype(np.int16))
+
+    with pytest.raises(RuntimeError, match="recognition failed"):
+        process_audio_file(str(tmp_path / "standup.wav"), str(tmp_path), summarize=False)
+    assert os.listdir(tmp_path) == ["standup.wav"]
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason="workers only see the patched backend when forked")
+def test_batch_exit_status_on_failure(tmp_path, monkeypatch, capsys):
+    monkeypatch.setitem(RECOGNIZER_BACKENDS, 'google', OfflineBackend)
+    wavfile.write(tmp_path / "standup.wav", 16000, (speech(16000) * 32767).astype(np.int16))
+
+    assert run_batch(str(tmp_path), workers=1, summarize=False) == 1
+    assert "Done: 0 of 1" in capsys.readouterr().out
+    assert os.listdir(tmp_path) == ["standup.wav"]
+
+
+@pytest.mark.parametrize("channels", [1, 2])
+def test_recording_of_other_formats_is_playable(tmp_path, monkeypatch, channels):
+    monkeypatch.setitem(RECOGNIZER_BACKENDS, 'google', EchoBackend)
+    samples = speech(44100)
+    wavfile.write(tmp_path / "review.wav", 44100, np.stack([samples] * channels, axis=1))
+
+    stats = process_audio_file(str(tmp_path / "review.wav"), str(tmp_path), summarize=False)
+    meeting = read_meeting_file(stats['file'])
+
+    assert meeting['recording'] == {'file': "recordings/review.wav", 'sample_rate': 16000}
+    entry = meeting['transcript'][0]
+    recording = str(tmp_path / "recordings" / "review.wav")
+    played, rate = read_recording(recording, entry['audio_offset'], entry['audio_length'])
+    assert rate == 16000
+    assert len(played) == entry['audio_length']
+    assert np.abs(played).max() == pytest.approx(0.3, abs=0.02)
+
+
+def test_pcm16_mono_recording_is_linked(tmp_path, monkeypatch):
+    monkeypatch.setitem(RECOGNIZER_BACKENDS, 'google', EchoBackend)
+    wavfile.write(tmp_path / "review.wav", 22050, (speech(22050) * 32767).astype(np.int16))
+
+    stats = process_audio_file(str(tmp_path / "review.wav"), str(tmp_path), summarize=False)
+
+    assert read_meeting_file(stats['file'])['recording'] == {'file': "review.wav", 'sample_rate': 22050}
+    assert not os.path.exists(tmp_path / "recordings")
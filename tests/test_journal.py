@@ -0,0 +1,114 @@
+"""Replay of the crash journal, including a torn last line and logs on top of a saved file"""
+
+import json
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from meeting_summarizer import MeetingJournal, serialize_meeting, write_meeting_file  # noqa: E402
+
+
+def new_meeting():
+    return {
+        'title': "Standup",
+        'start_time': datetime(2024, 1, 1, 9, 30),
+        'transcript': [],
+        'summary': '',
+        'partial_summaries': [],
+        'notes': [],
+        'screenshots': [],
+        'recording': {'file': "recordings/recording_20240101_093000.wav", 'sample_rate': 16000},
+    }
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = MeetingJournal(str(tmp_path / "journal.jsonl"), sync_interval=60)
+    yield journal
+    journal.close()
+
+
+def test_replay_of_new_meeting(tmp_path, journal):
+    journal.start(new_meeting(), str(tmp_path))
+    journal.append('transcript', entry={'timestamp': "09:30:05", 'text': "Hello"})
+    journal.append('note', entry={'timestamp': "09:31:00", 'text': "Ship it"})
+    journal.append('partial_summaries', partials=[{'level': 0, 'summary': "Greetings"}])
+    journal.append('summary', summary="Short standup")
+    journal.sync()
+
+    meeting_data, meeting_dir, changes = MeetingJournal.replay(journal.path)
+
+    assert meeting_dir == str(tmp_path)
+    assert changes == 4
+    assert meeting_data['title'] == "Standup"
+    assert meeting_data['start_time'] == "2024-01-01T09:30:00"
+    assert meeting_data['transcript'] == [{'timestamp': "09:30:05", 'text': "Hello"}]
+    assert meeting_data['notes'] == [{'timestamp': "09:31:00", 'text': "Ship it"}]
+    assert meeting_data['partial_summaries'] == [{'level': 0, 'summary': "Greetings"}]
+    assert meeting_data['summary'] == "Short standup"
+    assert meeting_data['recording'] == new_meeting()['recording']
+
+
+def test_replay_skips_torn_last_line(tmp_path, journal):
+    journal.start(new_meeting(), str(tmp_path))
+    journal.append('transcript', entry={'timestamp': "09:30:05", 'text': "Hello"})
+    journal.sync()
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'op': 'note', 'entry': {'text': "cut off"}})[:-7])
+
+    meeting_data, _, changes = MeetingJournal.replay(journal.path)
+    assert changes == 1
+    assert meeting_data['notes'] == []
+
+    # Logging goes on after the torn line without merging into it
+    journal.resume()
+    journal.append('note', entry={'timestamp': "09:40:00", 'text': "After the crash"})
+    journal.sync()
+    meeting_data, _, changes = MeetingJournal.replay(journal.path)
+    assert changes == 2
+    assert meeting_data['notes'] == [{'timestamp': "09:40:00", 'text': "After the crash"}]
+
+
+def test_replay_on_top_of_saved_file(tmp_path, journal):
+    meeting = new_meeting()
+    meeting['transcript'] = [{'timestamp': "09:30:05", 'text': "Hello"}]
+    filename = str(tmp_path / "standup.json")
+    write_meeting_file(filename, serialize_meeting(meeting, end_time=datetime(2024, 1, 1, 10, 0)), 'json')
+
+    journal.compact(filename)
+    journal.append('transcript', entry={'timestamp': "09:45:00", 'text': "One more thing"})
+    journal.sync()
+    meeting_data, meeting_dir, changes = MeetingJournal.replay(journal.path)
+
+    assert (meeting_dir, changes) == (str(tmp_path), 1)
+    assert [entry['text'] for entry in meeting_data['transcript']] == ["Hello", "One more thing"]
+
+
+def test_replay_with_missing_saved_file(tmp_path, journal):
+    journal.compact(str(tmp_path / "gone.json"))
+    journal.append('note', entry={'timestamp': "09:45:00", 'text': "Orphan"})
+    journal.sync()
+
+    with pytest.raises(OSError):
+        MeetingJournal.replay(journal.path)
+
+
+def test_nothing_is_logged_after_close(tmp_path, journal):
+    journal.start(new_meeting(), str(tmp_path))
+    journal.append('note', entry={'timestamp': "09:31:00", 'text': "Kept"})
+    journal.close()
+    journal.append('note', entry={'timestamp': "09:50:00", 'text': "Belongs to the next meeting"})
+    journal.sync()
+
+    meeting_data, _, _ = MeetingJournal.replay(journal.path)
+    assert [note['text'] for note in meeting_data['notes']] == ["Kept"]
+
+
+def test_header_only_log_has_no_changes(tmp_path, journal):
+    journal.start(new_meeting(), str(tmp_path))
+
+    assert MeetingJournal.replay(journal.path)[2] == 0
@@ -0,0 +1,132 @@
+"""Meeting catalog scans: only new and changed files are read, removed files are dropped"""
+
+import json
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import meeting_summarizer  # noqa: E402
+from meeting_summarizer import MeetingCatalog, serialize_meeting, write_meeting_file  # noqa: E402
+
+
+def save_meeting(path, title, lines, day=1, mtime=None):
+    meeting = {
+        'title': title,
+        'start_time': datetime(2024, 1, day, 9, 0),
+        'transcript': [{'timestamp': "09:00:00", 'text': text} for text in lines],
+        'summary': '',
+        'partial_summaries': [],
+        'notes': [],
+        'screenshots': [],
+    }
+    write_meeting_file(str(path), serialize_meeting(meeting, end_time=datetime(2024, 1, day, 9, 30)), 'json')
+    if mtime is not None:
+        os.utime(str(path), (mtime, mtime))
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Paths whose header the catalog read"""
+    paths = []
+    read_header = meeting_summarizer.read_meeting_header
+
+    def counting_read_header(path, *args, **kwargs):
+        paths.append(os.path.basename(path))
+        return read_header(path, *args, **kwargs)
+
+    monkeypatch.setattr(meeting_summarizer, 'read_meeting_header', counting_read_header)
+    return paths
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = MeetingCatalog(str(tmp_path / "catalog.sqlite"))
+    yield catalog
+    catalog.connection.close()
+
+
+@pytest.fixture
+def meetings(tmp_path):
+    directory = tmp_path / "meetings"
+    directory.mkdir()
+    return directory
+
+
+def test_first_scan_reads_every_meeting(meetings, catalog, reads):
+    save_meeting(meetings / "a.json", "Standup", ["one", "two"], day=1)
+    save_meeting(meetings / "b.json", "Planning", ["one"], day=2)
+    (meetings / "notes.txt").write_text("not a meeting")
+
+    found = catalog.scan(str(meetings))
+
+    assert [m['title'] for m in found] == ["Planning", "Standup"]  # Newest first
+    assert found[1]['transcript_entries'] == 2 and found[1]['duration_seconds'] == 1800
+    assert sorted(reads) == ["a.json", "b.json"]
+
+
+def test_rescan_reads_only_changed_files(meetings, catalog, reads):
+    save_meeting(meetings / "a.json", "Standup", ["one"], mtime=1_700_000_000)
+    save_meeting(meetings / "b.json", "Planning", ["one"], day=2, mtime=1_700_000_000)
+    catalog.scan(str(meetings))
+    reads.clear()
+
+    assert len(catalog.scan(str(meetings))) == 2
+    assert reads == []
+
+    # Same size, newer modification time
+    save_meeting(meetings / "a.json", "Standup", ["two"], mtime=1_700_000_100)
+    catalog.scan(str(meetings))
+    assert reads == ["a.json"]
+
+    reads.clear()
+    save_meeting(meetings / "b.json", "Planning v2", ["one", "two", "three"], day=2, mtime=1_700_000_000)
+    found = catalog.scan(str(meetings))
+    assert reads == ["b.json"]
+    assert [(m['title'], m['transcript_entries']) for m in found] == [("Planning v2", 3), ("Standup", 1)]
+
+
+def test_removed_files_are_dropped(meetings, catalog):
+    save_meeting(meetings / "a.json", "Standup", ["one"])
+    save_meeting(meetings / "b.json", "Planning", ["one"], day=2)
+    catalog.scan(str(meetings))
+
+    os.remove(str(meetings / "b.json"))
+
+    assert [m['title'] for m in catalog.scan(str(meetings))] == ["Standup"]
+    assert catalog.connection.execute("SELECT COUNT(*) FROM catalog").fetchone()[0] == 1
+
+
+def test_scan_leaves_other_directories_alone(tmp_path, meetings, catalog):
+    (meetings / "archive").mkdir()
+    save_meeting(meetings / "a.json", "Standup", ["one"])
+    save_meeting(meetings / "archive" / "old.json", "Archived", ["one"])
+    catalog.scan(str(meetings / "archive"))
+
+    assert [m['title'] for m in catalog.scan(str(meetings))] == ["Standup"]
+    # The archive's row survives a scan of its parent, which never lists it
+    assert [m['title'] for m in catalog.meetings(str(meetings / "archive"))] == ["Archived"]
+
+
+def test_file_without_header_is_parsed_once(meetings, catalog, reads):
+    legacy = {'title': "Legacy", 'start_time': "2023-06-01T09:00:00", 'end_time': "2023-06-01T10:00:00",
+              'transcript': [{'timestamp': "09:00:00", 'text': "hi"}], 'summary': "Done", 'notes': []}
+    (meetings / "legacy.json").write_text(json.dumps(legacy))
+
+    found = catalog.scan(str(meetings))
+    reads.clear()
+    catalog.scan(str(meetings))
+
+    assert reads == []
+    assert (found[0]['title'], found[0]['has_summary'], found[0]['duration_seconds']) == ("Legacy", 1, 3600)
+
+
+def test_unreadable_files_are_skipped(meetings, catalog):
+    save_meeting(meetings / "a.json", "Standup", ["one"])
+    (meetings / "broken.json.gz").write_bytes(b"\x1f\x8b\x08\x00 truncated")
+    (meetings / "other.json").write_text(json.dumps({'not': "a meeting"}))
+
+    assert [m['title'] for m in catalog.scan(str(meetings))] == ["Standup"]
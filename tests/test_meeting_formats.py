@@ -0,0 +1,207 @@
+"""Round trips of meeting files through every format and compression, and streamed reads"""
+
+import base64
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from meeting_summarizer import (  # noqa: E402
+    MEETING_COMPRESSIONS, MEETING_FORMATS, DeferredImage, MeetingFileStream, compression_available,
+    iter_meeting_file, meeting_extension, meeting_file_format, read_meeting_file, read_meeting_header,
+    screenshot_bytes, serialize_meeting, write_meeting_file
+)
+
+COMBINATIONS = [
+    (file_format, compression) for file_format in MEETING_FORMATS for compression in MEETING_COMPRESSIONS
+]
+
+
+def make_meeting(entries=300):
+    start_time = datetime(2024, 1, 1, 10, 0, 0)
+    return {
+        'title': "Quarterly review – ünïcode",
+        'start_time': start_time,
+        'transcript': [
+            {
+                'timestamp': (start_time + timedelta(seconds=n * 5)).strftime("%H:%M:%S"),
+                'text': f"Entry {n} with \"quotes\", a backslash \\ and emoji 📈",
+                'confidence': 0.5 + n % 50 / 100,
+                'audio_offset': n * 80000,
+                'audio_length': 64000,
+            }
+            for n in range(entries)
+        ],
+        'summary': "Key points:\n- ship on Friday",
+        'partial_summaries': [{'level': 0, 'start': 0, 'end': entries, 'summary': "All of it"}],
+        'notes': [{'timestamp': "10:02:00", 'text': "Follow up with sales"}],
+        'screenshots': [
+            {'timestamp': "10:03:00", 'filename': "screenshot_10-03-00.png",
+             'ref': "meeting_assets/" + "ab" * 32 + ".png", 'sha256': "ab" * 32, 'phash': "0f0f0f0f0f0f0f0f"},
+        ],
+        'recording': {'file': "recordings/recording_20240101_100000.wav", 'sample_rate': 16000},
+    }
+
+
+def available(file_format, compression):
+    if not MEETING_FORMATS[file_format].available():
+        pytest.skip(f"{file_format} needs {MEETING_FORMATS[file_format].module}")
+    if not compression_available(compression):
+        pytest.skip(f"{compression} needs {MEETING_COMPRESSIONS[compression][2]}")
+
+
+@pytest.mark.parametrize("file_format, compression", COMBINATIONS)
+def test_round_trip(tmp_path, file_format, compression):
+    available(file_format, compression)
+    meeting_data = serialize_meeting(make_meeting(), end_time=datetime(2024, 1, 1, 11, 0, 0))
+    filename = str(tmp_path / ("meeting" + meeting_extension(file_format, compression)))
+
+    write_meeting_file(filename, meeting_data, file_format, compression)
+
+    assert read_meeting_file(filename) == meeting_data
+    assert read_meeting_header(filename) == meeting_data['meta']
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+@pytest.mark.parametrize("file_format, compression", COMBINATIONS)
+def test_round_trip_mixed_transcript_keys(tmp_path, file_format, compression):
+    available(file_format, compression)
+    meeting = make_meeting(entries=20)
+    del meeting['transcript'][3]['confidence']
+    meeting['transcript'][7]['speaker'] = "Alex"
+    meeting_data = serialize_meeting(meeting, end_time=datetime(2024, 1, 1, 11, 0, 0))
+    filename = str(tmp_path / ("meeting" + meeting_extension(file_format, compression)))
+
+    write_meeting_file(filename, meeting_data, file_format, compression)
+
+    assert read_meeting_file(filename) == meeting_data
+
+
+@pytest.mark.parametrize("file_format, compression", COMBINATIONS)
+def test_extension_names_format(file_format, compression):
+    expected = 'orjson' if file_format in ('json', 'orjson') else file_format
+    assert meeting_file_format("meeting" + meeting_extension(file_format, compression)) == (expected, compression)
+
+
+def test_header_of_legacy_file(tmp_path):
+    filename = tmp_path / "meeting.json"
+    filename.write_text('{"title": "Before the meta block", "transcript": []}', encoding='utf-8')
+
+    assert read_meeting_header(str(filename)) is None
+    assert read_meeting_file(str(filename))['title'] == "Before the meta block"
+
+
+@pytest.mark.parametrize("compression", ['gzip', 'zstd'])
+def test_corrupt_compressed_file(tmp_path, compression):
+    available('json', compression)
+    filename = tmp_path / ("meeting" + meeting_extension('json', compression))
+    filename.write_bytes(MEETING_COMPRESSIONS[compression][1] + b"not really compressed")
+
+    with pytest.raises(ValueError):
+        read_meeting_file(str(filename))
+    with pytest.raises(ValueError):
+        read_meeting_header(str(filename))
+
+
+def legacy_meeting(images=3):
+    """Meeting data as old versions saved it: screenshots inline as base64"""
+    meeting_data = serialize_meeting(make_meeting(), end_time=datetime(2024, 1, 1, 11, 0, 0))
+    del meeting_data['meta']
+    meeting_data['screenshots'] = [
+        {'timestamp': f"10:0{n}:00", 'filename': f"screenshot_{n}.png",
+         'image': base64.b64encode(os.urandom(5000 + n)).decode('ascii')}
+        for n in range(images)
+    ]
+    return meeting_data
+
+
+def collect(pairs):
+    """Meeting data put back together from streamed ``(key, value)`` pairs"""
+    meeting_data = {}
+    for key, value in pairs:
+        if key in MeetingFileStream.LISTS:
+            meeting_data.setdefault(key, []).extend(value)
+        else:
+            meeting_data[key] = value
+    return meeting_data
+
+
+def inline_images(meeting_data, base_dir):
+    for entry in meeting_data.get('screenshots', []):
+        if isinstance(entry.get('image'), DeferredImage):
+            entry['image'] = base64.b64encode(screenshot_bytes(entry, base_dir)).decode('ascii')
+    return meeting_data
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("chunk_size", [7, 64, 1024 * 1024])
+def test_stream_matches_json_load(tmp_path, monkeypatch, indent, chunk_size):
+    # Small chunks put values, multi-byte characters and images across chunk boundaries
+    monkeypatch.setattr(MeetingFileStream, 'CHUNK_SIZE', chunk_size)
+    filename = tmp_path / "meeting.json"
+    filename.write_text(json.dumps(legacy_meeting(), indent=indent, ensure_ascii=False), encoding='utf-8')
+    with open(filename, encoding='utf-8') as f:
+        expected = json.load(f)
+
+    streamed = collect(iter_meeting_file(str(filename), batch_size=50))
+
+    assert all(isinstance(entry['image'], DeferredImage) for entry in streamed['screenshots'])
+    assert inline_images(streamed, str(tmp_path)) == expected
+
+
+def test_stream_batches_in_order(tmp_path):
+    filename = tmp_path / "meeting.json"
+    meeting_data = legacy_meeting(images=0)
+    filename.write_text(json.dumps(meeting_data), encoding='utf-8')
+
+    pairs = list(iter_meeting_file(str(filename), batch_size=64))
+
+    assert [key for key, _ in pairs][:2] == ['title', 'start_time']
+    batches = [value for key, value in pairs if key == 'transcript']
+    assert [len(batch) for batch in batches] == [64, 64, 64, 64, 44]
+    assert [entry for batch in batches for entry in batch] == meeting_data['transcript']
+    assert ('screenshots', []) in pairs
+
+
+def test_stream_escaped_image(tmp_path):
+    filename = tmp_path / "meeting.json"
+    filename.write_text('{"screenshots": [{"image": "QUJD\\/w==", "timestamp": "x"}, {}, 5], "n": 12345}',
+                        encoding='utf-8')
+
+    streamed = collect(iter_meeting_file(str(filename)))
+
+    assert streamed['screenshots'][0]['image'].read() == b"ABC\xff"
+    assert streamed['screenshots'][1:] == [{}, 5]
+    assert streamed['n'] == 12345
+
+
+@pytest.mark.parametrize("file_format, compression", [('msgpack', 'none'), ('json', 'gzip'), ('msgpack', 'zstd')])
+def test_stream_of_binary_and_compressed_files(tmp_path, file_format, compression):
+    available(file_format, compression)
+    meeting_data = serialize_meeting(make_meeting(), end_time=datetime(2024, 1, 1, 11, 0, 0))
+    filename = str(tmp_path / ("meeting" + meeting_extension(file_format, compression)))
+    write_meeting_file(filename, meeting_data, file_format, compression)
+
+    assert collect(iter_meeting_file(filename, batch_size=50)) == read_meeting_file(filename)
+
+
+def test_deferred_image_of_changed_file(tmp_path):
+    filename = tmp_path / "meeting.json"
+    filename.write_text(json.dumps(legacy_meeting(images=1)), encoding='utf-8')
+    entry = collect(iter_meeting_file(str(filename)))['screenshots'][0]
+    os.utime(filename, (0, 0))
+
+    with pytest.raises(ValueError):
+        entry['image'].read()
+
+
+def test_stream_of_truncated_file(tmp_path):
+    filename = tmp_path / "meeting.json"
+    filename.write_text(json.dumps(legacy_meeting())[:-2000], encoding='utf-8')
+
+    with pytest.raises(ValueError):
+        collect(iter_meeting_file(str(filename)))
@@ -0,0 +1,98 @@
+"""Full-text search: ranking, prefix matches and replacing a meeting's rows when it is saved again"""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from meeting_summarizer import MeetingIndex, serialize_meeting, write_meeting_file  # noqa: E402
+
+
+def save_meeting(directory, name, title, lines, notes=(), summary=''):
+    """Write a meeting file and return ``(path, meeting_data)``"""
+    meeting = {
+        'title': title,
+        'start_time': datetime(2024, 1, 1, 9, 0),
+        'transcript': [{'timestamp': f"09:{n:02d}:00", 'text': text} for n, text in enumerate(lines)],
+        'summary': summary,
+        'partial_summaries': [],
+        'notes': [{'timestamp': "09:30:00", 'text': text} for text in notes],
+        'screenshots': [],
+    }
+    path = str(directory / name)
+    meeting_data = serialize_meeting(meeting, end_time=datetime(2024, 1, 1, 10, 0))
+    write_meeting_file(path, meeting_data, 'json')
+    return path, meeting_data
+
+
+def text_rows(index):
+    return index.connection.execute("SELECT COUNT(*) FROM meeting_text").fetchone()[0]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = MeetingIndex(str(tmp_path / "index.sqlite"))
+    yield index
+    index.connection.close()
+
+
+def test_ranks_denser_match_first(tmp_path, index):
+    index.add(*save_meeting(tmp_path, "a.json", "Standup", [
+        "We talked about lunch plans and the weather and then briefly the budget before we left",
+    ]))
+    index.add(*save_meeting(tmp_path, "b.json", "Planning", [
+        "Budget review: the budget is over, cut the budget",
+    ]))
+    index.add(*save_meeting(tmp_path, "c.json", "Retro", ["Nothing about money"]))
+
+    results = index.search("budget")
+
+    assert [result['title'] for result in results] == ["Planning", "Standup"]
+    assert results[0]['kind'] == 'transcript' and results[0]['timestamp'] == "09:00:00"
+    assert "«budget»" in results[0]['snippet'].lower()
+
+
+def test_matches_all_words_and_last_as_prefix(tmp_path, index):
+    path, meeting_data = save_meeting(tmp_path, "a.json", "Standup", [
+        "The release slipped",
+        "The release candidate is ready",
+    ], notes=["Ask about the candidates"])
+    index.add(path, meeting_data)
+
+    assert [(r['kind'], r['position']) for r in index.search("release cand")] == [('transcript', 1)]
+    assert {(r['kind'], r['position']) for r in index.search("candidate")} == {('transcript', 1), ('note', 0)}
+    assert index.search("   ") == []
+    assert index.search('"release') != []  # Quotes in a query are taken literally
+
+
+def test_resave_replaces_rows_of_that_meeting_only(tmp_path, index):
+    first, first_data = save_meeting(tmp_path, "a.json", "Standup", ["old wording", "more old wording"])
+    second, second_data = save_meeting(tmp_path, "b.json", "Planning", ["old wording elsewhere"])
+    index.add(first, first_data)
+    index.add(second, second_data)
+    assert text_rows(index) == 5  # Titles and transcript entries
+
+    first, first_data = save_meeting(tmp_path, "a.json", "Standup v2", ["new wording"], summary="Short")
+    index.add(first, first_data)
+
+    assert [r['title'] for r in index.search("old")] == ["Planning"]
+    assert [(r['title'], r['kind']) for r in index.search("new")] == [("Standup v2", 'transcript')]
+    assert text_rows(index) == 5
+    assert index.stats() == {'meetings': 2}
+
+
+def test_rebuild_drops_removed_meetings(tmp_path, index):
+    meetings = tmp_path / "meetings"
+    meetings.mkdir()
+    index.add(*save_meeting(meetings, "a.json", "Standup", ["kept"]))
+    index.add(*save_meeting(meetings, "b.json", "Planning", ["deleted"]))
+    os.remove(str(meetings / "b.json"))
+    (meetings / "notes.txt").write_text("deleted")
+
+    assert index.rebuild(str(meetings), workers=1) == (1, 2)
+    assert index.search("deleted") == []
+    assert [r['title'] for r in index.search("kept")] == ["Standup"]
+    assert index.stats() == {'meetings': 1}
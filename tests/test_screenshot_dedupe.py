@@ -0,0 +1,107 @@
+"""Duplicate and slide-change detection on slide-like screenshots"""
+
+import os
+import sys
+
+import pytest
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from meeting_summarizer import (  # noqa: E402
+    DUPLICATE_CHANGED_PIXELS, SLIDE_CHANGED_PIXELS, AssetStore, ScreenshotPipeline, changed_fraction,
+    hash_distance, image_fingerprint, make_thumbnail, perceptual_hash, similar_screenshot
+)
+
+BULLETS = [900, 700, 1200]
+
+
+def slide(bullets=BULLETS, clock="10:01", cursor=None):
+    """A 1080p slide on one template: title bar, bullet lines of the given widths and a taskbar clock"""
+    image = Image.new('RGB', (1920, 1080), (245, 245, 240))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([0, 0, 1920, 130], fill=(30, 60, 120))
+    draw.rectangle([60, 40, 900, 90], fill=(255, 255, 255))
+    for n, width in enumerate(bullets):
+        top = 200 + n * 70
+        draw.ellipse([80, top + 4, 96, top + 20], fill=(30, 60, 120))
+        draw.rectangle([120, top, 120 + width, top + 24], fill=(50, 50, 50))
+    draw.rectangle([0, 1040, 1920, 1080], fill=(20, 20, 20))
+    draw.text((1840, 1050), clock, fill=(255, 255, 255))
+    if cursor:
+        x, y = cursor
+        draw.polygon([(x, y), (x, y + 19), (x + 12, y + 12)], fill=(0, 0, 0))
+    return image
+
+
+def changed(first, second):
+    return changed_fraction(image_fingerprint(make_thumbnail(first)), image_fingerprint(make_thumbnail(second)))
+
+
+@pytest.mark.parametrize("other", [
+    slide(), slide(cursor=(1000, 500)), slide(clock="10:02"),
+], ids=["identical", "cursor", "clock"])
+def test_duplicates(other):
+    assert changed(slide(), other) <= DUPLICATE_CHANGED_PIXELS
+
+
+@pytest.mark.parametrize("other", [
+    slide(BULLETS + [800]), slide(BULLETS + [200]), slide([500, 1300, 600, 1000, 400]),
+], ids=["added-bullet", "short-bullet", "next-slide"])
+def test_slide_changes(other):
+    assert changed(slide(), other) > SLIDE_CHANGED_PIXELS
+
+
+def test_edited_word_is_not_a_duplicate():
+    # Below the slide-change threshold, but a manual screenshot of it is kept
+    assert DUPLICATE_CHANGED_PIXELS < changed(slide(), slide([900, 760, 1200])) <= SLIDE_CHANGED_PIXELS
+
+
+def test_hash_is_close_for_changes_within_a_deck():
+    # The hash cannot tell an added bullet from a duplicate, it only shortlists candidates
+    assert hash_distance(perceptual_hash(slide()), perceptual_hash(slide(BULLETS + [800]))) <= 16
+    assert len(perceptual_hash(slide())) == 64
+
+
+def test_hash_of_another_size_never_matches():
+    assert hash_distance("0" * 16, perceptual_hash(slide())) == 256
+
+
+def store_all(tmp_path, images, threshold, screenshots=None):
+    """Run images through the pipeline one at a time, deduplicating like the app does"""
+    pipeline = ScreenshotPipeline()
+    screenshots = [] if screenshots is None else screenshots
+    for n, image in enumerate(images):
+        entry = {'filename': f"screenshot_{n}.png"}
+        pipeline.submit(
+            image, entry, AssetStore(str(tmp_path)),
+            find_duplicate=lambda phash, fingerprint: similar_screenshot(
+                screenshots, phash, fingerprint, threshold, str(tmp_path)
+            )
+        ).result()
+        screenshots.append(entry)
+    pipeline.executor.shutdown()
+    return screenshots
+
+
+def test_pipeline_stores_updated_slide(tmp_path):
+    screenshots = store_all(tmp_path, [
+        slide(), slide(cursor=(300, 300)), slide(BULLETS + [800]), slide([500, 1300, 600, 1000, 400]),
+    ], DUPLICATE_CHANGED_PIXELS)
+
+    assert screenshots[1]['duplicate_of'] == "screenshot_0.png"
+    assert screenshots[1]['ref'] == screenshots[0]['ref']
+    assert len({entry['ref'] for entry in screenshots}) == 3
+    assert not any('duplicate_of' in entry for entry in screenshots[2:])
+
+
+def test_pipeline_compares_against_unreadable_screenshot(tmp_path):
+    screenshots = store_all(tmp_path, [slide()], DUPLICATE_CHANGED_PIXELS)
+    store = AssetStore(str(tmp_path))
+    os.remove(store.path(screenshots[0]['thumbnail']))
+    os.remove(store.path(screenshots[0]['ref']))
+
+    store_all(tmp_path, [slide()], DUPLICATE_CHANGED_PIXELS, screenshots)
+
+    assert 'duplicate_of' not in screenshots[1] and 'error' not in screenshots[1]
+    assert store.contains(screenshots[1]['ref'])
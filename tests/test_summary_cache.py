@@ -0,0 +1,139 @@
+"""Summary cache keys, LRU eviction and cached completions"""
+
+import itertools
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import meeting_summarizer  # noqa: E402
+from meeting_summarizer import SummaryCache, SummaryClient  # noqa: E402
+
+MESSAGES = [
+    {'role': 'system', 'content': "Summarize the meeting."},
+    {'role': 'user', 'content': "[10:00:00] We ship on Friday"},
+]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Strictly increasing time.time(), so least recently used is well defined"""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(meeting_summarizer.time, 'time', lambda: float(next(ticks)))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SummaryCache(str(tmp_path / "cache.sqlite"))
+    yield cache
+    cache.connection.close()
+
+
+def test_key_covers_whole_request():
+    key = SummaryCache.make_key("gpt-3.5-turbo", MESSAGES, 500)
+    edited = [MESSAGES[0], {'role': 'user', 'content': "[10:00:00] We ship on Monday"}]
+    prompt = [{'role': 'system', 'content': "Summarize briefly."}, MESSAGES[1]]
+
+    assert key == SummaryCache.make_key("gpt-3.5-turbo", [dict(m) for m in MESSAGES], 500)
+    assert len({
+        key,
+        SummaryCache.make_key("gpt-4", MESSAGES, 500),
+        SummaryCache.make_key("gpt-3.5-turbo", MESSAGES, 300),
+        SummaryCache.make_key("gpt-3.5-turbo", edited, 500),
+        SummaryCache.make_key("gpt-3.5-turbo", prompt, 500),
+        SummaryCache.make_key("gpt-3.5-turbo", MESSAGES[1:], 500),
+    }) == 6
+
+
+def test_key_ignores_dict_order():
+    reordered = [{'content': m['content'], 'role': m['role']} for m in MESSAGES]
+
+    assert SummaryCache.make_key("m", MESSAGES, 1) == SummaryCache.make_key("m", reordered, 1)
+
+
+def test_get_and_put(cache):
+    assert cache.get("a") is None
+    cache.put("a", "Résumé")
+
+    assert cache.get("a") == "Résumé"
+    # Sizes are counted in UTF-8 bytes, not characters
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'evictions': 0, 'entries': 1, 'bytes': 8}
+
+
+def test_evicts_least_recently_used(tmp_path, clock):
+    cache = SummaryCache(str(tmp_path / "cache.sqlite"), max_bytes=25)
+    cache.put("a", "a" * 10)
+    cache.put("b", "b" * 10)
+    cache.get("a")  # Now b is the least recently used
+
+    cache.put("c", "c" * 10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a" * 10 and cache.get("c") == "c" * 10
+    assert cache.stats()['evictions'] == 1 and cache.stats()['bytes'] == 20
+
+
+def test_replacing_entry_counts_its_size_once(tmp_path, clock):
+    cache = SummaryCache(str(tmp_path / "cache.sqlite"), max_bytes=25)
+    cache.put("a", "a" * 10)
+    cache.put("b", "b" * 10)
+
+    cache.put("a", "A" * 12)
+
+    assert cache.stats() == {'hits': 0, 'misses': 0, 'evictions': 0, 'entries': 2, 'bytes': 22}
+
+
+def test_entry_over_limit_is_not_kept(tmp_path, clock):
+    cache = SummaryCache(str(tmp_path / "cache.sqlite"), max_bytes=25)
+    cache.put("a", "a" * 10)
+
+    cache.put("huge", "h" * 30)
+
+    assert cache.get("huge") is None
+    assert cache.stats()['entries'] == 0
+
+
+def test_survives_restart(tmp_path):
+    SummaryCache(str(tmp_path / "cache.sqlite")).put("a", "kept")
+
+    assert SummaryCache(str(tmp_path / "cache.sqlite")).get("a") == "kept"
+
+
+class FakeCompletions:
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = 0
+
+    def create(self, **request):
+        self.calls += 1
+        message = types.SimpleNamespace(content=self.reply)
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+def client_with(cache, reply):
+    client = SummaryClient("key", cache=cache)
+    completions = FakeCompletions(reply)
+    client.client = types.SimpleNamespace(api_key="key", chat=types.SimpleNamespace(completions=completions))
+    return client, completions
+
+
+def test_client_answers_repeat_from_cache(cache):
+    client, completions = client_with(cache, "We ship on Friday.")
+
+    assert client.chat_completion(MESSAGES, 500) == "We ship on Friday."
+    assert client.chat_completion(MESSAGES, 500) == "We ship on Friday."
+    assert completions.calls == 1
+
+    client.chat_completion(MESSAGES, 300)
+    assert completions.calls == 2
+
+
+def test_client_does_not_cache_empty_reply(cache):
+    client, completions = client_with(cache, None)
+
+    assert client.chat_completion(MESSAGES, 500) == ""
+    assert client.chat_completion(MESSAGES, 500) == ""
+    assert completions.calls == 2
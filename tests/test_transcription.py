@@ -0,0 +1,137 @@
+"""In-order release of transcription results, restarts of the worker pool and the Whisper engine"""
+
+import os
+import sys
+import threading
+import time
+import types
+
+import numpy as np
+import pytest
+import speech_recognition as sr
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import meeting_summarizer  # noqa: E402
+from meeting_summarizer import (  # noqa: E402
+    ChunkDescriptor, ChunkEncoder, TranscriptionWorkerPool, TranscriptSequencer, WhisperRecognizerBackend
+)
+
+
+def chunk(seq):
+    return ChunkDescriptor(seq, seq * 100, seq * 100 + 100, time.monotonic())
+
+
+def test_sequencer_releases_out_of_order_results_in_order():
+    released = []
+    sequencer = TranscriptSequencer(released.append)
+
+    for seq in [2, 4, 1]:
+        sequencer.complete(seq, f"result {seq}")
+    assert released == []
+    assert sequencer.waiting() == 3
+
+    sequencer.complete(0, "result 0")
+    assert released == ["result 0", "result 1", "result 2"]
+    assert sequencer.waiting() == 1
+
+    sequencer.complete(3, "result 3")
+    assert released == [f"result {seq}" for seq in range(5)]
+    assert sequencer.waiting() == 0
+
+
+def test_sequencer_reset_starts_over():
+    released = []
+    sequencer = TranscriptSequencer(released.append)
+    sequencer.complete(1, "stale")
+
+    sequencer.reset()
+    sequencer.complete(0, "fresh")
+
+    assert released == ["fresh"]
+    assert sequencer.waiting() == 0
+
+
+def test_pool_releases_in_order_with_uneven_latency():
+    released = []
+    pool = TranscriptionWorkerPool(lambda delay: time.sleep(delay) or delay, lambda c, result: released.append(c.seq))
+    workers = pool.start()
+    for seq, delay in enumerate([0.05, 0.0, 0.02, 0.0]):
+        pool.submit(chunk(seq), delay)
+    pool.submit(chunk(4), None)  # Lost chunk, still keeps its place
+    pool.shutdown(workers)
+
+    assert released == [0, 1, 2, 3, 4]
+    assert pool.stats()['in_flight'] == 0
+
+
+def test_restart_drains_previous_recording():
+    released = []
+    unblock = threading.Event()
+
+    def recognize(audio):
+        if audio == "old":
+            unblock.wait(5)
+        return audio
+
+    pool = TranscriptionWorkerPool(recognize, lambda c, result: released.append(result))
+    old_workers = pool.start()
+    pool.submit(chunk(0), "old")
+    threading.Timer(0.05, unblock.set).start()
+
+    new_workers = pool.start()  # Waits for the old chunk
+    pool.shutdown(old_workers)  # The old transcriber finishing late leaves the new workers alone
+    pool.submit(chunk(0), "new")
+    pool.shutdown(new_workers)
+
+    assert released == ["old", "new"]
+    stats = pool.stats()
+    assert stats['in_flight'] == 0 and stats['completed'] == 1
+
+
+class FakeWhisperModel:
+    def __init__(self):
+        self.inputs = []
+
+    def transcribe(self, audio, language, fp16):
+        self.inputs.append(audio)
+        return {'text': " hello " if np.abs(audio).max() > 0.1 else ""}
+
+
+def fake_whisper(monkeypatch, load_model):
+    monkeypatch.setattr(meeting_summarizer, 'whisper', types.SimpleNamespace(load_model=load_model))
+
+
+def test_whisper_loads_model_once(monkeypatch):
+    models = []
+    fake_whisper(monkeypatch, lambda name: models.append(FakeWhisperModel()) or models[-1])
+    backend = WhisperRecognizerBackend()
+    encoder = ChunkEncoder(48000, backend.sample_rate)
+    tone = 0.5 * np.sin(np.linspace(0, 2000, 48000)).astype(np.float32)
+
+    results = [backend.recognize(encoder.encode(samples)) for samples in (tone, tone, np.zeros(48000, np.float32))]
+
+    assert len(models) == 1
+    assert [result.text for result in results] == ["hello", "hello", None]
+    audio = models[0].inputs[0]
+    assert audio.dtype == np.float32 and len(audio) == 16000
+    assert 0.4 < np.abs(audio).max() <= 1.0
+
+
+def test_whisper_load_failure_is_kept(monkeypatch):
+    attempts = []
+
+    def load_model(name):
+        attempts.append(name)
+        raise RuntimeError("no network to download the model")
+
+    fake_whisper(monkeypatch, load_model)
+    backend = WhisperRecognizerBackend()
+    audio = ChunkEncoder(16000, 16000).encode(np.zeros(1600, np.float32))
+
+    for _ in range(3):
+        with pytest.raises(sr.RequestError):
+            backend.recognize(audio)
+
+    assert attempts == ["base"]
+    assert "no network" in backend.load_error
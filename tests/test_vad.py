@@ -0,0 +1,121 @@
+"""Voice activity segmentation: where segments are cut and how much silence is skipped"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from meeting_summarizer import AudioRingBuffer, FixedSegmenter, VoiceActivitySegmenter  # noqa: E402
+
+RATE = 16000
+FRAME = 0.03  # The segmenter's default frame length, in seconds
+
+
+def audio(speech, seconds, noise=0.001, seed=0):
+    """Background noise with a 200 Hz tone during each ``(start, stop)`` of ``speech``, in seconds"""
+    samples = np.random.default_rng(seed).standard_normal(int(seconds * RATE)).astype(np.float32) * noise
+    t = np.arange(len(samples)) / RATE
+    for start, stop in speech:
+        during = (t >= start) & (t < stop)
+        samples[during] += (0.2 * np.sin(2 * np.pi * 200 * t[during])).astype(np.float32)
+    return samples
+
+
+def segment(samples, segmenter, block=RATE // 10):
+    """Feed samples through a capture buffer like the sound card does; segments in seconds"""
+    buffer = AudioRingBuffer(RATE * 60)
+    found = []
+    for offset in range(0, len(samples), block):
+        buffer.write(samples[offset:offset + block])
+        found += segmenter.segments(buffer)
+    found += segmenter.flush(buffer)
+    return [(start / RATE, stop / RATE) for start, stop in found]
+
+
+def test_cuts_at_pauses_with_pre_roll_and_hangover():
+    segmenter = VoiceActivitySegmenter(RATE)
+    found = segment(audio([(1, 3), (7, 9.5)], 12), segmenter)
+
+    assert len(found) == 2
+    for (start, stop), (speech_start, speech_stop) in zip(found, [(1, 3), (7, 9.5)]):
+        assert start == pytest.approx(speech_start - 0.2, abs=FRAME)
+        assert stop == pytest.approx(speech_stop + 0.5, abs=FRAME)
+
+
+def test_short_blip_is_dropped():
+    found = segment(audio([(1, 3), (5, 5.2)], 8), VoiceActivitySegmenter(RATE))
+
+    assert len(found) == 1
+    assert found[0][1] < 5
+
+
+def test_long_speech_is_split_at_max_segment():
+    found = segment(audio([(1, 34)], 36), VoiceActivitySegmenter(RATE, max_segment=15.0))
+
+    assert len(found) == 3
+    assert all(stop - start <= 15.0 + FRAME for start, stop in found)  # Cut at a frame boundary
+    # The pieces follow on from each other without gaps or overlap
+    assert found[0][1] == found[1][0] and found[1][1] == found[2][0]
+
+
+def test_block_size_does_not_change_segments():
+    samples = audio([(1, 3), (5, 5.2), (7, 9.5)], 12)
+
+    assert segment(samples, VoiceActivitySegmenter(RATE), block=RATE // 100) == \
+        segment(samples, VoiceActivitySegmenter(RATE), block=len(samples))
+
+
+def test_open_segment_is_flushed_at_end():
+    found = segment(audio([(1, 3)], 3), VoiceActivitySegmenter(RATE))
+
+    assert len(found) == 1
+    assert found[0][1] == pytest.approx(3, abs=FRAME)
+
+
+def test_follows_louder_background():
+    found = segment(audio([(3, 5)], 8, noise=0.02), VoiceActivitySegmenter(RATE))
+
+    assert len(found) == 1
+    assert found[0][0] == pytest.approx(2.8, abs=FRAME)
+
+
+def test_skipped_fraction():
+    segmenter = VoiceActivitySegmenter(RATE)
+    found = segment(audio([(1, 3), (7, 9.5)], 12), segmenter)
+    stats = segmenter.stats()
+
+    kept = sum(stop - start for start, stop in found)
+    assert stats['analyzed_seconds'] == pytest.approx(12)
+    assert stats['speech_seconds'] == pytest.approx(kept)
+    assert stats['skipped_fraction'] == pytest.approx(1 - kept / 12)
+
+
+def test_silence_is_skipped_entirely():
+    segmenter = VoiceActivitySegmenter(RATE)
+
+    assert segment(audio([], 10), segmenter) == []
+    assert segmenter.stats()['skipped_fraction'] == 1.0
+
+
+def test_reset_clears_counters():
+    segmenter = VoiceActivitySegmenter(RATE)
+    segment(audio([(1, 3)], 5), segmenter)
+
+    segmenter.reset()
+
+    assert segmenter.stats() == {'analyzed_seconds': 0.0, 'speech_seconds': 0.0, 'skipped_fraction': 0.0}
+
+
+def test_fixed_segmenter_keeps_long_enough_tail():
+    buffer = AudioRingBuffer(RATE * 60)
+    segmenter = FixedSegmenter(RATE, min_tail_samples=RATE // 2)
+    buffer.write(np.zeros(int(RATE * 2.7), dtype=np.float32))
+
+    assert segmenter.segments(buffer) == [(0, RATE), (RATE, 2 * RATE)]
+    assert segmenter.flush(buffer) == [(2 * RATE, int(RATE * 2.7))]
+
+    buffer.write(np.zeros(RATE // 4, dtype=np.float32))
+    assert segmenter.flush(buffer) == []